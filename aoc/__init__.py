@@ -0,0 +1,3 @@
+from .runner import SolverResult, find_days, run_solver, run_solvers
+
+__all__ = ['SolverResult', 'find_days', 'run_solver', 'run_solvers']
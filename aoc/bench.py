@@ -0,0 +1,244 @@
+import argparse
+import importlib.util
+import json
+import statistics
+import sys
+from collections import namedtuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import cache, instrument
+from .runner import PARTS, find_days, run_solvers_concurrently
+
+BASELINE_VERSION = 1
+
+BenchResult = namedtuple('BenchResult', ['day', 'part', 'scale', 'seed', 'answer', 'median_time', 'times', 'peak_rss', 'hot_paths'])
+
+def bench_key(result: BenchResult) -> str:
+    """
+    Returns the key identifying a benchmark in a baseline file.
+
+    Args:
+        result (BenchResult): The benchmark result.
+
+    Returns:
+        str: E.g. 'day06.part2' for the shipped input or 'day06.part2@scale=500,seed=0' for a generated one.
+    """
+    key = f'day{result.day:02d}.part{result.part}'
+    return key if result.scale is None else f'{key}@scale={result.scale},seed={result.seed}'
+
+def run_benchmarks(selection: Sequence[Tuple[int, int]], scales: Sequence[Optional[int]] = (None,), seed: int = 0, repeats: int = 3) -> List[BenchResult]:
+    """
+    Times every selected solver on each input, `repeats` times.
+
+    Every run happens in a fresh worker process, one at a time, so runs neither share warm
+    module state nor compete for cores, and the peak RSS of each run is its own.
+
+    Args:
+        selection (Sequence[Tuple[int, int]]): The (day, part) pairs to benchmark.
+        scales (Sequence[Optional[int]], optional): The inputs to use: None for the shipped input.txt,
+            an integer for a generated input of that scale. Defaults to the shipped input only.
+        seed (int, optional): The random seed of the generated inputs. Defaults to 0.
+        repeats (int, optional): The number of runs per solver and input. Defaults to 3.
+
+    Returns:
+        List[BenchResult]: One result per solver and input, with the median wall time and the largest peak RSS.
+            With instrumentation on, hot_paths holds the hot function statistics of the median run.
+    """
+    from . import generators
+
+    results = []
+    days = sorted({day for day, _ in selection})
+    for scale in scales:
+        file_path = None if scale is None else {day: generators.generated_input(day, scale, seed) for day in days}
+        runs = run_solvers_concurrently([task for task in selection for _ in range(repeats)], file_path, workers=1)
+        for i, (day, part) in enumerate(selection):
+            group = sorted(runs[i * repeats:(i + 1) * repeats], key=lambda run: run.wall_time)
+            median = group[len(group) // 2]
+            results.append(BenchResult(day, part, scale, seed, str(median.answer), statistics.median(run.wall_time for run in group),
+                                       [run.wall_time for run in group], max(run.peak_rss for run in group), median.hot_paths))
+    return results
+
+def save_baseline(path: str, results: Sequence[BenchResult]):
+    """
+    Writes benchmark results to a JSON baseline file.
+
+    Args:
+        path (str): The file to write.
+        results (Sequence[BenchResult]): The results to store.
+    """
+    entries = {bench_key(r): {'answer': r.answer, 'median_time': r.median_time, 'peak_rss': r.peak_rss} for r in results}
+    for r in results:
+        if r.hot_paths:
+            entries[bench_key(r)]['calls'] = {e.function: e.calls for e in r.hot_paths}
+    with open(path, 'w') as f:
+        json.dump({'version': BASELINE_VERSION, 'python': sys.version.split()[0], 'results': entries}, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    """
+    Reads a JSON baseline file written by save_baseline.
+
+    Args:
+        path (str): The file to read.
+
+    Returns:
+        Dict[str, dict]: The stored answer, median time and peak RSS per benchmark key.
+
+    Raises:
+        ValueError: If the file was written by an incompatible version.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f'Unsupported baseline version in {path}: {data.get("version")}')
+    return data['results']
+
+def find_regressions(results: Sequence[BenchResult], baseline: Dict[str, dict], max_time_regression: float = 0.25,
+                     max_memory_regression: float = 0.25, min_time_delta: float = 0.05) -> List[str]:
+    """
+    Compares benchmark results against a baseline.
+
+    A solver regresses when its answer changed, when its median time grew by more than
+    `max_time_regression` (and by more than `min_time_delta` seconds, so that millisecond
+    solvers do not fail on noise), or when its peak RSS grew by more than `max_memory_regression`.
+    Benchmarks missing from the baseline are not compared.
+
+    Args:
+        results (Sequence[BenchResult]): The new results.
+        baseline (Dict[str, dict]): The baseline, as returned by load_baseline.
+        max_time_regression (float, optional): The allowed relative growth of the median time. Defaults to 0.25.
+        max_memory_regression (float, optional): The allowed relative growth of the peak RSS. Defaults to 0.25.
+        min_time_delta (float, optional): Time growth in seconds that is never a regression. Defaults to 0.05.
+
+    Returns:
+        List[str]: A description of every regression, empty if there are none.
+    """
+    regressions = []
+    for r in results:
+        key = bench_key(r)
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if r.answer != base['answer']:
+            regressions.append(f"{key}: answer changed from {base['answer']} to {r.answer}")
+        if r.median_time > base['median_time'] * (1 + max_time_regression) and r.median_time - base['median_time'] > min_time_delta:
+            regressions.append(f"{key}: median time {base['median_time']:.3f} s -> {r.median_time:.3f} s")
+        if base['peak_rss'] and r.peak_rss > base['peak_rss'] * (1 + max_memory_regression):
+            regressions.append(f"{key}: peak RSS {base['peak_rss'] / 2 ** 20:.1f} MB -> {r.peak_rss / 2 ** 20:.1f} MB")
+    return regressions
+
+def format_table(results: Sequence[BenchResult], baseline: Optional[Dict[str, dict]] = None) -> str:
+    """
+    Formats benchmark results as a plain-text table.
+
+    Args:
+        results (Sequence[BenchResult]): The results to format.
+        baseline (Optional[Dict[str, dict]], optional): A baseline to show the time change against.
+
+    Returns:
+        str: The table, one benchmark per line.
+    """
+    lines = [f"{'benchmark':<36} {'median (s)':>10} {'min (s)':>10} {'peak RSS (MB)':>14} {'vs base':>8}  answer"]
+    for r in results:
+        base = (baseline or {}).get(bench_key(r))
+        change = f"{r.median_time / base['median_time'] - 1:+.0%}" if base and base['median_time'] else ''
+        lines.append(f"{bench_key(r):<36} {r.median_time:>10.3f} {min(r.times):>10.3f} {r.peak_rss / 2 ** 20:>14.1f} {change:>8}  {r.answer}")
+    return '\n'.join(lines)
+
+def plot_scaling(results: Sequence[BenchResult], path: str):
+    """
+    Plots median time against input scale, one line per solver, on log-log axes.
+
+    Requires matplotlib, which is not needed for anything else.
+
+    Args:
+        results (Sequence[BenchResult]): Results of a sweep over several scales.
+        path (str): The image file to write.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    for day, part in sorted({(r.day, r.part) for r in results}):
+        points = sorted((r.scale, r.median_time) for r in results if (r.day, r.part) == (day, part) and r.scale is not None)
+        if points:
+            ax.plot(*zip(*points), marker='o', label=f'day {day:02d} part {part}')
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('input scale')
+    ax.set_ylabel('median wall time (s)')
+    ax.legend(fontsize='small')
+    fig.savefig(path, bbox_inches='tight')
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Parses the command line of the benchmark suite.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(prog='aoc.bench', description='Benchmark Advent of Code solvers against a stored baseline.')
+    parser.add_argument('days', nargs='*', type=int, help='days to benchmark (default: all)')
+    parser.add_argument('-p', '--part', type=int, choices=PARTS, action='append', help='part to benchmark, may be repeated (default: both)')
+    parser.add_argument('-s', '--scale', type=int, action='append', help='also benchmark a generated input of this scale, may be repeated to sweep sizes')
+    parser.add_argument('--synthetic-only', action='store_true', help='skip the shipped input.txt and only use generated inputs')
+    parser.add_argument('--seed', type=int, default=0, help='random seed of the generated inputs (default: 0)')
+    parser.add_argument('-r', '--repeats', type=int, default=3, help='runs per solver and input (default: 3)')
+    parser.add_argument('--save', metavar='FILE', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', help='fail if the results regress against this JSON baseline')
+    parser.add_argument('--max-time-regression', type=float, default=0.25, help='allowed relative growth of the median time (default: 0.25)')
+    parser.add_argument('--max-memory-regression', type=float, default=0.25, help='allowed relative growth of the peak RSS (default: 0.25)')
+    parser.add_argument('--min-time-delta', type=float, default=0.05, help='time growth in seconds that never counts as a regression (default: 0.05)')
+    parser.add_argument('--plot', metavar='FILE', help='plot median time against scale (requires matplotlib)')
+    parser.add_argument('--instrument', action='store_true', help='also record calls and time of the hot functions marked with @hot (slows the solvers down)')
+    parser.add_argument('--no-cache', action='store_true', help='parse inputs from scratch instead of using the parsed-input cache')
+    args = parser.parse_args(argv)
+    if args.synthetic_only and not args.scale:
+        parser.error('--synthetic-only requires at least one --scale')
+    if args.repeats < 1:
+        parser.error('--repeats must be at least 1')
+    if args.plot and importlib.util.find_spec('matplotlib') is None:
+        parser.error('--plot requires matplotlib')
+    return args
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of `python -m aoc.bench`.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status, 1 if any benchmark regressed against the baseline given with --compare.
+    """
+    args = parse_args(argv)
+    if args.no_cache:
+        cache.set_enabled(False)
+    if args.instrument:
+        instrument.set_enabled(True)
+    selection = [(day, part) for day in args.days or find_days() for part in args.part or PARTS]
+    scales = ([] if args.synthetic_only else [None]) + sorted(set(args.scale or []))
+    results = run_benchmarks(selection, scales, args.seed, args.repeats)
+    baseline = load_baseline(args.compare) if args.compare else None
+    print(format_table(results, baseline))
+    for r in results:
+        if r.hot_paths:
+            print(f'\n{bench_key(r)}')
+            print(instrument.format_report(r.hot_paths))
+    if args.save:
+        save_baseline(args.save, results)
+    if args.plot:
+        plot_scaling(results, args.plot)
+    if baseline is None:
+        return 0
+    regressions = find_regressions(results, baseline, args.max_time_regression, args.max_memory_regression, args.min_time_delta)
+    for regression in regressions:
+        print(f'REGRESSION {regression}', file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
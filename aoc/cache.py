@@ -0,0 +1,239 @@
+import functools
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Callable, List, Sequence, Tuple
+
+MAGIC = b'AOCC'
+HEADER = struct.Struct('<4sI')
+SECTION = struct.Struct('<cQ')
+
+_enabled = os.environ.get('AOC_CACHE', '1') != '0'
+_cache_dir = os.environ.get('AOC_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'aoc-2024')
+_max_bytes = int(os.environ.get('AOC_CACHE_MAX_BYTES') or 256 * 2 ** 20)
+
+Encoder = Callable[[Any], Sequence[array]]
+Decoder = Callable[[List[array]], Any]
+
+def set_enabled(enabled: bool):
+    """
+    Turns the parsed-input cache on or off for this process and its subprocesses.
+
+    Args:
+        enabled (bool): False to always call the parsers directly.
+    """
+    global _enabled
+    _enabled = enabled
+    os.environ['AOC_CACHE'] = '1' if enabled else '0'
+
+def cache_dir() -> str:
+    """
+    Returns the directory holding cached parser output.
+
+    Returns:
+        str: The cache directory, from AOC_CACHE_DIR or ~/.cache/aoc-2024.
+    """
+    return _cache_dir
+
+def write_arrays(path: str, arrays: Sequence[array]):
+    """
+    Writes typed arrays to a file in the cache's binary format.
+
+    The file is written under a temporary name and renamed, so readers never see a partial entry.
+
+    Args:
+        path (str): The file to write.
+        arrays (Sequence[array]): The arrays to store.
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(arrays)))
+        for values in arrays:
+            f.write(SECTION.pack(values.typecode.encode(), len(values)))
+            values.tofile(f)
+    os.replace(tmp_path, path)
+
+def read_arrays(path: str) -> List[array]:
+    """
+    Reads typed arrays written by write_arrays.
+
+    Args:
+        path (str): The file to read.
+
+    Returns:
+        List[array]: The stored arrays.
+
+    Raises:
+        ValueError: If the file is not a valid cache entry.
+    """
+    with open(path, 'rb') as f:
+        magic, count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f'Not a cache entry: {path}')
+        arrays = []
+        for _ in range(count):
+            typecode, length = SECTION.unpack(f.read(SECTION.size))
+            values = array(typecode.decode())
+            values.fromfile(f, length)
+            arrays.append(values)
+    return arrays
+
+def evict(max_bytes: int):
+    """
+    Deletes the least recently used cache entries until the cache fits in the size cap.
+
+    Args:
+        max_bytes (int): The maximum total size of the cache directory in bytes.
+    """
+    try:
+        entries = [entry for entry in os.scandir(_cache_dir) if entry.is_file()]
+    except FileNotFoundError:
+        return
+    stats = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in entries)
+    total = sum(size for _, size, _ in stats)
+    for _, size, path in stats:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+def parser_name(parse: Callable[[str], Any]) -> str:
+    """
+    Names a parser for its cache key, distinguishing parsers run as the main module.
+
+    A part run with `python -m dayNN.partN` has `__main__` as its module, so the name comes
+    from the module spec instead; a file run as a script is named by a digest of its path.
+
+    Args:
+        parse (Callable[[str], Any]): The parser.
+
+    Returns:
+        str: The module and qualified name of the parser.
+    """
+    module = parse.__module__
+    if module == '__main__':
+        spec = getattr(sys.modules.get(module), '__spec__', None)
+        if spec is not None:
+            module = spec.name
+        else:
+            module = hashlib.sha256(os.path.abspath(parse.__code__.co_filename).encode()).hexdigest()[:16]
+    return f'{module}.{parse.__qualname__}'
+
+def cached_parser(version: int, encode: Encoder, decode: Decoder):
+    """
+    Caches the output of a parser that takes a file path, keyed by the file's content.
+
+    The key is the SHA-256 of the input file together with the parser's qualified name and
+    `version`; bump the version whenever the parser's output changes. Entries are stored as
+    typed arrays, and a hit refreshes the entry's mtime so eviction removes the least recently
+    used entries first.
+
+    Args:
+        version (int): The version of the parser's output format.
+        encode (Encoder): Turns the parser's output into a sequence of typed arrays.
+        decode (Decoder): Rebuilds the parser's output from those arrays.
+
+    Returns:
+        Callable: A decorator for the parser.
+    """
+    def decorator(parse: Callable[[str], Any]) -> Callable[[str], Any]:
+        name = parser_name(parse)
+
+        @functools.wraps(parse)
+        def wrapper(file_path: str) -> Any:
+            if not _enabled:
+                return parse(file_path)
+            with open(file_path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            path = os.path.join(_cache_dir, f'{name}-v{version}-{digest}.bin')
+            try:
+                result = decode(read_arrays(path))
+                os.utime(path)
+                return result
+            except (OSError, ValueError, struct.error, EOFError):
+                pass
+            result = parse(file_path)
+            try:
+                os.makedirs(_cache_dir, exist_ok=True)
+                write_arrays(path, encode(result))
+                evict(_max_bytes)
+            except OSError:
+                pass
+            return result
+
+        wrapper.uncached = parse
+        return wrapper
+    return decorator
+
+def encode_int_records(records: Sequence[Tuple]) -> List[array]:
+    """
+    Encodes equally shaped, possibly nested, tuples of integers as one flat array.
+
+    Args:
+        records (Sequence[Tuple]): The records, e.g. [((1, 2), (3, 4)), ...].
+
+    Returns:
+        List[array]: The record shape and the flattened values.
+    """
+    def flatten(value):
+        if isinstance(value, tuple):
+            for item in value:
+                yield from flatten(item)
+        else:
+            yield value
+
+    def shape(value):
+        return [len(value), *shape(value[0])] if isinstance(value, tuple) else []
+
+    return [array('q', shape(records[0]) if records else []), array('q', (v for r in records for v in flatten(r)))]
+
+def decode_int_records(arrays: List[array]) -> List[Tuple]:
+    """
+    Decodes records written by encode_int_records.
+
+    Args:
+        arrays (List[array]): The record shape and the flattened values.
+
+    Returns:
+        List[Tuple]: The records.
+    """
+    shape, values = arrays
+    records: List[Any] = values.tolist()
+    for size in reversed(shape):
+        records = list(zip(*[iter(records)] * size))
+    return records
+
+def encode_int_lists(lists: Sequence[Sequence[int]]) -> List[array]:
+    """
+    Encodes a list of variable-length integer lists as lengths plus one flat array.
+
+    Args:
+        lists (Sequence[Sequence[int]]): The lists to encode.
+
+    Returns:
+        List[array]: The lengths and the concatenated values.
+    """
+    return [array('q', map(len, lists)), array('q', (v for values in lists for v in values))]
+
+def decode_int_lists(arrays: List[array]) -> List[List[int]]:
+    """
+    Decodes lists written by encode_int_lists.
+
+    Args:
+        arrays (List[array]): The lengths and the concatenated values.
+
+    Returns:
+        List[List[int]]: The lists.
+    """
+    lengths, values = arrays
+    values = values.tolist()
+    result, start = [], 0
+    for length in lengths:
+        result.append(values[start:start + length])
+        start += length
+    return result
@@ -0,0 +1,450 @@
+import argparse
+import os
+import random
+import tempfile
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+def generate_day01(scale: int, rng: random.Random) -> str:
+    """Generates `scale` lines of two location IDs."""
+    return ''.join(f'{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n' for _ in range(scale))
+
+def generate_day02(scale: int, rng: random.Random) -> str:
+    """Generates `scale` reports of 5 to 8 levels, most of them close to safe."""
+    lines = []
+    for _ in range(scale):
+        sign = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            # Mostly safe steps, with the occasional flat, reversed or too large step
+            step = rng.choice((1, 2, 3, 1, 2, 3, 1, 2, 3, 0, -1, 4, 5))
+            level = max(1, level + sign * step)
+            levels.append(level)
+        lines.append(' '.join(map(str, levels)))
+    return '\n'.join(lines) + '\n'
+
+def generate_day03(scale: int, rng: random.Random) -> str:
+    """Generates corrupted memory holding `scale` instructions between noise."""
+    noise = "abcdefghijklmnopqrstuvwxyz0123456789()[]{}<>,;:'!@#$%^&*-+=?/ \n"
+    chunks = []
+    for _ in range(scale):
+        chunks.append(''.join(rng.choices(noise, k=rng.randint(0, 8))))
+        kind = rng.random()
+        if kind < 0.7:
+            chunks.append(f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})')
+        elif kind < 0.8:
+            chunks.append('do()')
+        elif kind < 0.9:
+            chunks.append("don't()")
+        else:
+            chunks.append(rng.choice((f'mul[{rng.randint(1, 99)},{rng.randint(1, 99)}]', f'mul({rng.randint(1, 99)} ,', 'mul(', "don't", 'do(')))
+    return ''.join(chunks) + '\n'
+
+def generate_day04(scale: int, rng: random.Random) -> str:
+    """Generates a `scale` x `scale` letter grid."""
+    return ''.join(''.join(rng.choices('XMAS', k=scale)) + '\n' for _ in range(scale))
+
+def generate_day05(scale: int, rng: random.Random) -> str:
+    """Generates ordering rules for 49 pages and `scale` updates."""
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f'{a}|{b}' for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(scale):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        # About half of the updates are already in the right order
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(map(str, update)))
+    return '\n'.join(rules) + '\n\n' + '\n'.join(updates) + '\n'
+
+def _walk_guard(rows: List[bytearray], r: int, c: int) -> Optional[Tuple[int, int]]:
+    """Walks the guard until it leaves the map; returns the last obstacle hit if it loops instead."""
+    size = len(rows)
+    moves = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    direction = 0
+    seen = set()
+    last_hit = None
+    while (r, c, direction) not in seen:
+        seen.add((r, c, direction))
+        dr, dc = moves[direction]
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < size and 0 <= nc < size):
+            return None
+        if rows[nr][nc] == ord('#'):
+            last_hit = (nr, nc)
+            direction = (direction + 1) % 4
+        else:
+            r, c = nr, nc
+    return last_hit
+
+def _lay_guard_route(scale: int, rng: random.Random) -> Tuple[List[bytearray], List[bytearray], int, int, bool]:
+    """
+    Lays out a guard route one straight leg at a time, placing an obstacle where each leg turns right.
+
+    Returns the map, the directions the guard faced on every cell as bit masks, the start position
+    and whether the route leaves the map (False if it boxed itself in).
+    """
+    moves = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    rows = [bytearray(b'.' * scale) for _ in range(scale)]
+    seen = [bytearray(scale) for _ in range(scale)]
+    r = start_r = rng.randrange(scale // 4, 3 * scale // 4 + 1)
+    c = start_c = rng.randrange(scale // 4, 3 * scale // 4 + 1)
+    direction, visited, target = 0, 1, scale * scale // 3
+    seen[r][c] = 1
+    while True:
+        dr, dc = moves[direction]
+        run, nr, nc = 0, r + dr, c + dc
+        while 0 <= nr < scale and 0 <= nc < scale and rows[nr][nc] != ord('#') and not seen[nr][nc] >> direction & 1:
+            run, nr, nc = run + 1, nr + dr, nc + dc
+        leaves = not (0 <= nr < scale and 0 <= nc < scale)
+        for _ in range(100 if not (leaves and visited >= target) else 0):
+            # Walk `length` cells, then turn at an existing obstacle or at a new one on an unvisited cell
+            length = rng.randint(0, run)
+            tr, tc = r + dr * length, c + dc * length
+            br, bc = tr + dr, tc + dc
+            if length == run and not (0 <= br < scale and 0 <= bc < scale and rows[br][bc] == ord('#')):
+                continue
+            if length < run and seen[br][bc]:
+                continue
+            if seen[tr][tc] >> (direction + 1) % 4 & 1:
+                continue
+            break
+        else:
+            if not leaves:
+                return rows, seen, start_r, start_c, False
+            length = run
+        for _ in range(length):
+            r, c = r + dr, c + dc
+            visited += not seen[r][c]
+            seen[r][c] |= 1 << direction
+        if leaves and length == run:
+            return rows, seen, start_r, start_c, True
+        rows[r + dr][c + dc] = ord('#')
+        direction = (direction + 1) % 4
+        seen[r][c] |= 1 << direction
+
+def generate_day06(scale: int, rng: random.Random) -> str:
+    """Generates a `scale` x `scale` guard map where the guard walks a long way before leaving the map."""
+    for _ in range(20):
+        rows, seen, r, c, leaves = _lay_guard_route(scale, rng)
+        if leaves:
+            break
+    # Scatter more obstacles off the route, where the guard never runs into them
+    for row, seen_row in zip(rows, seen):
+        for col in range(scale):
+            if not seen_row[col] and rng.random() < 0.03:
+                row[col] = ord('#')
+    if not leaves:
+        # Every route boxed itself in; clear obstacles from the loop until the guard leaves the map
+        while (hit := _walk_guard(rows, r, c)) is not None:
+            rows[hit[0]][hit[1]] = ord('.')
+    rows[r][c] = ord('^')
+    return ''.join(row.decode() + '\n' for row in rows)
+
+def generate_day07(scale: int, rng: random.Random) -> str:
+    """Generates `scale` calibration equations, about half of them solvable."""
+    lines = []
+    for _ in range(scale):
+        nums = [rng.randint(1, 99) if rng.random() < 0.8 else rng.randint(100, 999) for _ in range(rng.randint(2, 12))]
+        target = nums[0]
+        for num in nums[1:]:
+            op = rng.choice('+*|')
+            target = target + num if op == '+' else target * num if op == '*' else int(f'{target}{num}')
+        if rng.random() < 0.5:
+            target += rng.randint(1, 9)
+        lines.append(f"{target}: {' '.join(map(str, nums))}")
+    return '\n'.join(lines) + '\n'
+
+def generate_day08(scale: int, rng: random.Random) -> str:
+    """Generates a `scale` x `scale` antenna map."""
+    frequencies = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+    rows = [['.'] * scale for _ in range(scale)]
+    for _ in range(max(1, scale * scale // 12)):
+        rows[rng.randrange(scale)][rng.randrange(scale)] = rng.choice(frequencies)
+    return ''.join(''.join(row) + '\n' for row in rows)
+
+def generate_day09(scale: int, rng: random.Random) -> str:
+    """Generates a disk map of `scale` digits (rounded up to an odd count so it ends with a file)."""
+    files = rng.choices('123456789', k=scale // 2 + 1)
+    gaps = rng.choices('0123456789', k=scale // 2)
+    digits = [''] * (2 * len(files) - 1)
+    digits[::2], digits[1::2] = files, gaps
+    return ''.join(digits) + '\n'
+
+def generate_day10(scale: int, rng: random.Random) -> str:
+    """Generates a `scale` x `scale` topographic map where neighboring heights mostly differ by one."""
+    rows = []
+    previous = [rng.randint(0, 9) for _ in range(scale)]
+    for _ in range(scale):
+        row = [(previous[0] + rng.choice((-1, 1))) % 10]
+        for c in range(1, scale):
+            base = row[-1] if rng.random() < 0.5 else previous[c]
+            row.append((base + rng.choice((-1, 1, 1))) % 10)
+        rows.append(''.join(map(str, row)))
+        previous = row
+    return '\n'.join(rows) + '\n'
+
+def generate_day11(scale: int, rng: random.Random) -> str:
+    """Generates `scale` stones."""
+    return ' '.join(str(rng.choice((0, rng.randint(1, 9), rng.randint(10, 9999999)))) for _ in range(scale)) + '\n'
+
+def generate_day12(scale: int, rng: random.Random) -> str:
+    """Generates a `scale` x `scale` garden of irregular plant regions."""
+    block = 6
+    blocks = [[rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(scale // block + 3)] for _ in range(scale // block + 3)]
+    lines = []
+    for r in range(scale):
+        # Jitter every cell by up to one block so region borders are ragged
+        lines.append(''.join(blocks[(r + rng.randint(0, block)) // block][(c + rng.randint(0, block)) // block] for c in range(scale)))
+    return '\n'.join(lines) + '\n'
+
+def generate_day13(scale: int, rng: random.Random) -> str:
+    """Generates `scale` claw machines, about half of them winnable, none needing negative presses in part 2."""
+    machines = []
+    for _ in range(scale):
+        while True:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+            det = ax * by - ay * bx
+            if not det:
+                continue
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+            if rng.random() < 0.5:
+                px, py = px + rng.randint(1, 50), py + rng.randint(1, 50)
+            # Part 2 moves the prize by 10**13 on both axes; like the real input, reaching it must
+            # not take a negative number of presses of either button
+            qx, qy = px + 10 ** 13, py + 10 ** 13
+            if (qx * by - qy * bx) * det >= 0 and (ax * qy - ay * qx) * det >= 0:
+                break
+        machines.append(f'Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n')
+    return '\n'.join(machines)
+
+def generate_day14(scale: int, rng: random.Random, width: int = 101, length: int = 103) -> str:
+    """Generates `scale` robots that all stand on distinct tiles at some step below 10000."""
+    step = rng.randrange(1, 10000)
+    cells = width * length
+    finals = rng.sample(range(cells), scale) if scale <= cells else [rng.randrange(cells) for _ in range(scale)]
+    lines = []
+    for final in finals:
+        fy, fx = divmod(final, width)
+        vx, vy = rng.randint(-99, 99), rng.randint(-99, 99)
+        lines.append(f'p={(fx - vx * step) % width},{(fy - vy * step) % length} v={vx},{vy}')
+    return '\n'.join(lines) + '\n'
+
+def generate_day15(scale: int, rng: random.Random) -> str:
+    """Generates a `scale` x `scale` warehouse and 8 * scale**2 robot moves."""
+    rows = [['#'] * scale]
+    for _ in range(scale - 2):
+        rows.append(['#'] + [rng.choices('.O#', weights=(60, 30, 10))[0] for _ in range(scale - 2)] + ['#'])
+    rows.append(['#'] * scale)
+    rows[scale // 2][scale // 2] = '@'
+    moves = ''.join(rng.choices('<>^v', k=8 * scale * scale))
+    return ''.join(''.join(row) + '\n' for row in rows) + '\n' + '\n'.join(moves[i:i + 1000] for i in range(0, len(moves), 1000)) + '\n'
+
+def _maze_cells(size: int, rng: random.Random, extra_openings: float) -> List[bytearray]:
+    """Carves a maze on the odd cells of a `size` x `size` grid with a randomized depth-first search."""
+    rows = [bytearray(b'#' * size) for _ in range(size)]
+    start = (size - 2, 1)
+    rows[start[0]][start[1]] = ord('.')
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc, dr // 2, dc // 2) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 < r + dr < size - 1 and 0 < c + dc < size - 1 and rows[r + dr][c + dc] == ord('#')]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc, hr, hc = rng.choice(options)
+        rows[r + hr][c + hc] = rows[nr][nc] = ord('.')
+        stack.append((nr, nc))
+    # Knock out some inner walls so there is more than one route
+    for r in range(1, size - 1):
+        for c in range(1, size - 1):
+            if rows[r][c] == ord('#') and (r + c) % 2 == 1 and rng.random() < extra_openings:
+                rows[r][c] = ord('.')
+    return rows
+
+def generate_day16(scale: int, rng: random.Random) -> str:
+    """Generates a `scale` x `scale` reindeer maze (rounded up to odd) with several routes from S to E."""
+    size = scale | 1
+    rows = _maze_cells(size, rng, 0.08)
+    rows[size - 2][1] = ord('S')
+    rows[1][size - 2] = ord('E')
+    return ''.join(row.decode() + '\n' for row in rows)
+
+def generate_day17(scale: int, rng: random.Random) -> str:
+    """Generates a shift-by-three program whose initial register A makes it print `scale` values, and that
+    some other value of A makes print itself."""
+    from day17.part2 import expect
+    a = rng.getrandbits(3 * scale) | (1 << (3 * scale - 3))
+    # Like the real input, part 2 must have an answer; only a few constants make the program a quine
+    while True:
+        x, y, z = rng.randrange(8), rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, x, 7, 5, 1, y, 4, z, 0, 3, 5, 5, 3, 0]
+        if expect(program, program.copy()) is not None:
+            break
+    return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: {','.join(map(str, program))}\n"
+
+def generate_day18(scale: int, rng: random.Random) -> str:
+    """Generates falling bytes for a `scale` x `scale` memory space, covering 70% of it, that leave the exit
+    reachable after the part 1 byte count."""
+    from day18.part1 import default_num_bytes
+    # A random staircase from the start to the exit; its cells fall last, so a path survives until then
+    steps = [(1, 0)] * (scale - 1) + [(0, 1)] * (scale - 1)
+    rng.shuffle(steps)
+    path, (x, y) = [], (0, 0)
+    for dx, dy in steps[:-1]:
+        x, y = x + dx, y + dy
+        path.append((x, y))
+    protected = set(path) | {(0, 0), (scale - 1, scale - 1)}
+    cells = [(x, y) for y in range(scale) for x in range(scale) if (x, y) not in protected]
+    rng.shuffle(cells)
+    rng.shuffle(path)
+    count = min(max(scale * scale * 7 // 10 - len(path), default_num_bytes(scale)), len(cells))
+    return ''.join(f'{x},{y}\n' for x, y in cells[:count] + path)
+
+def generate_day19(scale: int, rng: random.Random) -> str:
+    """Generates about 450 towel patterns and `scale` designs, about 70% of them possible."""
+    colors = 'wubrg'
+    missing = rng.choice(colors)
+    # Like the real input, no towel ends with one of the colors, so designs ending with it are impossible
+    patterns = {rng.choice(colors) + ''.join(rng.choices(colors, k=rng.randint(0, 7))) for _ in range(600)}
+    patterns = sorted(p for p in patterns if not p.endswith(missing))[:450]
+    designs = []
+    for _ in range(scale):
+        length = rng.randint(20, 60)
+        design = ''
+        while len(design) < length:
+            design += rng.choice(patterns)
+        if rng.random() < 0.3:
+            design += missing
+        designs.append(design)
+    return ', '.join(patterns) + '\n\n' + '\n'.join(designs) + '\n'
+
+def generate_day20(scale: int, rng: random.Random) -> str:
+    """Generates a `scale` x `scale` racetrack (rounded up to odd) holding a single winding track."""
+    size = scale | 1
+    rows = [bytearray(b'#' * size) for _ in range(size)]
+    start = (size // 2 | 1, size // 2 | 1)
+    visited = {start}
+    stack = [start]
+    longest: List[Tuple[int, int]] = [start]
+    # The track is the deepest branch of a randomized depth-first search, so it never touches itself
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 < r + dr < size - 1 and 0 < c + dc < size - 1 and (r + dr, c + dc) not in visited]
+        if not options:
+            if len(stack) > len(longest):
+                longest = stack[:]
+            stack.pop()
+            continue
+        step = rng.choice(options)
+        visited.add(step)
+        stack.append(step)
+    for (r1, c1), (r2, c2) in zip(longest, longest[1:]):
+        rows[r1][c1] = rows[(r1 + r2) // 2][(c1 + c2) // 2] = rows[r2][c2] = ord('.')
+    rows[longest[0][0]][longest[0][1]] = ord('S')
+    rows[longest[-1][0]][longest[-1][1]] = ord('E')
+    return ''.join(row.decode() + '\n' for row in rows)
+
+def generate_day21(scale: int, rng: random.Random) -> str:
+    """Generates `scale` door codes."""
+    return ''.join(f'{rng.randint(0, 999):03d}A\n' for _ in range(scale))
+
+# Bump whenever a generator's output changes, so cached generated inputs are not reused
+GENERATOR_VERSION = 3
+
+# Generator and default scale (close to the size of the real puzzle input) for every day
+GENERATORS: Dict[int, Tuple[Callable[[int, random.Random], str], int]] = {
+    1: (generate_day01, 1000),
+    2: (generate_day02, 1000),
+    3: (generate_day03, 700),
+    4: (generate_day04, 140),
+    5: (generate_day05, 200),
+    6: (generate_day06, 130),
+    7: (generate_day07, 850),
+    8: (generate_day08, 50),
+    9: (generate_day09, 20000),
+    10: (generate_day10, 40),
+    11: (generate_day11, 8),
+    12: (generate_day12, 140),
+    13: (generate_day13, 320),
+    14: (generate_day14, 500),
+    15: (generate_day15, 50),
+    16: (generate_day16, 141),
+    17: (generate_day17, 9),
+    18: (generate_day18, 71),
+    19: (generate_day19, 400),
+    20: (generate_day20, 141),
+    21: (generate_day21, 5),
+}
+
+def generate(day: int, scale: Optional[int] = None, seed: int = 0) -> str:
+    """
+    Generates a synthetic puzzle input.
+
+    What `scale` means depends on the day: a number of lines or records for list inputs,
+    the side length for grid inputs, the number of digits for day 09 and the number of
+    output values for day 17. Like the shipped inputs, the text has no trailing newline.
+
+    Args:
+        day (int): The day number.
+        scale (Optional[int], optional): The size of the input. Defaults to the size of the real input.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        str: The generated input.
+    """
+    generator, default_scale = GENERATORS[day]
+    return generator(default_scale if scale is None else scale, random.Random(f'{day}-{seed}')).rstrip('\n')
+
+def generated_input(day: int, scale: Optional[int] = None, seed: int = 0) -> str:
+    """
+    Returns the path of a generated input file, generating it on first use.
+
+    Files are kept in the temporary directory under aoc-2024-inputs, one per (day, scale, seed) and
+    GENERATOR_VERSION, so files from older generators are not reused.
+
+    Args:
+        day (int): The day number.
+        scale (Optional[int], optional): The size of the input. Defaults to the size of the real input.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        str: The path to the generated input file.
+    """
+    scale = GENERATORS[day][1] if scale is None else scale
+    directory = os.path.join(tempfile.gettempdir(), 'aoc-2024-inputs')
+    path = os.path.join(directory, f'day{day:02d}-{scale}-{seed}-v{GENERATOR_VERSION}.txt')
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(generate(day, scale, seed))
+        os.replace(tmp_path, path)
+    return path
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    Entry point of `python -m aoc.generators`.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The command line arguments. Defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(prog='aoc.generators', description='Generate synthetic Advent of Code inputs.')
+    parser.add_argument('day', type=int, choices=sorted(GENERATORS))
+    parser.add_argument('-s', '--scale', type=int, help='size of the input (default: size of the real input)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    parser.add_argument('-o', '--output', help='file to write (default: stdout)')
+    args = parser.parse_args(argv)
+    text = generate(args.day, args.scale, args.seed)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text, end='')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+from typing import Any, List, Sequence, Tuple
+
+# Direction indices into Grid.directions, clockwise so turning right is (d + 1) % 4
+NORTH, EAST, SOUTH, WEST = range(4)
+
+class Grid:
+    """
+    A rectangular character grid stored row-major in one flat bytearray.
+
+    The grid is surrounded by a one-cell border of a sentinel character, so stepping off any
+    edge lands on the sentinel instead of needing a bounds check. Cells are addressed by flat
+    index, and `directions` holds the index offsets for north, east, south and west.
+
+    Attributes:
+        rows (int): The number of rows, excluding the border.
+        cols (int): The number of columns, excluding the border.
+        width (int): The length of a stored row, including the border.
+        border (int): The byte value of the sentinel border.
+        cells (bytearray): The cells, including the border.
+        directions (Tuple[int, int, int, int]): The index offsets for north, east, south and west.
+        diagonals (Tuple[int, int, int, int]): The index offsets for north-east, south-east, south-west and north-west.
+    """
+
+    def __init__(self, lines: Sequence[str], border: str = ' '):
+        """
+        Builds a grid from a list of equally long lines.
+
+        Args:
+            lines (Sequence[str]): The rows of the grid.
+            border (str, optional): The sentinel character surrounding the grid. Defaults to ' '.
+        """
+        self.rows = len(lines)
+        self.cols = len(lines[0]) if lines else 0
+        self.width = self.cols + 2
+        self.border = ord(border)
+        edge = border * self.width
+        self.cells = bytearray(''.join([edge, *(border + line + border for line in lines), edge]).encode('latin-1'))
+        if len(self.cells) != self.width * (self.rows + 2):
+            raise ValueError('All grid lines must have the same length')
+        w = self.width
+        self.directions = (-w, 1, w, -1)
+        self.diagonals = (1 - w, w + 1, w - 1, -w - 1)
+
+    @classmethod
+    def from_file(cls, file_path: str, border: str = ' ') -> 'Grid':
+        """
+        Reads a grid from a file, one row per non-empty line.
+
+        Args:
+            file_path (str): The path to the input file.
+            border (str, optional): The sentinel character surrounding the grid. Defaults to ' '.
+
+        Returns:
+            Grid: The grid read from the file.
+        """
+        with open(file_path) as f:
+            return cls([line for line in (line.strip() for line in f) if line], border)
+
+    @classmethod
+    def filled(cls, rows: int, cols: int, char: str = '.', border: str = ' ') -> 'Grid':
+        """
+        Builds a grid where every cell holds the same character.
+
+        Args:
+            rows (int): The number of rows.
+            cols (int): The number of columns.
+            char (str, optional): The character to fill the grid with. Defaults to '.'.
+            border (str, optional): The sentinel character surrounding the grid. Defaults to ' '.
+
+        Returns:
+            Grid: The filled grid.
+        """
+        return cls([char * cols] * rows, border)
+
+    @classmethod
+    def from_buffer(cls, cells: Any, rows: int, cols: int, border: str = ' ') -> 'Grid':
+        """
+        Wraps an existing cell buffer, including its border, without copying it.
+
+        This lets worker processes use a grid that lives in shared memory. Indexing works on any
+        byte buffer; find, find_all, count and lines need a bytearray.
+
+        Args:
+            cells (Any): The cells, e.g. a memoryview of shared memory, laid out as in Grid.cells.
+            rows (int): The number of rows, excluding the border.
+            cols (int): The number of columns, excluding the border.
+            border (str, optional): The sentinel character surrounding the grid. Defaults to ' '.
+
+        Returns:
+            Grid: The grid using the buffer as its cells.
+        """
+        if len(cells) != (cols + 2) * (rows + 2):
+            raise ValueError('The buffer does not match the grid size')
+        grid = object.__new__(cls)
+        grid.rows, grid.cols, grid.width, grid.border = rows, cols, cols + 2, ord(border)
+        grid.cells = cells
+        w = grid.width
+        grid.directions = (-w, 1, w, -1)
+        grid.diagonals = (1 - w, w + 1, w - 1, -w - 1)
+        return grid
+
+    def index(self, row: int, col: int) -> int:
+        """
+        Converts a (row, column) position to a flat index.
+
+        Args:
+            row (int): The row index.
+            col (int): The column index.
+
+        Returns:
+            int: The flat index of the cell.
+        """
+        return (row + 1) * self.width + col + 1
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        """
+        Converts a flat index back to a (row, column) position.
+
+        Args:
+            index (int): The flat index of a cell.
+
+        Returns:
+            Tuple[int, int]: The row and column of the cell.
+        """
+        row, col = divmod(index, self.width)
+        return row - 1, col - 1
+
+    def offset(self, drow: int, dcol: int) -> int:
+        """
+        Converts a (row, column) step to a flat index offset.
+
+        Args:
+            drow (int): The row delta.
+            dcol (int): The column delta.
+
+        Returns:
+            int: The offset to add to a flat index.
+        """
+        return drow * self.width + dcol
+
+    def contains(self, row: int, col: int) -> bool:
+        """
+        Checks whether a (row, column) position lies inside the grid.
+
+        Args:
+            row (int): The row index.
+            col (int): The column index.
+
+        Returns:
+            bool: True if the position is inside the grid, False otherwise.
+        """
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def find(self, char: str) -> int:
+        """
+        Finds the first cell holding a character.
+
+        Args:
+            char (str): The character to find.
+
+        Returns:
+            int: The flat index of the first matching cell, or -1 if there is none.
+        """
+        return self.cells.find(ord(char))
+
+    def find_all(self, char: str) -> List[int]:
+        """
+        Finds every cell holding a character.
+
+        Args:
+            char (str): The character to find.
+
+        Returns:
+            List[int]: The flat indices of all matching cells in row-major order.
+        """
+        cells, value = self.cells, ord(char)
+        result = []
+        i = cells.find(value)
+        while i != -1:
+            result.append(i)
+            i = cells.find(value, i + 1)
+        return result
+
+    def count(self, char: str) -> int:
+        """
+        Counts the cells holding a character.
+
+        Args:
+            char (str): The character to count.
+
+        Returns:
+            int: The number of matching cells.
+        """
+        return self.cells.count(ord(char))
+
+    def copy(self) -> 'Grid':
+        """
+        Returns a copy of the grid with its own cell buffer.
+
+        Returns:
+            Grid: The copy.
+        """
+        clone = object.__new__(Grid)
+        clone.__dict__.update(self.__dict__)
+        clone.cells = self.cells[:]
+        return clone
+
+    def lines(self) -> List[str]:
+        """
+        Returns the rows of the grid as strings, without the border.
+
+        Returns:
+            List[str]: The rows of the grid.
+        """
+        w = self.width
+        return [self.cells[r * w + 1:r * w + 1 + self.cols].decode('latin-1') for r in range(1, self.rows + 1)]
+
+    def __getitem__(self, index: int) -> str:
+        return chr(self.cells[index])
+
+    def __setitem__(self, index: int, char: str):
+        self.cells[index] = ord(char)
@@ -0,0 +1,97 @@
+import functools
+import os
+import time
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Sequence
+
+_enabled = os.environ.get('AOC_INSTRUMENT', '0') not in ('', '0')
+_stats: Dict[str, List] = {}
+
+FunctionStats = namedtuple('FunctionStats', ['function', 'calls', 'total_time'])
+
+def set_enabled(enabled: bool):
+    """
+    Turns instrumentation on or off for modules imported from now on, and for subprocesses.
+
+    Functions are wrapped when their module is imported, so this has to be called before the
+    solvers are loaded; the runner does that for --instrument.
+
+    Args:
+        enabled (bool): True to count calls and time of the functions marked with @hot.
+    """
+    global _enabled
+    _enabled = enabled
+    os.environ['AOC_INSTRUMENT'] = '1' if enabled else '0'
+
+def is_enabled() -> bool:
+    """
+    Returns whether functions marked with @hot are instrumented.
+
+    Returns:
+        bool: True if instrumentation is on.
+    """
+    return _enabled
+
+def hot(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Marks a function as a hot path whose calls and cumulative time are recorded.
+
+    With instrumentation off (the default) the function is returned unchanged, so the marker
+    costs nothing at call time. Turn it on with AOC_INSTRUMENT=1 or the runner's --instrument.
+    The recorded time includes time spent in callees, and calls made inside parallel_map worker
+    processes are not recorded.
+
+    Args:
+        func (Callable[..., Any]): The function to instrument.
+
+    Returns:
+        Callable[..., Any]: The function, wrapped if instrumentation is on.
+    """
+    if not _enabled:
+        return func
+    name = f"{func.__module__}.{func.__qualname__}"
+    stats = _stats.setdefault(name, [0, 0.0])
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += perf_counter() - start
+
+    return wrapper
+
+def reset():
+    """
+    Clears the recorded calls and times, keeping the instrumented functions.
+    """
+    for stats in _stats.values():
+        stats[0], stats[1] = 0, 0.0
+
+def report() -> List[FunctionStats]:
+    """
+    Returns the calls and time recorded since the last reset.
+
+    Returns:
+        List[FunctionStats]: One entry per function that was called, slowest first.
+    """
+    entries = [FunctionStats(name, calls, total) for name, (calls, total) in _stats.items() if calls]
+    return sorted(entries, key=lambda entry: entry.total_time, reverse=True)
+
+def format_report(entries: Sequence[FunctionStats]) -> str:
+    """
+    Formats recorded function statistics as a plain-text table.
+
+    Args:
+        entries (Sequence[FunctionStats]): The statistics, as returned by report.
+
+    Returns:
+        str: The table, one function per line.
+    """
+    lines = [f"{'function':<48} {'calls':>12} {'total (s)':>10} {'per call (us)':>14}"]
+    for e in entries:
+        lines.append(f"{e.function:<48} {e.calls:>12} {e.total_time:>10.3f} {e.total_time / e.calls * 1e6:>14.2f}")
+    return '\n'.join(lines)
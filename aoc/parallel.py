@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+from array import array
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+# The name of a shared memory block and the typecode, byte offset and length of each array in it
+SharedLayout = Tuple[str, Tuple[Tuple[str, int, int], ...]]
+
+_workers = int(os.environ.get('AOC_WORKERS') or 1)
+
+def resolve_workers(workers: int) -> int:
+    """
+    Turns a worker count from the command line into a number of processes.
+
+    Args:
+        workers (int): The requested number of workers; 0 or less means one per CPU core.
+
+    Returns:
+        int: The number of worker processes to use.
+    """
+    return workers if workers > 0 else os.cpu_count() or 1
+
+def set_workers(workers: int):
+    """
+    Sets the default number of worker processes used by parallel_map.
+
+    The value is also exported as AOC_WORKERS so that subprocesses inherit it.
+
+    Args:
+        workers (int): The number of workers; 0 or less means one per CPU core, 1 disables the pool.
+    """
+    global _workers
+    _workers = resolve_workers(workers)
+    os.environ['AOC_WORKERS'] = str(_workers)
+
+def get_workers() -> int:
+    """
+    Returns the default number of worker processes used by parallel_map.
+
+    Returns:
+        int: The number of workers.
+    """
+    return _workers
+
+def _apply(func: Callable[..., Any], args: tuple) -> Any:
+    return func(*args)
+
+def _init_worker(initializer: Optional[Callable[..., None]], initargs: tuple):
+    set_workers(1)
+    if initializer is not None:
+        initializer(*initargs)
+
+def parallel_map(func: Callable[[Any], Any], items: Iterable[Any], workers: Optional[int] = None, chunksize: Optional[int] = None,
+                 initializer: Optional[Callable[..., None]] = None, initargs: tuple = ()) -> List[Any]:
+    """
+    Applies a function to every item using a pool of worker processes.
+
+    With a single worker the items are mapped in the current process, so callers pay nothing
+    for the pool unless parallelism was asked for. `func` must be picklable, i.e. a module-level
+    function or a functools.partial of one.
+
+    Args:
+        func (Callable[[Any], Any]): The function to apply.
+        items (Iterable[Any]): The items to apply it to. Iterators are consumed lazily.
+        workers (Optional[int], optional): The number of processes. Defaults to the value set with set_workers.
+        chunksize (Optional[int], optional): The number of items sent to a worker at once.
+            Defaults to about four chunks per worker.
+        initializer (Optional[Callable[..., None]], optional): Called with `initargs` once in every
+            worker process before it maps any items, e.g. to attach shared memory. With a single
+            worker it is called in the current process.
+        initargs (tuple, optional): The arguments of the initializer.
+
+    Returns:
+        List[Any]: The results, in the order of the items.
+    """
+    workers = get_workers() if workers is None else resolve_workers(workers)
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return list(map(func, items))
+    if chunksize is None:
+        chunksize = -(-len(items) // (4 * workers)) if hasattr(items, '__len__') else 64
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(initializer, initargs)) as pool:
+        return list(pool.imap(func, items, max(chunksize, 1)))
+
+def parallel_starmap(func: Callable[..., Any], items: Iterable[tuple], workers: Optional[int] = None, chunksize: Optional[int] = None) -> List[Any]:
+    """
+    Like parallel_map, but unpacks each item into the arguments of the function.
+
+    Args:
+        func (Callable[..., Any]): The function to apply.
+        items (Iterable[tuple]): The argument tuples.
+        workers (Optional[int], optional): The number of processes. Defaults to the value set with set_workers.
+        chunksize (Optional[int], optional): The number of items sent to a worker at once.
+
+    Returns:
+        List[Any]: The results, in the order of the items.
+    """
+    return parallel_map(partial(_apply, func), items, workers, chunksize)
+
+def share_arrays(arrays: Sequence[Union[array, bytearray, bytes]]) -> Tuple[SharedMemory, SharedLayout]:
+    """
+    Copies arrays into one new shared memory block, so worker processes can read them without pickling.
+
+    The caller owns the block and must close and unlink it once the workers are done.
+
+    Args:
+        arrays (Sequence[Union[array, bytearray, bytes]]): The arrays to share; byte strings are shared as unsigned bytes.
+
+    Returns:
+        Tuple[SharedMemory, SharedLayout]: The block and the layout to pass to attach_arrays.
+    """
+    entries, size = [], 0
+    for values in arrays:
+        typecode = values.typecode if isinstance(values, array) else 'B'
+        itemsize = array(typecode).itemsize
+        size = -(-size // itemsize) * itemsize
+        entries.append((typecode, size, len(values)))
+        size += itemsize * len(values)
+    shm = SharedMemory(create=True, size=max(size, 1))
+    for values, (typecode, offset, length) in zip(arrays, entries):
+        shm.buf[offset:offset + array(typecode).itemsize * length] = memoryview(values).cast('B')
+    return shm, (shm.name, tuple(entries))
+
+def attach_arrays(layout: SharedLayout) -> Tuple[SharedMemory, List[memoryview]]:
+    """
+    Attaches to arrays shared with share_arrays, without copying them.
+
+    Keep the returned block referenced for as long as the views are used.
+
+    Args:
+        layout (SharedLayout): The layout returned by share_arrays.
+
+    Returns:
+        Tuple[SharedMemory, List[memoryview]]: The block and one typed view per shared array.
+    """
+    name, entries = layout
+    shm = SharedMemory(name)
+    views = [shm.buf[offset:offset + array(typecode).itemsize * length].cast(typecode) for typecode, offset, length in entries]
+    return shm, views
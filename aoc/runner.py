@@ -0,0 +1,263 @@
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from . import cache, instrument
+from .parallel import get_workers, resolve_workers, set_workers
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARTS = (1, 2)
+
+# An input file for every day, or a mapping from day to input file
+InputFiles = Union[None, str, Dict[int, str]]
+
+SolverResult = namedtuple('SolverResult', ['day', 'part', 'answer', 'wall_time', 'cpu_time', 'peak_rss', 'hot_paths'], defaults=((),))
+
+def find_days() -> List[int]:
+    """
+    Finds every day package in the repository.
+
+    Returns:
+        List[int]: The sorted day numbers that have a dayNN package.
+    """
+    return sorted(
+        int(name[3:]) for name in os.listdir(ROOT)
+        if re.fullmatch(r'day\d\d', name) and os.path.isfile(os.path.join(ROOT, name, '__init__.py'))
+    )
+
+def load_solver(day: int, part: int) -> Callable[[str], Any]:
+    """
+    Imports the solution function of a day's part.
+
+    Args:
+        day (int): The day number.
+        part (int): The part number (1 or 2).
+
+    Returns:
+        Callable[[str], Any]: The `solution` function of the dayNN.partN module.
+    """
+    return importlib.import_module(f'day{day:02d}.part{part}').solution
+
+def input_file(day: int) -> str:
+    """
+    Returns the path of the input file shipped with a day.
+
+    Args:
+        day (int): The day number.
+
+    Returns:
+        str: The path to the day's input.txt.
+    """
+    return importlib.import_module(f'day{day:02d}').INPUT_FILE
+
+def select_input(file_path: InputFiles, day: int) -> Optional[str]:
+    """
+    Picks a day's input file out of an InputFiles value.
+
+    Args:
+        file_path (InputFiles): A single input file, a mapping from day to input file, or None.
+        day (int): The day number.
+
+    Returns:
+        Optional[str]: The input file for the day, or None to use its input.txt.
+    """
+    return file_path.get(day) if isinstance(file_path, dict) else file_path
+
+def reset_peak_rss() -> bool:
+    """
+    Resets the peak resident set size of the current process so the next reading is per-solver.
+
+    This relies on Linux's /proc/self/clear_refs; on other platforms the peak is process-wide.
+
+    Returns:
+        bool: True if the peak was reset, False otherwise.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def peak_rss() -> int:
+    """
+    Reads the peak resident set size of the current process.
+
+    Returns:
+        int: The peak resident set size in bytes, or 0 if it cannot be determined.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            match = re.search(r'VmHWM:\s+(\d+) kB', f.read())
+        if match:
+            return int(match.group(1)) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+def cpu_time() -> float:
+    """
+    Reads the CPU time used by this process and its finished worker processes.
+
+    Returns:
+        float: The user plus system CPU time in seconds.
+    """
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+def run_solver(day: int, part: int, file_path: Optional[str] = None) -> SolverResult:
+    """
+    Runs a single solver in-process and measures it.
+
+    The solver module is imported before the clock starts, so import time is not included.
+
+    Args:
+        day (int): The day number.
+        part (int): The part number (1 or 2).
+        file_path (Optional[str], optional): The input file to solve. Defaults to the day's input.txt.
+
+    Returns:
+        SolverResult: The answer together with wall time and CPU time in seconds and peak RSS in bytes.
+            CPU time includes worker processes started by the solver; peak RSS covers this process only.
+            With instrumentation on, hot_paths holds the calls and time of the solver's hot functions.
+    """
+    solver = load_solver(day, part)
+    if file_path is None:
+        file_path = input_file(day)
+
+    instrument.reset()
+    reset_peak_rss()
+    wall_start, cpu_start = time.perf_counter(), cpu_time()
+    answer = solver(file_path)
+    wall_time = time.perf_counter() - wall_start
+    return SolverResult(day, part, answer, wall_time, cpu_time() - cpu_start, peak_rss(), instrument.report())
+
+def run_solvers(selection: Iterable[Tuple[int, int]], file_path: InputFiles = None) -> List[SolverResult]:
+    """
+    Runs several solvers one after another in the current process.
+
+    Args:
+        selection (Iterable[Tuple[int, int]]): The (day, part) pairs to run.
+        file_path (InputFiles, optional): An input file, or one per day, to use instead of each day's input.txt.
+
+    Returns:
+        List[SolverResult]: The results in the order of the selection.
+    """
+    return [run_solver(day, part, select_input(file_path, day)) for day, part in selection]
+
+def run_solvers_concurrently(selection: Iterable[Tuple[int, int]], file_path: InputFiles = None, workers: int = 0) -> List[SolverResult]:
+    """
+    Runs several solvers at the same time, one per worker process.
+
+    Each solver runs single-process inside its worker, so parallel_map calls do not nest pools.
+    Timings and peak RSS are measured inside the worker that ran the solver.
+
+    Args:
+        selection (Iterable[Tuple[int, int]]): The (day, part) pairs to run.
+        file_path (InputFiles, optional): An input file, or one per day, to use instead of each day's input.txt.
+        workers (int, optional): The number of worker processes; 0 means one per CPU core. Defaults to 0.
+
+    Returns:
+        List[SolverResult]: The results in the order of the selection.
+    """
+    tasks = [(day, part, select_input(file_path, day)) for day, part in selection]
+    with multiprocessing.Pool(resolve_workers(workers), initializer=set_workers, initargs=(1,), maxtasksperchild=1) as pool:
+        return pool.starmap(run_solver, tasks, chunksize=1)
+
+def format_table(results: Sequence[SolverResult]) -> str:
+    """
+    Formats solver results as a plain-text table.
+
+    Args:
+        results (Sequence[SolverResult]): The results to format.
+
+    Returns:
+        str: The table, one solver per line, followed by a total line.
+    """
+    lines = [f"{'day':>3} {'part':>4} {'wall (s)':>10} {'cpu (s)':>10} {'peak RSS (MB)':>14}  answer"]
+    for r in results:
+        lines.append(f"{r.day:>3} {r.part:>4} {r.wall_time:>10.3f} {r.cpu_time:>10.3f} {r.peak_rss / 2 ** 20:>14.1f}  {r.answer}")
+    lines.append(f"{'total':>8} {sum(r.wall_time for r in results):>10.3f} {sum(r.cpu_time for r in results):>10.3f}")
+    return '\n'.join(lines)
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Parses the command line of the runner.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(prog='aoc', description='Run and time Advent of Code solvers.')
+    parser.add_argument('days', nargs='*', type=int, help='days to run (default: all)')
+    parser.add_argument('-p', '--part', type=int, choices=PARTS, action='append', help='part to run, may be repeated (default: both)')
+    parser.add_argument('-i', '--input', help='input file to use instead of the shipped input.txt (single day only)')
+    parser.add_argument('--synthetic', action='store_true', help='run on generated inputs instead of the shipped ones (see aoc.generators)')
+    parser.add_argument('-s', '--scale', type=int, help='size of the generated inputs, implies --synthetic (default: size of the real input)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed of the generated inputs (default: 0)')
+    parser.add_argument('-j', '--workers', type=int, default=get_workers(), help='worker processes for parallel solvers, 0 for one per core (default: $AOC_WORKERS or 1)')
+    parser.add_argument('--concurrent', action='store_true', help='run the selected solvers concurrently, one process per core (or per --workers)')
+    parser.add_argument('--no-cache', action='store_true', help='parse inputs from scratch instead of using the parsed-input cache')
+    parser.add_argument('--instrument', action='store_true', help='count calls and time of the hot functions marked with @hot (or set AOC_INSTRUMENT=1)')
+    parser.add_argument('--json', action='store_true', help='print results as JSON instead of a table')
+    args = parser.parse_args(argv)
+    if args.input and len(args.days) != 1:
+        parser.error('--input requires exactly one day')
+    args.synthetic = args.synthetic or args.scale is not None
+    if args.input and args.synthetic:
+        parser.error('--input cannot be combined with --synthetic or --scale')
+    return args
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Entry point of `python -m aoc`.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The command line arguments. Defaults to sys.argv[1:].
+    """
+    args = parse_args(argv)
+    days = args.days or find_days()
+    parts = args.part or PARTS
+    if args.no_cache:
+        cache.set_enabled(False)
+    if args.instrument:
+        instrument.set_enabled(True)
+    selection = [(day, part) for day in days for part in parts]
+    file_path: InputFiles = args.input
+    if args.synthetic:
+        # Imported here so that `python -m aoc.generators` does not find the module already loaded
+        from . import generators
+        file_path = {day: generators.generated_input(day, args.scale, args.seed) for day in days}
+    wall_start = time.perf_counter()
+    if args.concurrent:
+        results = run_solvers_concurrently(selection, file_path, args.workers if args.workers != 1 else 0)
+    else:
+        set_workers(args.workers)
+        results = run_solvers(selection, file_path)
+    elapsed = time.perf_counter() - wall_start
+    if args.json:
+        print(json.dumps([{**r._asdict(), 'hot_paths': [e._asdict() for e in r.hot_paths]} for r in results], indent=2, default=str))
+    else:
+        print(format_table(results))
+        print(f"elapsed {elapsed:.3f} s")
+        for r in results:
+            if r.hot_paths:
+                print(f"\nday {r.day} part {r.part}")
+                print(instrument.format_report(r.hot_paths))
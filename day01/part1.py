@@ -1,3 +1,5 @@
+from . import INPUT_FILE
+
 def read_input(file_path: str) -> list[tuple[int, int]]:
     """
     Reads a file and returns its contents as a list of tuples of integers.
@@ -28,8 +30,17 @@ def calculate_sum_of_differences(pairs: list[tuple[int, int]]) -> int:
     list1, list2 = sorted(list1), sorted(list2)
     return sum(abs(a - b) for a, b in zip(list1, list2))
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The sum of differences between the sorted location lists.
+    """
+    return calculate_sum_of_differences(read_input(file_path))
+
 if __name__ == "__main__":
-    input_file = 'input.txt'
-    pairs = read_input(input_file)
-    result = calculate_sum_of_differences(pairs)
-    print(result)
+    print(solution(INPUT_FILE))
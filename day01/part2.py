@@ -1,6 +1,7 @@
-from part1 import read_input
+from .part1 import read_input
 from collections import Counter
 from typing import List, Tuple
+from . import INPUT_FILE
 
 def calculate_similarity_score(pairs: List[Tuple[int, int]]) -> int:
     """
@@ -21,8 +22,17 @@ def calculate_similarity_score(pairs: List[Tuple[int, int]]) -> int:
     count1, count2 = Counter(list1), Counter(list2)
     return sum(count1[element] * count2[element] * element for element in count1)
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The similarity score of the two location lists.
+    """
+    return calculate_similarity_score(read_input(file_path))
+
 if __name__ == "__main__":
-    input_file = 'input.txt'
-    pairs = read_input(input_file)
-    result = calculate_similarity_score(pairs)
-    print(result)
+    print(solution(INPUT_FILE))
@@ -1,4 +1,7 @@
 from typing import List, Tuple
+from aoc.instrument import hot
+from aoc.parallel import parallel_map
+from . import INPUT_FILE
 
 def read_input(file_path: str) -> List[List[int]]:
     """
@@ -41,6 +44,7 @@ def has_valid_differences(report: List[int]) -> bool:
     """
     return all(1 <= abs(report[i + 1] - report[i]) <= 3 for i in range(len(report) - 1))
 
+@hot
 def is_safe(report: List[int]) -> bool:
     """
     Determines if the given report is safe based on specific criteria.
@@ -55,7 +59,18 @@ def is_safe(report: List[int]) -> bool:
     """
     return is_monotonic(report) and has_valid_differences(report)
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of safe reports.
+    """
+    reports = read_input(file_path)
+    return sum(parallel_map(is_safe, reports))
+
 if __name__ == "__main__":
-    reports = read_input('input.txt')
-    count = sum(1 for report in reports if is_safe(report))
-    print(count)
+    print(solution(INPUT_FILE))
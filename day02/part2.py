@@ -1,6 +1,10 @@
-from part1 import read_input, is_monotonic, has_valid_differences
+from .part1 import read_input, is_monotonic, has_valid_differences
 from typing import List
+from aoc.instrument import hot
+from aoc.parallel import parallel_map
+from . import INPUT_FILE
 
+@hot
 def is_safe(report: List[int]) -> bool:
     """
     Determines if a given report is safe based on specific criteria.
@@ -16,8 +20,18 @@ def is_safe(report: List[int]) -> bool:
     """
     return any(is_monotonic(report[:i] + report[i + 1:]) and has_valid_differences(report[:i] + report[i + 1:]) for i in range(len(report)))
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of reports that are safe with at most one level removed.
+    """
+    reports = read_input(file_path)
+    return sum(parallel_map(is_safe, reports))
+
 if __name__ == "__main__":
-    input_file = 'input.txt'
-    reports = read_input(input_file)
-    count = sum(1 for report in reports if is_safe(report))
-    print(count)
+    print(solution(INPUT_FILE))
@@ -1,5 +1,6 @@
 import re
 from typing import List, Tuple
+from . import INPUT_FILE
 
 def read_input(file_path: str) -> str:
     """
@@ -42,8 +43,17 @@ def sum_products(matches: List[Tuple[str, str]]) -> int:
     """
     return sum(int(x) * int(y) for x, y in matches)
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The sum of all mul instruction products.
+    """
+    return sum_products(find_mul_instances(read_input(file_path)))
+
 if __name__ == "__main__":
-    input_string = read_input('input.txt')
-    mul_instances = find_mul_instances(input_string)
-    total_sum = sum_products(mul_instances)
-    print(total_sum)
+    print(solution(INPUT_FILE))
@@ -1,5 +1,6 @@
 import re
-from part1 import read_input, sum_products
+from .part1 import read_input, sum_products
+from . import INPUT_FILE
 
 def find_mul_instances(input_string):
     """
@@ -40,7 +41,17 @@ def find_mul_instances(input_string):
     
     return mul_matches
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The sum of all enabled mul instruction products.
+    """
+    return sum_products(find_mul_instances(read_input(file_path)))
+
 if __name__ == "__main__":
-    input_data = read_input('input.txt')
-    mul_instances = find_mul_instances(input_data)
-    print(sum_products(mul_instances))
+    print(solution(INPUT_FILE))
@@ -1,49 +1,47 @@
 from typing import List, Tuple
+from aoc.grid import Grid
+from aoc.instrument import hot
+from . import INPUT_FILE
 
-def read_input(file_path: str) -> List[str]:
+def read_input(file_path: str) -> Grid:
     """
-    Reads a file and returns a list of stripped lines.
+    Reads a file and returns its contents as a grid of characters.
 
     Args:
         file_path (str): The path to the input file.
 
     Returns:
-        List[str]: A list of lines from the file, with leading and trailing whitespace removed.
+        Grid: The grid of letters from the file.
     """
-    with open(file_path) as f:
-        return [line.strip() for line in f]
+    return Grid.from_file(file_path)
 
-def find_word_count(grid: List[str], word: str, directions: List[Tuple[int, int]]) -> int:
+@hot
+def find_word_count(grid: Grid, word: str, directions: List[Tuple[int, int]]) -> int:
     """
     Finds the number of times a word appears in a grid of characters in specified directions.
     Args:
-        grid (List[str]): A list of strings representing the grid of characters.
+        grid (Grid): The grid of characters.
         word (str): The word to search for in the grid.
         directions (List[Tuple[int, int]]): A list of tuples representing the directions to search in.
             Each tuple contains two integers (dx, dy) representing the direction vector.
     Returns:
         int: The number of times the word appears in the grid in the specified directions.
     """
-    rows = len(grid)
-    cols = len(grid[0])
-    word_len = len(word)
-    
-    def in_bounds(x: int, y: int) -> bool:
-        return 0 <= x < rows and 0 <= y < cols
-    
-    def search_from(x: int, y: int, dx: int, dy: int) -> bool:
-        for i in range(word_len):
-            nx, ny = x + i * dx, y + i * dy
-            if not in_bounds(nx, ny) or grid[nx][ny] != word[i]:
-                return False
-        return True
+    cells = grid.cells
+    first, rest = word[0], word[1:].encode()
+    offsets = [grid.offset(dx, dy) for dx, dy in directions]
     
+    # The border never matches a letter, so a search stops at the edge without a bounds check
     match_count = 0
-    for x in range(rows):
-        for y in range(cols):
-            for dx, dy in directions:
-                if search_from(x, y, dx, dy):
-                    match_count += 1
+    for start in grid.find_all(first):
+        for step in offsets:
+            pos = start
+            for char in rest:
+                pos += step
+                if cells[pos] != char:
+                    break
+            else:
+                match_count += 1
     
     return match_count
 
@@ -59,8 +57,17 @@ directions = [
     (-1, 1)   # diagonal up-right
 ]
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of times "XMAS" appears in the grid.
+    """
+    return find_word_count(read_input(file_path), "XMAS", directions)
+
 if __name__ == "__main__":
-    grid = read_input('input.txt')
-    word = "XMAS"
-    match_count = find_word_count(grid, word, directions)
-    print(f"Total matches: {match_count}")
+    print(f"Total matches: {solution(INPUT_FILE)}")
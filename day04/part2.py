@@ -1,44 +1,48 @@
-from typing import List
-from part1 import read_input, find_word_count
+from aoc.grid import Grid
+from aoc.instrument import hot
+from .part1 import read_input
+from . import INPUT_FILE
 
-directions = [
-    (1, 1),  # diagonal down-right
-    (-1, -1),# diagonal up-left
-    (1, -1), # diagonal down-left
-    (-1, 1)  # diagonal up-right
-]
+@hot
+def find_x_mas(grid: Grid, center: int) -> bool:
+    """
+    Checks if the word "MAS" appears along both diagonals of the 3x3 square around a cell.
+
+    Args:
+        grid (Grid): The grid of characters.
+        center (int): The flat index of the middle cell, which should hold 'A'.
 
-def get_subgrids(grid: List[str]) -> List[str]:
+    Returns:
+        bool: True if both diagonals through the cell read "MAS" in either direction, False otherwise.
     """
-    Extracts all 3x3 subgrids from a given 2D grid.
+    cells = grid.cells
+    ne, se, sw, nw = grid.diagonals
+    m, s = ord('M'), ord('S')
+    return {cells[center + nw], cells[center + se]} == {m, s} and {cells[center + ne], cells[center + sw]} == {m, s}
+
+def count_x_mas(grid: Grid) -> int:
+    """
+    Counts the X-MAS patterns in a grid.
 
     Args:
-        grid (List[str]): A 2D grid represented as a list of strings.
+        grid (Grid): The grid of characters.
 
     Returns:
-        List[str]: A list of 3x3 subgrids, each represented as a list of strings.
+        int: The number of cells that are the center of an X-MAS.
     """
-    return [
-        [grid[i + k][j:j + 3] for k in range(3)]
-        for i in range(len(grid) - 2)
-        for j in range(len(grid[0]) - 2)
-    ]
+    return sum(find_x_mas(grid, center) for center in grid.find_all('A'))
 
-def find_x_mas(subgrid: List[str]) -> bool:
+def solution(file_path: str) -> int:
     """
-    Checks if the word "MAS" appears exactly twice in the given subgrid.
+    Solves part 2 for the given input file.
 
     Args:
-        subgrid (List[str]): A list of strings representing the subgrid to search within.
+        file_path (str): The path to the input file.
 
     Returns:
-        bool: True if the word "MAS" appears exactly twice in the subgrid, False otherwise.
+        int: The number of X-MAS patterns in the grid.
     """
-    mas = "MAS"
-    return find_word_count(subgrid, mas, directions) == 2
-    
+    return count_x_mas(read_input(file_path))
+
 if __name__ == "__main__":
-    grid: List[List[str]] = read_input('input.txt')
-    subgrids: List[List[List[str]]] = get_subgrids(grid)
-    count: int = sum(find_x_mas(subgrid) for subgrid in subgrids)
-    print(count)
+    print(solution(INPUT_FILE))
@@ -1,4 +1,7 @@
 from typing import List, Tuple
+from aoc.cache import cached_parser, encode_int_records, decode_int_records, encode_int_lists, decode_int_lists
+from aoc.instrument import hot
+from . import INPUT_FILE
 
 def read_input(file_path: str) -> Tuple[List[str], List[str]]:
     """
@@ -46,6 +49,25 @@ def parse_part2(part2: List[str]) -> List[List[int]]:
     """
     return [list(map(int, line.split(','))) for line in part2 if line]
 
+@cached_parser(1,
+               encode=lambda parsed: [*encode_int_records(parsed[0]), *encode_int_lists(parsed[1])],
+               decode=lambda arrays: (decode_int_records(arrays[:2]), decode_int_lists(arrays[2:])))
+def parse_input(file_path: str) -> Tuple[List[Tuple[int, int]], List[List[int]]]:
+    """
+    Reads and parses the input file into ordering rules and updates.
+
+    The result is cached on disk, keyed by the content of the file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        Tuple[List[Tuple[int, int]], List[List[int]]]: The ordering rules and the updates.
+    """
+    part1, part2 = read_input(file_path)
+    return parse_part1(part1), parse_part2(part2)
+
+@hot
 def follows_rules(rules: List[Tuple[int, int]], sequence: List[int]) -> bool:
     """
     Checks if a given sequence follows a set of rules.
@@ -92,13 +114,19 @@ def find_middle_elements(valid_sequences: List[List[int]]) -> List[int]:
     """
     return [seq[len(seq) // 2] for seq in valid_sequences]
 
-if __name__ == "__main__":
-    part1, part2 = read_input('input.txt')
-    pairs = parse_part1(part1)
-    part2_lists = parse_part2(part2)
-    
-    valid_sequences = get_valid_sequences(pairs, part2_lists)
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
 
-    result = sum(find_middle_elements(valid_sequences))
-    print(result)
+    Returns:
+        int: The sum of the middle pages of the correctly ordered updates.
+    """
+    pairs, part2_lists = parse_input(file_path)
+    valid_sequences = get_valid_sequences(pairs, part2_lists)
+    return sum(find_middle_elements(valid_sequences))
 
+if __name__ == "__main__":
+    print(solution(INPUT_FILE))
@@ -1,5 +1,7 @@
 from typing import List, Tuple
-from part1 import read_input, parse_part1, parse_part2, follows_rules, find_middle_elements
+from aoc.instrument import hot
+from .part1 import parse_input, follows_rules, find_middle_elements
+from . import INPUT_FILE
 
 def get_invalid_sequences(rules: List[Tuple[int, int]], sequences: List[List[int]]) -> List[List[int]]:
     """
@@ -14,6 +16,7 @@ def get_invalid_sequences(rules: List[Tuple[int, int]], sequences: List[List[int
     """
     return [seq for seq in sequences if not follows_rules(rules, seq)]
 
+@hot
 def get_correct_order(rules: List[Tuple[int, int]], sequence: List[int]) -> List[int]:
     """
     Sorts a sequence of integers based on a list of rules.
@@ -58,13 +61,20 @@ def get_correct_orders(rules: List[Tuple[int, int]], sequences: List[List[int]])
     """
     return [get_correct_order(rules, seq) for seq in sequences]
 
-if __name__ == "__main__":
-    part1_data, part2_data = read_input('input.txt')
-    rules = parse_part1(part1_data)
-    sequences = parse_part2(part2_data)
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
 
+    Returns:
+        int: The sum of the middle pages of the reordered incorrect updates.
+    """
+    rules, sequences = parse_input(file_path)
     invalid_sequences = get_invalid_sequences(rules, sequences)
     correct_orders = get_correct_orders(rules, invalid_sequences)
+    return sum(find_middle_elements(correct_orders))
 
-    result = sum(find_middle_elements(correct_orders))
-    print(result)
+if __name__ == "__main__":
+    print(solution(INPUT_FILE))
@@ -1,112 +1,123 @@
-from typing import List, Tuple
+from typing import Tuple
+from aoc.grid import Grid, NORTH
+from aoc.instrument import hot
+from . import INPUT_FILE
 
-def read_input(file_path: str) -> List[str]:
+OBSTACLE = ord('#')
+VISITED = ord('X')
+
+def read_input(file_path: str) -> Grid:
     """
-    Reads the input from a file and returns a list of stripped lines.
+    Reads the input from a file and returns it as a grid.
 
     Args:
         file_path (str): The path to the input file.
 
     Returns:
-        List[str]: A list of lines from the file, with leading and trailing whitespace removed.
+        Grid: The map, with a border that marks leaving the mapped area.
     """
-    with open(file_path) as f:
-        return [line.strip() for line in f]
+    return Grid.from_file(file_path)
 
-def turn_right(direction: str) -> str:
+def turn_right(direction: int) -> int:
     """
     Turns the given direction 90 degrees to the right.
 
     Args:
-        direction (str): The current direction, which should be one of the following:
-                         '^' for up, '>' for right, 'v' for down, or '<' for left.
+        direction (int): The current direction, one of NORTH, EAST, SOUTH or WEST.
 
     Returns:
-        str: The new direction after turning 90 degrees to the right.
+        int: The new direction after turning 90 degrees to the right.
     """
-    directions = {'^': '>', '>': 'v', 'v': '<', '<': '^'}
-    return directions[direction]
+    return (direction + 1) % 4
 
-def move_one_step(grid: List[List[str]], x: int, y: int, direction: str) -> Tuple[int, int, str]:
+@hot
+def move_one_step(grid: Grid, pos: int, direction: int) -> Tuple[int, int]:
     """
-    Move one step in the given direction on the grid.
+    Move one step in the given direction on the grid, turning right at obstacles.
 
     Args:
-        grid (List[List[str]]): The grid representing the environment.
-        x (int): The current x-coordinate (row index).
-        y (int): The current y-coordinate (column index).
-        direction (str): The current direction ('^', '>', 'v', '<').
+        grid (Grid): The grid representing the environment.
+        pos (int): The flat index of the current cell.
+        direction (int): The current direction, one of NORTH, EAST, SOUTH or WEST.
 
     Returns:
-        Tuple[int, int, str]: A tuple containing the new x-coordinate, new y-coordinate, and the direction.
-                              If the move is not possible, returns (None, None, None).
+        Tuple[int, int]: A tuple containing the new flat index and the direction.
+                         If the move leaves the grid, returns (-1, -1).
     """
-    rows, cols = len(grid), len(grid[0])
-    moves = {'^': (-1, 0), '>': (0, 1), 'v': (1, 0), '<': (0, -1)}
+    cells, offsets = grid.cells, grid.directions
     while True:
-        dx, dy = moves[direction]
-        new_x, new_y = x + dx, y + dy
-
-        if 0 <= new_x < rows and 0 <= new_y < cols and grid[new_x][new_y] != '#':
-            return new_x, new_y, direction
-        else:
-            if new_x < 0 or new_x >= rows or new_y < 0 or new_y >= cols:
-                return None, None, None
+        new_pos = pos + offsets[direction]
+        cell = cells[new_pos]
+        if cell == OBSTACLE:
             direction = turn_right(direction)
+        elif cell == grid.border:
+            return -1, -1
+        else:
+            return new_pos, direction
 
-def move_tracker(grid: List[str], start_pos: Tuple[int, int], direction: str) -> List[str]:
+def move_tracker(grid: Grid, start_pos: int, direction: int) -> Grid:
     """
     Tracks movement on a grid starting from a given position and direction.
     Args:
-        grid (List[str]): A list of strings representing the grid.
-        start_pos (Tuple[int, int]): The starting position as a tuple (x, y).
-        direction (str): The initial direction of movement.
+        grid (Grid): The grid to walk.
+        start_pos (int): The flat index of the starting position.
+        direction (int): The initial direction of movement.
     Returns:
-        List[str]: The updated grid with the path marked by 'X'.
+        Grid: A copy of the grid with the path marked by 'X'.
     """
-    x, y = start_pos
-    grid = [list(row) for row in grid]  # Convert to list of lists for mutability
+    grid = grid.copy()
+    cells = grid.cells
+    pos = start_pos
 
     # Mark the starting position
-    grid[x][y] = 'X'
+    cells[pos] = VISITED
     
     while True:
-        x, y, direction = move_one_step(grid, x, y, direction)
-        if x is None or y is None:
+        pos, direction = move_one_step(grid, pos, direction)
+        if pos == -1:
             break
-        grid[x][y] = 'X'
+        cells[pos] = VISITED
     
-    return [''.join(row) for row in grid]
+    return grid
 
-def find_start_pos(grid: List[str]) -> Tuple[int, int]:
+def find_start_pos(grid: Grid) -> int:
     """
     Finds the starting position in a grid.
 
     Args:
-        grid (List[str]): A list of strings representing the grid.
+        grid (Grid): The grid to search.
 
     Returns:
-        Tuple[int, int]: A tuple containing the row and column indices of the starting position marked by '^'.
+        int: The flat index of the starting position marked by '^'.
     """
-    for i, row in enumerate(grid):
-        for j, cell in enumerate(row):
-            if cell == '^':
-                return (i, j)
+    return grid.find('^')
             
-def count_visited(grid: List[str]) -> int:
+def count_visited(grid: Grid) -> int:
     """
     Counts the number of visited cells in a grid.
 
     Args:
-        grid (List[str]): A list of strings representing the grid, where each string is a row and 'X' denotes a visited cell.
+        grid (Grid): The grid, where 'X' denotes a visited cell.
 
     Returns:
         int: The total number of visited cells in the grid.
     """
-    return sum(row.count('X') for row in grid)
+    return grid.count('X')
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of distinct cells visited by the guard.
+    """
+    grid = read_input(file_path)
+    start_pos = find_start_pos(grid)
+    end_grid = move_tracker(grid, start_pos, NORTH)
+    return count_visited(end_grid)
 
 if __name__ == "__main__":
-    grid = read_input('input.txt')
-    x, y = find_start_pos(grid)
-    end_grid = move_tracker(grid, (x, y), '^')
-    print(count_visited(end_grid))
+    print(solution(INPUT_FILE))
@@ -1,61 +1,189 @@
-from typing import List, Tuple
-from part1 import read_input, move_one_step, find_start_pos
-from tqdm import tqdm
+import re
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+from aoc.grid import Grid, NORTH
+from aoc.instrument import hot
+from aoc.parallel import SharedLayout, attach_arrays, get_workers, parallel_map, resolve_workers, share_arrays
+from .part1 import read_input, find_start_pos, OBSTACLE
+from . import INPUT_FILE
 
-def add_barriers(grid: List[str], start_pos: Tuple[int, int]) -> List[List[str]]:
+# Per-process state of the parallel search: the shared grid, jump tables and candidates, and a
+# turn bitmap reused for every candidate the process tests
+_worker: Dict[str, Any] = {}
+
+def build_jump_tables(grid: Grid) -> List[array]:
     """
-    Adds barriers to a grid, except at the starting position and existing barriers.
+    Precomputes, for every cell and direction, the first obstacle or border cell the guard runs into.
+
+    The guard walking in direction d from cell i stops on the cell before tables[d][i], so a whole
+    straight segment of the walk is one lookup.
 
     Args:
-        grid (List[str]): A list of strings representing the grid.
-        start_pos (Tuple[int, int]): The starting position (x, y) in the grid.
+        grid (Grid): The map.
 
     Returns:
-        List[List[str]]: A new grid with barriers added.
+        List[array]: One table per direction (NORTH, EAST, SOUTH, WEST), indexed by flat cell index.
     """
-    rows, cols = len(grid), len(grid[0])
-    x, y = start_pos
-    return [
-        [''.join('#' if (i, j) == (r, c) else cell for j, cell in enumerate(row)) for i, row in enumerate(grid)]
-        for r in range(rows) for c in range(cols) if (r, c) != (x, y) and grid[r][c] != '#'
-    ]
+    cells, w = grid.cells, grid.width
+    tables = [array('i', bytes(4 * len(cells))) for _ in range(4)]
+    blocker = re.compile(b'[' + re.escape(bytes([OBSTACLE, grid.border])) + b']')
+    # Rows run east (forward) and west (backward), columns run south (forward) and north (backward)
+    lines = [(r * w, 1, grid.cols + 2, tables[1], tables[3]) for r in range(1, grid.rows + 1)]
+    lines += [(c, w, grid.rows + 2, tables[2], tables[0]) for c in range(1, grid.cols + 1)]
+    for start, step, length, forward, backward in lines:
+        stops = [m.start() for m in blocker.finditer(cells[start:start + step * length:step])]
+        for a, b in zip(stops, stops[1:]):
+            if b - a > 1:
+                segment = slice(start + (a + 1) * step, start + b * step, step)
+                forward[segment] = array('i', [start + b * step]) * (b - a - 1)
+                backward[segment] = array('i', [start + a * step]) * (b - a - 1)
+    return tables
 
-def find_loop(grid: List[str], start_pos: Tuple[int, int], direction: str) -> bool:
+def guard_path(grid: Grid, tables: List[array], start_pos: int, direction: int) -> List[Tuple[int, int, int]]:
     """
-    Determines if there is a loop in the grid starting from a given position and direction.
+    Walks the guard's original route and records where each cell is first entered from.
+
     Args:
-        grid (List[str]): The grid represented as a list of strings.
-        start_pos (Tuple[int, int]): The starting position in the grid as a tuple (x, y).
-        direction (str): The initial direction of movement.
+        grid (Grid): The map.
+        tables (List[array]): The jump tables from build_jump_tables.
+        start_pos (int): The flat index of the starting position.
+        direction (int): The initial direction.
+
     Returns:
-        bool: True if a loop is detected, False otherwise.
+        List[Tuple[int, int, int]]: For every cell on the route except the start, in walking order,
+            the cell, and the position and direction of the guard right before it first steps onto it.
     """
-    x, y = start_pos
-    visited = {(x, y, direction)}
-    
+    cells, offsets, border = grid.cells, grid.directions, grid.border
+    seen = bytearray(len(cells))
+    seen[start_pos] = 1
+    path = []
+    pos = start_pos
     while True:
-        x, y, direction = move_one_step(grid, x, y, direction)
-        if (x, y, direction) in visited:
-            return True
-        if x is None or y is None:
-            return False
-        visited.add((x, y, direction))
+        step, stop = offsets[direction], tables[direction][pos]
+        for cell in range(pos + step, stop, step):
+            if not seen[cell]:
+                seen[cell] = 1
+                path.append((cell, cell - step, direction))
+        if cells[stop] == border:
+            return path
+        pos = stop - step
+        direction = (direction + 1) % 4
+
+@hot
+def find_loop(grid: Grid, tables: List[array], obstacle: int, pos: int, direction: int, seen: bytearray) -> bool:
+    """
+    Determines whether an extra obstacle traps the guard in a loop, without modifying the grid.
+
+    The guard jumps from turn to turn using the jump tables; a segment is cut short when the
+    extra obstacle lies on it. Only turning states are recorded, since every loop repeats one.
+
+    Args:
+        grid (Grid): The map.
+        tables (List[array]): The jump tables from build_jump_tables.
+        obstacle (int): The flat index of the extra obstacle.
+        pos (int): The flat index the guard starts from.
+        direction (int): The direction the guard starts in.
+        seen (bytearray): Scratch space of one byte per cell, bit d marking a turn into direction d there.
+            All zero on entry; the cells this call marks are cleared again before it returns.
+
+    Returns:
+        bool: True if the guard ends up in a loop, False if it leaves the map.
+    """
+    cells, offsets, border = grid.cells, grid.directions, grid.border
+    touched = []
+    while True:
+        step, stop = offsets[direction], tables[direction][pos]
+        if (pos < obstacle < stop if step > 0 else stop < obstacle < pos) and (obstacle - pos) % step == 0:
+            stop = obstacle
+        elif cells[stop] == border:
+            looped = False
+            break
+        pos = stop - step
+        direction = (direction + 1) % 4
+        bit = 1 << direction
+        if seen[pos] & bit:
+            looped = True
+            break
+        if not seen[pos]:
+            touched.append(pos)
+        seen[pos] |= bit
+    for cell in touched:
+        seen[cell] = 0
+    return looped
+
+def attach_worker(layout: SharedLayout, rows: int, cols: int, border: str):
+    """
+    Sets up a worker process of the parallel search on the arrays shared by find_loop_count.
+
+    Args:
+        layout (SharedLayout): The layout of the shared grid cells, jump tables and candidates.
+        rows (int): The number of rows of the grid.
+        cols (int): The number of columns of the grid.
+        border (str): The border character of the grid.
+    """
+    shm, (cells, *tables, candidates) = attach_arrays(layout)
+    _worker.update(shm=shm, grid=Grid.from_buffer(cells, rows, cols, border), tables=tables, candidates=candidates,
+                   seen=bytearray(len(cells)))
+
+def count_loops(bounds: Tuple[int, int]) -> int:
+    """
+    Tests a slice of the candidate obstacles in a worker process set up by attach_worker.
+
+    Args:
+        bounds (Tuple[int, int]): The first and one past the last candidate to test.
+
+    Returns:
+        int: The number of candidates in the slice that trap the guard in a loop.
+    """
+    grid, tables, candidates, seen = _worker['grid'], _worker['tables'], _worker['candidates'], _worker['seen']
+    return sum(find_loop(grid, tables, candidates[3 * i], candidates[3 * i + 1], candidates[3 * i + 2], seen) for i in range(*bounds))
+
+def find_loop_count(grid: Grid, start_pos: int, workers: Optional[int] = None) -> int:
+    """
+    Counts the positions where one extra obstacle traps the guard in a loop.
+
+    Only cells on the guard's original route can change its walk. For each of them the walk
+    resumes from the state right before the guard would first step onto the new obstacle.
+    With several workers the grid, jump tables and candidates are put in shared memory and
+    each worker process tests slices of the candidates.
+
+    Args:
+        grid (Grid): The map.
+        start_pos (int): The flat index of the starting position.
+        workers (Optional[int], optional): The number of processes. Defaults to the value set with aoc.parallel.set_workers.
+
+    Returns:
+        int: The number of obstruction positions that cause a loop.
+    """
+    tables = build_jump_tables(grid)
+    path = guard_path(grid, tables, start_pos, NORTH)
+    workers = get_workers() if workers is None else resolve_workers(workers)
+    if workers <= 1:
+        seen = bytearray(len(grid.cells))
+        return sum(find_loop(grid, tables, cell, pos, direction, seen) for cell, pos, direction in path)
+
+    shm, layout = share_arrays([grid.cells, *tables, array('i', (value for candidate in path for value in candidate))])
+    try:
+        size = max(-(-len(path) // (16 * workers)), 1)
+        slices = [(lo, min(lo + size, len(path))) for lo in range(0, len(path), size)]
+        return sum(parallel_map(count_loops, slices, workers, chunksize=1,
+                                initializer=attach_worker, initargs=(layout, grid.rows, grid.cols, chr(grid.border))))
+    finally:
+        shm.close()
+        shm.unlink()
 
-def find_loop_count(grid: List[str], start_pos: Tuple[int, int]) -> int:
+def solution(file_path: str) -> int:
     """
-    Calculates the total number of loops in a grid starting from a given position.
+    Solves part 2 for the given input file.
 
     Args:
-        grid (List[str]): A list of strings representing the grid.
-        start_pos (Tuple[int, int]): A tuple representing the starting position in the grid.
+        file_path (str): The path to the input file.
 
     Returns:
-        int: The total number of loops found in the grid.
+        int: The number of obstruction positions that trap the guard in a loop.
     """
-    grids = add_barriers(grid, start_pos)
-    return sum(find_loop(g, start_pos, '^') for g in tqdm(grids))
+    grid = read_input(file_path)
+    return find_loop_count(grid, find_start_pos(grid))
 
 if __name__ == "__main__":
-    grid = read_input('input.txt')
-    x, y = find_start_pos(grid)
-    print(find_loop_count(grid, (x, y)))
+    print(solution(INPUT_FILE))
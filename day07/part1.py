@@ -1,4 +1,6 @@
 from typing import List, Tuple
+from aoc.instrument import hot
+from . import INPUT_FILE
 
 def read_input(file_path: str) -> List[Tuple[int, List[int]]]:
     """
@@ -68,6 +70,7 @@ def apply_operator(left: int, right: int, operator: str) -> int:
     else:
         raise ValueError(f'Invalid operator: {operator}')
 
+@hot
 def evaluate_expression(target: int, nums: List[int], operators: List[str] = ['+', '*']) -> bool:
     """
     Evaluates whether a target value can be obtained by applying a sequence of operators
@@ -109,6 +112,17 @@ def sum_valid_expressions(expressions: List[Tuple[int, List[int]]], operators: L
     """
     return sum(target for target, nums in expressions if evaluate_expression(target, nums, operators))
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The total calibration result using addition and multiplication.
+    """
+    return sum_valid_expressions(read_input(file_path))
+
 if __name__ == "__main__":
-    expressions = read_input('input.txt')
-    print(sum_valid_expressions(expressions))
\ No newline at end of file
+    print(solution(INPUT_FILE))
@@ -1,6 +1,18 @@
 from typing import List, Tuple
-from part1 import read_input, sum_valid_expressions
+from .part1 import read_input, sum_valid_expressions
+from . import INPUT_FILE
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The total calibration result including the concatenation operator.
+    """
+    return sum_valid_expressions(read_input(file_path), ['+', '*', '||'])
 
 if __name__ == "__main__":
-    expressions = read_input('input.txt')
-    print( sum_valid_expressions(expressions, ['+', '*', '||']))
+    print(solution(INPUT_FILE))
@@ -1,31 +1,35 @@
-from typing import List, Tuple
+from typing import List, Set, Tuple
+from aoc.grid import Grid
+from aoc.instrument import hot
+from . import INPUT_FILE
 
-def read_input(file_path: str) -> List[List[str]]:
+FREQUENCIES = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+
+def read_input(file_path: str) -> Grid:
     """
-    Reads the input file and returns its contents as a list of lists of strings.
+    Reads the input file and returns its contents as a grid.
 
     Args:
         file_path (str): The path to the input file.
 
     Returns:
-        List[List[str]]: A list where each element is a list of characters from a line in the file.
+        Grid: The antenna map.
     """
-    with open(file_path) as f:
-        return [list(line.strip()) for line in f]
+    return Grid.from_file(file_path)
 
-def find_character(grid: List[List[str]], char: str) -> List[Tuple[int, int]]:
+def find_character(grid: Grid, char: str) -> List[Tuple[int, int]]:
     """
-    Finds all occurrences of a specified character in a 2D grid.
+    Finds all occurrences of a specified character in a grid.
 
     Args:
-        grid (List[List[str]]): A 2D list representing the grid of characters.
+        grid (Grid): The grid of characters.
         char (str): The character to search for in the grid.
 
     Returns:
         List[Tuple[int, int]]: A list of tuples where each tuple contains the 
         row and column indices of an occurrence of the specified character.
     """
-    return [(i, j) for i, row in enumerate(grid) for j, c in enumerate(row) if c == char]
+    return [grid.coords(i) for i in grid.find_all(char)]
 
 def get_pairs(positions: List[Tuple[int, int]]) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
     """
@@ -54,6 +58,7 @@ def get_direction(pair: Tuple[Tuple[int, int], Tuple[int, int]]) -> Tuple[int, i
     (x1, y1), (x2, y2) = pair
     return (x2 - x1, y2 - y1)
 
+@hot
 def apply_direction(pair: Tuple[Tuple[int, int], Tuple[int, int]]) -> Tuple[int, int]:
     """
     Applies a directional movement to the second coordinate in the given pair.
@@ -71,56 +76,69 @@ def apply_direction(pair: Tuple[Tuple[int, int], Tuple[int, int]]) -> Tuple[int,
     dx, dy = get_direction(pair)
     return (x2 + dx, y2 + dy)
 
-def apply_directions(grid: List[List[str]], char: str) -> List[List[str]]:
+def apply_directions(grid: Grid, char: str) -> Set[int]:
     """
     Applies directions to a grid based on the positions of a specified character.
 
     Args:
-        grid (List[List[str]]): A 2D list representing the grid.
+        grid (Grid): The grid.
         char (str): The character to find in the grid.
 
     Returns:
-        List[List[str]]: A new grid with directions applied, where certain positions are marked with '#'.
+        Set[int]: The flat indices of the antinodes inside the grid.
     """
     positions = find_character(grid, char)
     pairs = get_pairs(positions)
-    new_grid = [row[:] for row in grid]
+    antinodes = set()
     for pair in pairs:
         x, y = apply_direction(pair)
-        if 0 <= x < len(grid) and 0 <= y < len(grid[0]):
-            new_grid[x][y] = '#'
-    return new_grid
+        if grid.contains(x, y):
+            antinodes.add(grid.index(x, y))
+    return antinodes
 
-def apply_all_directions(grid: List[List[str]], apply_func=apply_directions) -> List[List[List[str]]]:
+def apply_all_directions(grid: Grid, apply_func=apply_directions) -> List[Set[int]]:
     """
     Applies a given function to a grid for each character in the alphanumeric set.
 
     Args:
-        grid (List[List[str]]): A 2D list representing the grid to which the function will be applied.
-        apply_func (Callable[[List[List[str]], str], List[List[str]]], optional): 
+        grid (Grid): The grid to which the function will be applied.
+        apply_func (Callable[[Grid, str], Set[int]], optional): 
             The function to apply to the grid for each character. Defaults to apply_directions.
 
     Returns:
-        List[List[List[str]]]: A list of 2D lists, each representing the grid after applying the function 
-        to each character in the alphanumeric set.
+        List[Set[int]]: The antinode locations found for each character in the alphanumeric set.
     """
-    return [apply_func(grid, char) for char in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789']
+    return [apply_func(grid, char) for char in FREQUENCIES]
 
-def count_unique_locations(grids: List[List[List[str]]], include_chars: bool = False) -> int:
+def count_unique_locations(grid: Grid, antinodes: List[Set[int]], include_chars: bool = False) -> int:
     """
-    Counts the number of unique locations in a 3D grid where '#' is present.
+    Counts the number of unique antinode locations.
 
     Args:
-        grids (List[List[List[str]]]): A 3D list representing multiple 2D grids.
-        include_chars (bool, optional): If True, includes alphanumeric characters in the count. Defaults to False.
+        grid (Grid): The grid the antinodes were found in.
+        antinodes (List[Set[int]]): The antinode locations for each frequency.
+        include_chars (bool, optional): If True, includes the antenna locations in the count. Defaults to False.
 
     Returns:
-        int: The number of unique locations where the character '#' or alphanumeric characters (if include_chars is True) are present.
+        int: The number of unique locations that hold an antinode or an antenna (if include_chars is True).
     """
-    unique_locations = {(i, j) for grid in grids for i, row in enumerate(grid) for j, c in enumerate(row) if c == '#' or (include_chars and c.isalnum())}
+    unique_locations = set().union(*antinodes)
+    if include_chars:
+        unique_locations.update(i for char in FREQUENCIES for i in grid.find_all(char))
     return len(unique_locations)
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of unique antinode locations.
+    """
+    grid = read_input(file_path)
+    return count_unique_locations(grid, apply_all_directions(grid))
+
 if __name__ == "__main__":
-    grid = read_input('input.txt')
-    count = count_unique_locations(apply_all_directions(grid))
-    print(count)
+    print(solution(INPUT_FILE))
@@ -1,39 +1,51 @@
-from typing import List, Tuple
-from part1 import read_input, find_character, get_pairs, apply_direction, apply_all_directions, count_unique_locations
+from typing import Set
+from aoc.grid import Grid
+from .part1 import read_input, find_character, get_pairs, apply_direction, apply_all_directions, count_unique_locations
+from . import INPUT_FILE
 
-def apply_directions(grid: List[List[str]], char: str) -> List[List[str]]:
+def apply_directions(grid: Grid, char: str) -> Set[int]:
     """
     Applies directions to a grid based on the positions of a specified character.
 
     Args:
-        grid (List[List[str]]): A 2D list representing the grid.
+        grid (Grid): The grid.
         char (str): The character to find in the grid and apply directions from.
 
     Returns:
-        List[List[str]]: A new grid with directions applied, where certain positions are marked with '#'.
+        Set[int]: The flat indices of the antinodes inside the grid.
 
     The function performs the following steps:
     1. Finds all positions of the specified character in the grid.
     2. Generates pairs of these positions.
-    3. Creates a copy of the original grid.
-    4. For each pair, applies directions to mark positions in the new grid with '#'.
-    5. Ensures that the new positions are within the bounds of the grid.
+    3. For each pair, repeatedly applies the direction and records every position reached.
+    4. Stops once a new position falls outside the bounds of the grid.
     """
     positions = find_character(grid, char)
     pairs = get_pairs(positions)
-    new_grid = [row.copy() for row in grid]
+    antinodes = set()
     for pair in pairs:
         while True:
             new_pos = apply_direction(pair)
             x, y = new_pos
-            if 0 <= x < len(grid) and 0 <= y < len(grid[0]):
-                new_grid[x][y] = '#'
+            if grid.contains(x, y):
+                antinodes.add(grid.index(x, y))
                 pair = (pair[1], new_pos)
             else:
                 break
-    return new_grid
+    return antinodes
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of unique antinode locations including resonant harmonics.
+    """
+    grid = read_input(file_path)
+    return count_unique_locations(grid, apply_all_directions(grid, apply_directions), include_chars=True)
 
 if __name__ == "__main__":
-    grid = read_input('input.txt')
-    count = count_unique_locations(apply_all_directions(grid, apply_directions), include_chars=True)
-    print(count)
\ No newline at end of file
+    print(solution(INPUT_FILE))
@@ -1,4 +1,10 @@
-from typing import List
+import os
+from array import array
+from itertools import accumulate
+from typing import BinaryIO, Iterator, Tuple
+from . import INPUT_FILE
+
+DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
 
 def read_input(file_path: str) -> str:
     """
@@ -13,79 +19,143 @@ def read_input(file_path: str) -> str:
     with open(file_path) as f:
         return f.read()
 
-def generate_disk_map(input: str) -> List[str]:
+def parse_extents(disk: str) -> Tuple[array, array, array, array]:
     """
-    Generates a disk map based on the input string.
+    Turns a disk map into file and free-space extents, without expanding it into blocks.
+
+    File i starts at file_starts[i] and spans file_lengths[i] blocks; free span i is the gap
+    right after file i.
 
     Args:
-        input (str): A string where each character represents a number. 
-                     Even-indexed characters determine the number of times 
-                     the corresponding index divided by 2 should be repeated 
-                     in the disk map. Odd-indexed characters determine the 
-                     number of dots to be added to the disk map.
+        disk (str): The disk map, alternating file lengths and free-space lengths.
 
     Returns:
-        List[str]: A list of strings representing the generated disk map.
+        Tuple[array, array, array, array]: The file starts, file lengths, free-span starts and free-span lengths.
     """
-    disk_map = []
-    for i, val in enumerate(input):
-        disk_map.extend([str(i // 2)] * int(val) if i % 2 == 0 else ['.'] * int(val))
-    return disk_map
+    lengths = disk.strip().encode().translate(DIGITS)
+    starts = array('q', accumulate(lengths, initial=0))
+    return starts[0::2][:(len(lengths) + 1) // 2], array('B', lengths[0::2]), starts[1::2][:len(lengths) // 2], array('B', lengths[1::2])
 
-def find_first_non_empty_from_end(disk_map: List[str]) -> int:
+def extent_checksum(file_id: int, start: int, length: int) -> int:
     """
-    Finds the index of the first non-empty element from the end of the list.
+    Calculates the checksum contribution of `length` blocks of a file placed from `start` on.
 
     Args:
-        disk_map (List[str]): A list of strings representing the disk map.
+        file_id (int): The ID of the file.
+        start (int): The position of the first block.
+        length (int): The number of blocks.
 
     Returns:
-        int: The index of the first non-empty element from the end of the list.
-             Returns -1 if all elements are empty (i.e., '.').
+        int: The sum of position times file ID over the blocks.
     """
-    for i in range(len(disk_map) - 1, -1, -1):
-        if disk_map[i] != '.':
-            return i
-    return -1
+    return file_id * (start * length + length * (length - 1) // 2)
 
-def compact_file(disk_map: List[str]) -> List[str]:
+def read_digits_forward(f: BinaryIO, end: int, chunk_size: int) -> Iterator[int]:
     """
-    Compacts the given disk map by moving all non-empty blocks to the beginning
-    and all free spaces ('.') to the end.
+    Reads the digits of a disk map file from the start, one chunk at a time.
+
     Args:
-        disk_map (List[str]): A list of strings representing the disk map, where
-                              each string is either a non-empty block or a free space ('.').
-    Returns:
-        List[str]: The compacted disk map with all non-empty blocks at the beginning
-                   and all free spaces at the end.
+        f (BinaryIO): The file, opened in binary mode.
+        end (int): The offset to stop reading at.
+        chunk_size (int): The number of bytes to read at once.
+
+    Yields:
+        int: The digit values in file order.
     """
-    first_free_space_index = disk_map.index('.')
-    end_block_index = find_first_non_empty_from_end(disk_map)
-    
-    while first_free_space_index < end_block_index:
-        disk_map[first_free_space_index], disk_map[end_block_index] = disk_map[end_block_index], disk_map[first_free_space_index]
-        first_free_space_index = disk_map.index('.', first_free_space_index + 1)
-        end_block_index = find_first_non_empty_from_end(disk_map)
-    
-    return disk_map
-
-def calculate_checksum(compact_file: List[str]) -> int:
+    f.seek(0)
+    offset = 0
+    while offset < end:
+        chunk = f.read(min(chunk_size, end - offset))
+        if not chunk:
+            return
+        offset += len(chunk)
+        yield from chunk.translate(DIGITS)
+
+def read_digits_backward(f: BinaryIO, end: int, chunk_size: int) -> Iterator[int]:
+    """
+    Reads the digits of a disk map file from the end, one chunk at a time.
+
+    Args:
+        f (BinaryIO): The file, opened in binary mode.
+        end (int): The offset to start reading backward from.
+        chunk_size (int): The number of bytes to read at once.
+
+    Yields:
+        int: The digit values in reverse file order.
     """
-    Calculate the checksum of a compact file.
+    offset = end
+    while offset > 0:
+        start = max(offset - chunk_size, 0)
+        f.seek(start)
+        chunk = f.read(offset - start)
+        offset = start
+        yield from reversed(chunk.translate(DIGITS))
 
-    The checksum is calculated by summing the product of the index and the integer value
-    of each element in the list, excluding elements that are '.'.
+def stream_checksum(file_path: str, chunk_size: int = 1 << 16) -> int:
+    """
+    Computes the part 1 checksum while reading the disk map from both ends, in constant memory.
+
+    One cursor walks the disk map forward through files and free spans, the other walks it
+    backward through the files whose blocks fill those spans, so no more than one chunk per
+    cursor is held in memory.
+
+    Args:
+        file_path (str): The path to the disk map.
+        chunk_size (int, optional): The number of bytes each cursor reads at once. Defaults to 64 KiB.
+
+    Returns:
+        int: The filesystem checksum after compacting individual blocks.
+    """
+    with open(file_path, 'rb') as forward, open(file_path, 'rb') as backward:
+        end = forward.seek(0, os.SEEK_END)
+        # Ignore trailing whitespace such as the final newline
+        while end:
+            forward.seek(end - 1)
+            if forward.read(1).isdigit():
+                break
+            end -= 1
+        if not end:
+            return 0
+        heads = read_digits_forward(forward, end, chunk_size)
+        tails = read_digits_backward(backward, end, chunk_size)
+        # The last file is the last digit at an even index
+        right = (end - 1) // 2
+        if (end - 1) % 2:
+            next(tails)
+        remaining = next(tails)
+        checksum = pos = left = 0
+        while True:
+            length = next(heads)
+            if left == right:
+                # Only the blocks of the last file that were not moved stay in place
+                return checksum + extent_checksum(left, pos, remaining)
+            checksum += extent_checksum(left, pos, length)
+            pos += length
+            space = next(heads)
+            while space and right > left:
+                moved = min(space, remaining)
+                checksum += extent_checksum(right, pos, moved)
+                pos, space, remaining = pos + moved, space - moved, remaining - moved
+                if not remaining:
+                    right -= 1
+                    next(tails)
+                    remaining = next(tails)
+            if right == left:
+                return checksum
+            pos += space
+            left += 1
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
 
     Args:
-        compact_file (List[str]): A list of strings representing the compact file.
+        file_path (str): The path to the input file.
 
     Returns:
-        int: The calculated checksum.
+        int: The filesystem checksum after compacting individual blocks.
     """
-    return sum(i * int(val) for i, val in enumerate(compact_file) if val != '.')
+    return stream_checksum(file_path)
 
 if __name__ == "__main__":
-    input_data = read_input('input.txt')
-    disk_map = generate_disk_map(input_data)
-    compact = compact_file(disk_map)
-    print(calculate_checksum(compact))
+    print(solution(INPUT_FILE))
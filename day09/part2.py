@@ -1,71 +1,99 @@
-from typing import List, Tuple
-from part1 import read_input, generate_disk_map, calculate_checksum
+import heapq
+from array import array
+from typing import List, Optional
+from aoc.instrument import hot
+from .part1 import read_input, parse_extents, extent_checksum
+from . import INPUT_FILE
 
-def find_starting_index(disk_map: List[str], num: int) -> int:
+# Free spans and files are at most nine blocks long, one digit of the disk map
+MAX_LENGTH = 9
+
+def index_free_spans(free_starts: array, free_lengths: array) -> List[List[int]]:
     """
-    Finds the starting index of the first sequence of `num` consecutive '.' characters in the given disk map.
+    Indexes the free spans by length.
 
     Args:
-        disk_map (List[str]): A list of strings representing the disk map.
-        num (int): The number of consecutive '.' characters to find.
+        free_starts (array): The start of every free span.
+        free_lengths (array): The length of every free span.
 
     Returns:
-        int: The starting index of the first sequence of `num` consecutive '.' characters.
-             Returns -1 if no such sequence is found.
+        List[List[int]]: For every length 0 to 9, a min-heap of the starts of the free spans of that length.
+            The heap for length 0 stays empty.
     """
-    count = 0
-    for i, val in enumerate(disk_map):
-        if val == '.':
-            count += 1
-            if count == num:
-                return i - (count - 1)
-        else:
-            count = 0
-    return -1
-
-def find_group(disk_map: List[str], char: str) -> Tuple[int, int]:
+    heaps: List[List[int]] = [[] for _ in range(MAX_LENGTH + 1)]
+    for start, length in zip(free_starts, free_lengths):
+        if length:
+            heaps[length].append(start)
+    # The starts were appended in increasing order, so every list already is a heap
+    return heaps
+
+@hot
+def find_free_span(heaps: List[List[int]], length: int, limit: int) -> Optional[int]:
     """
-    Finds the start and end indices of a contiguous group of the specified character in the disk map.
+    Takes the leftmost free span that can hold a file and lies left of a position.
+
+    Only the smallest start of each length from `length` to 9 is a candidate, so this peeks
+    at no more than nine heaps. Whatever part of the span the file does not use goes back
+    into the heap for its new length.
 
     Args:
-        disk_map (List[str]): A list of characters representing the disk map.
-        char (str): The character to find in the disk map.
+        heaps (List[List[int]]): The free spans by length from index_free_spans; updated in place.
+        length (int): The length of the file.
+        limit (int): The position the span has to start before.
 
     Returns:
-        Tuple[int, int]: A tuple containing the start and end indices (inclusive) of the contiguous group of the specified character.
+        Optional[int]: The start of the span, or None if no span fits.
     """
-    start = disk_map.index(char)
-    end = start
-    while end < len(disk_map) and disk_map[end] == char:
-        end += 1
-    return start, end - 1
+    best, best_length = limit, 0
+    for span_length in range(length, MAX_LENGTH + 1):
+        heap = heaps[span_length]
+        if heap and heap[0] < best:
+            best, best_length = heap[0], span_length
+    if not best_length:
+        return None
+    heapq.heappop(heaps[best_length])
+    if best_length > length:
+        heapq.heappush(heaps[best_length - length], best + length)
+    return best
 
-def compact_file(disk_map: List[str]) -> List[str]:
+def compact_files(file_starts: array, file_lengths: array, free_starts: array, free_lengths: array) -> int:
     """
-    Compacts the given disk map by moving groups of contiguous blocks to the first available free space.
+    Moves whole files, highest ID first, to the leftmost free span that fits them, and checksums the result.
+
+    A file only ever moves left, so the space it leaves behind is never used by a later
+    (lower) file and never needs to be indexed.
+
     Args:
-        disk_map (List[str]): A list of strings representing the disk map, where each string is a block ID.
+        file_starts (array): The start of every file.
+        file_lengths (array): The length of every file.
+        free_starts (array): The start of the free span after every file.
+        free_lengths (array): The length of the free span after every file.
+
     Returns:
-        List[str]: The compacted disk map with groups moved to the first available free spaces.
-    The function works by iterating through the disk map in reverse order of block IDs, finding groups of contiguous blocks,
-    and moving them to the first available free space if possible.
+        int: The filesystem checksum after compacting.
     """
-    current_id = int(disk_map[-1])
+    heaps = index_free_spans(free_starts, free_lengths)
+    checksum = 0
+    for file_id in range(len(file_lengths) - 1, -1, -1):
+        start, length = file_starts[file_id], file_lengths[file_id]
+        if length:
+            span = find_free_span(heaps, length, start)
+            if span is not None:
+                start = span
+        checksum += extent_checksum(file_id, start, length)
+    return checksum
 
-    while current_id > 0:
-        start, end = find_group(disk_map, str(current_id))
-        group_length = end - start + 1
-        first_free_space_index = find_starting_index(disk_map, group_length)
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
 
-        if first_free_space_index != -1 and first_free_space_index < start:
-            disk_map[first_free_space_index:first_free_space_index + group_length], disk_map[start:end + 1] = disk_map[start:end + 1], disk_map[first_free_space_index:first_free_space_index + group_length]
-        
-        current_id -= 1
-    
-    return disk_map
+    Returns:
+        int: The filesystem checksum after compacting whole files.
+    """
+    return compact_files(*parse_extents(read_input(file_path)))
 
 if __name__ == "__main__":
-    input_data = read_input('input.txt')
-    disk_map = generate_disk_map(input_data)
-    compacted_disk_map = compact_file(disk_map)
-    print(calculate_checksum(compacted_disk_map))
+    print(solution(INPUT_FILE))
@@ -1,131 +1,111 @@
-from typing import List, Tuple
+from typing import List
+from aoc.grid import Grid
+from aoc.instrument import hot
+from . import INPUT_FILE
 
-def read_input(file_path: str) -> List[List[int]]:
+TOP = ord('9')
+
+def read_input(file_path: str) -> Grid:
     """
-    Reads a file and converts its contents into a list of lists of integers.
+    Reads a file and returns its contents as a grid of heights.
 
-    Each line in the file is stripped of leading and trailing whitespace, and each character
-    in the line is converted to an integer if it is a digit. If a character is not a digit,
-    it is converted to float('inf').
+    Heights are kept as the digit characters '0' to '9'; any other character (and the border)
+    never equals a digit plus one, so it can never be part of a trail.
 
     Args:
         file_path (str): The path to the input file.
 
     Returns:
-        List[List[int]]: A list of lists where each inner list represents a line from the file
-                         with characters converted to integers or float('inf').
+        Grid: The topographic map.
     """
-    with open(file_path) as f:
-        return [[int(num) if num.isdigit() else float('inf') for num in line.strip()] for line in f]
+    return Grid.from_file(file_path)
 
-def get_neighbors(grid: List[List[int]], x: int, y: int) -> List[Tuple[int, int]]:
+@hot
+def get_valid_neighbors(grid: Grid, pos: int) -> List[int]:
     """
-    Get the neighboring coordinates of a given cell in a 2D grid.
-
-    Args:
-        grid (List[List[int]]): The 2D grid represented as a list of lists of integers.
-        x (int): The x-coordinate (row index) of the cell.
-        y (int): The y-coordinate (column index) of the cell.
-
-    Returns:
-        List[Tuple[int, int]]: A list of tuples representing the coordinates of the neighboring cells.
-    """
-    rows, cols = len(grid), len(grid[0])
-    neighbors = []
-    if x > 0:
-        neighbors.append((x-1, y))
-    if x < rows - 1:
-        neighbors.append((x+1, y))
-    if y > 0:
-        neighbors.append((x, y-1))
-    if y < cols - 1:
-        neighbors.append((x, y+1))
-    return neighbors
-
-def get_valid_neighbors(grid: List[List[int]], x: int, y: int) -> List[Tuple[int, int]]:
-    """
-    Given a 2D grid and a specific cell (x, y), this function returns a list of 
+    Given a grid and a specific cell, this function returns a list of 
     neighboring cells that have a value exactly one greater than the value of 
     the specified cell.
 
     Args:
-        grid (List[List[int]]): A 2D list representing the grid.
-        x (int): The x-coordinate (row index) of the specified cell.
-        y (int): The y-coordinate (column index) of the specified cell.
+        grid (Grid): The topographic map.
+        pos (int): The flat index of the specified cell.
 
     Returns:
-        List[Tuple[int, int]]: A list of tuples, where each tuple represents 
-        the coordinates (x, y) of a neighboring cell that has a value exactly 
-        one greater than the value of the specified cell.
+        List[int]: The flat indices of the neighboring cells that have a value
+        exactly one greater than the value of the specified cell.
     """
-    value = grid[x][y]
-    neighbors = get_neighbors(grid, x, y)
-    return [neighbor for neighbor in neighbors if grid[neighbor[0]][neighbor[1]] == value + 1]
+    cells = grid.cells
+    value = cells[pos] + 1
+    return [pos + step for step in grid.directions if cells[pos + step] == value]
 
-def find_zeros(grid: List[List[int]]) -> List[Tuple[int, int]]:
+def find_zeros(grid: Grid) -> List[int]:
     """
-    Find all positions of zeros in a 2D grid.
+    Find all positions of zeros in a grid.
 
     Args:
-        grid (List[List[int]]): A 2D list of integers representing the grid.
+        grid (Grid): The topographic map.
 
     Returns:
-        List[Tuple[int, int]]: A list of tuples where each tuple represents the 
-        (row, column) position of a zero in the grid.
+        List[int]: The flat indices of the zeros in the grid.
     """
-    return [(i, j) for i in range(len(grid)) for j in range(len(grid[0])) if grid[i][j] == 0]
+    return grid.find_all('0')
 
-def find_top(grid: List[List[int]], x: int, y: int) -> int:
+def find_top(grid: Grid, start: int) -> int:
     """
     Finds the number of cells with the value 9 starting from a given cell in a grid.
 
     Args:
-        grid (List[List[int]]): A 2D list representing the grid of integers.
-        x (int): The x-coordinate (row index) of the starting cell.
-        y (int): The y-coordinate (column index) of the starting cell.
+        grid (Grid): The topographic map.
+        start (int): The flat index of the starting cell.
 
     Returns:
         int: The count of cells with the value 9 that are reachable from the starting cell.
     """
-    stack = [(x, y)]
-    visited = set()
+    cells = grid.cells
+    stack = [start]
+    visited = {start}
     top_count = 0
 
     while stack:
-        cx, cy = stack.pop()
-        if (cx, cy) in visited:
-            continue
-
-        visited.add((cx, cy))
-        value = grid[cx][cy]
-
-        if value == 9:
+        pos = stack.pop()
+        if cells[pos] == TOP:
             top_count += 1
             continue
 
-        neighbors = get_valid_neighbors(grid, cx, cy)
-        for neighbor in neighbors:
+        for neighbor in get_valid_neighbors(grid, pos):
             if neighbor not in visited:
+                visited.add(neighbor)
                 stack.append(neighbor)
 
     return top_count
 
-def find_top_sum(grid: List[List[int]], find_top_func=find_top) -> int:
+def find_top_sum(grid: Grid, find_top_func=find_top) -> int:
     """
     Calculate the sum of the top values found by a given function for each zero in the grid.
 
     Args:
-        grid (List[List[int]]): A 2D list of integers representing the grid.
-        find_top_func (Callable[[List[List[int]], int, int], int], optional): 
-            A function that takes the grid and the coordinates of a zero and returns the top value. 
+        grid (Grid): The topographic map.
+        find_top_func (Callable[[Grid, int], int], optional): 
+            A function that takes the grid and the flat index of a zero and returns the top value. 
             Defaults to find_top.
 
     Returns:
         int: The sum of the top values for each zero in the grid.
     """
-    zeros = find_zeros(grid)
-    return sum(find_top_func(grid, zero[0], zero[1]) for zero in zeros)
+    return sum(find_top_func(grid, zero) for zero in find_zeros(grid))
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The sum of the scores of all trailheads.
+    """
+    return find_top_sum(read_input(file_path))
 
 if __name__ == "__main__":
-    input_data = read_input('input.txt')
-    print(find_top_sum(input_data))
+    print(solution(INPUT_FILE))
@@ -1,32 +1,45 @@
-from typing import List, Tuple
-from part1 import read_input, get_valid_neighbors, find_top_sum
+from aoc.grid import Grid
+from aoc.instrument import hot
+from .part1 import read_input, get_valid_neighbors, find_top_sum, TOP
+from . import INPUT_FILE
 
-def find_top(grid: List[List[int]], x, y, visited = set()) -> int:
+@hot
+def find_top(grid: Grid, start: int) -> int:
     """
-    Recursively finds the sum of values in a grid starting from a given cell (x, y) 
-    and exploring its valid neighbors, stopping when a cell with value 9 is encountered.
+    Counts the distinct hiking trails from a given cell to any cell with value 9.
+
+    Heights strictly increase along a trail, so a trail can never revisit a cell and no
+    visited set is needed.
+
     Args:
-        grid (List[List[int]]): A 2D list representing the grid of integers.
-        x (int): The x-coordinate (row index) of the starting cell.
-        y (int): The y-coordinate (column index) of the starting cell.
-        visited (set, optional): A set of tuples representing the coordinates of visited cells. Defaults to an empty set.
+        grid (Grid): The topographic map.
+        start (int): The flat index of the starting cell.
+
     Returns:
-        int: The sum of values from the starting cell to the cells explored, stopping at cells with value 9.
+        int: The number of distinct trails from the starting cell to a cell with value 9.
     """
-    value = grid[x][y]
-
-    if value == 9:
-        return 1
-    
-    neighbors = get_valid_neighbors(grid, x, y)
-    sum = 0
-    for neighbor in neighbors:
-        if (neighbor[0], neighbor[1]) in visited:
-            continue
+    cells = grid.cells
+    stack = [start]
+    trails = 0
+    while stack:
+        pos = stack.pop()
+        if cells[pos] == TOP:
+            trails += 1
         else:
-            sum += find_top(grid, neighbor[0], neighbor[1], visited | {(x, y)})
-    return sum
+            stack.extend(get_valid_neighbors(grid, pos))
+    return trails
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The sum of the ratings of all trailheads.
+    """
+    return find_top_sum(read_input(file_path), find_top)
 
 if __name__ == "__main__":
-    input_data = read_input('input.txt')
-    print(find_top_sum(input_data, find_top))
\ No newline at end of file
+    print(solution(INPUT_FILE))
@@ -1,6 +1,24 @@
-from typing import List
-from collections import Counter, defaultdict
-from functools import lru_cache
+import json
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Iterable, List, Tuple
+import numpy as np
+from aoc.instrument import hot
+from . import INPUT_FILE
+
+# POWERS_OF_TEN[k] is 10 ** k; extended as larger stones show up
+POWERS_OF_TEN = [1]
+
+# Counts from here on could overflow int64 within one blink, so blink_counts switches to Python integers
+INT64_LIMIT = 1 << 61
+
+# Every distinct stone value reachable from the initial stones, numbered by first appearance.
+# values[i] is the value of stone i, ids maps values back to numbers, and left[i] and right[i]
+# are the numbers of the stones it turns into when blinking (right[i] is -1 if it does not split).
+StoneTable = namedtuple('StoneTable', ['values', 'ids', 'left', 'right'])
+
+# Version of the file format written by StoneMemo.save
+MEMO_VERSION = 1
 
 def read_input(file_path: str) -> List[int]:
     """
@@ -15,66 +33,268 @@ def read_input(file_path: str) -> List[int]:
     with open(file_path) as f:
         return [int(num) for num in f.read().strip().split()]
 
-@lru_cache(maxsize=None)
-def process_single_stone(stone: int) -> List[int]:
+def count_digits(stone: int) -> int:
+    """
+    Counts the decimal digits of a positive number without converting it to a string.
+
+    Args:
+        stone (int): The number.
+
+    Returns:
+        int: The number of digits.
+    """
+    while stone >= POWERS_OF_TEN[-1]:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return bisect_right(POWERS_OF_TEN, stone)
+
+@hot
+def process_single_stone(stone: int) -> Tuple[int, ...]:
     """
     Processes a single stone based on its value.
 
-    If the stone is 0, returns a list containing 1.
-    If the length of the stone's string representation is even, splits the stone into two halves and returns them as a list of integers.
-    If the length of the stone's string representation is odd, returns a list containing the stone multiplied by 2024.
+    If the stone is 0, it becomes 1.
+    If it has an even number of digits, it splits into its left and right halves.
+    Otherwise it is multiplied by 2024.
 
     Args:
         stone (int): The stone to be processed.
 
     Returns:
-        List[int]: A list of integers resulting from the processing of the stone.
+        Tuple[int, ...]: The stones resulting from the processing of the stone.
     """
     if stone == 0:
-        return [1]
-    elif len(str(stone)) % 2 == 0:
-        str_stone = str(stone)
-        mid = len(str_stone) // 2
-        left_half = int(str_stone[:mid])
-        right_half = int(str_stone[mid:])
-        return [left_half, right_half]
-    else:
-        return [stone * 2024]
-
-def process_stones(stones: Counter) -> Counter:
-    """
-    Processes a collection of stones and returns a new collection with the processed stones.
+        return (1,)
+    digits = count_digits(stone)
+    if digits % 2 == 0:
+        return divmod(stone, POWERS_OF_TEN[digits // 2])
+    return (stone * 2024,)
+
+def build_stone_table(stones: Iterable[int]) -> StoneTable:
+    """
+    Numbers every stone value reachable from the given stones and records what each one turns into.
+
     Args:
-        stones (Counter): A Counter object where keys are stone types and values are their counts.
+        stones (Iterable[int]): The initial stones.
+
     Returns:
-        Counter: A Counter object with the processed stones and their counts.
+        StoneTable: The transition table.
     """
-    result = defaultdict(int)
-    
-    for stone, count in stones.items():
-        processed = process_single_stone(stone)
-        for processed_stone in processed:
-            result[processed_stone] += count
-    
-    return Counter(result)
+    values = list(dict.fromkeys(stones))
+    ids = {value: i for i, value in enumerate(values)}
+    left, right = [], []
+    # New values are appended while iterating, so every reachable value gets its own transitions
+    for value in values:
+        children = process_single_stone(value)
+        for child in children:
+            if child not in ids:
+                ids[child] = len(values)
+                values.append(child)
+        left.append(ids[children[0]])
+        right.append(ids[children[1]] if len(children) > 1 else -1)
+    return StoneTable(values, ids, np.array(left, dtype=np.int64), np.array(right, dtype=np.int64))
 
-def process_stones_n_times(stones: List[int], n: int) -> Counter:
+@hot
+def blink_counts(table: StoneTable, counts: np.ndarray, n: int) -> np.ndarray:
     """
-    Processes a list of stones a specified number of times and returns the result as a Counter.
+    Blinks a number of times, moving the count of every stone to the stones it turns into.
 
     Args:
-        stones (List[int]): A list of integers representing stones.
-        n (int): The number of times to process the stones.
+        table (StoneTable): The transition table.
+        counts (np.ndarray): The number of stones of each value, indexed like table.values.
+        n (int): The number of blinks.
 
     Returns:
-        Counter: A Counter object representing the processed stones.
+        np.ndarray: The number of stones of each value after blinking; int64, or Python integers
+            once the counts could overflow it.
     """
-    result = Counter(stones)
+    split = table.right >= 0
+    right = table.right[split]
     for _ in range(n):
-        result = process_stones(result)
-    return result
+        # A blink at most doubles the number of stones
+        if counts.dtype != object and int(counts.sum()) >= INT64_LIMIT:
+            counts = counts.astype(object)
+        blinked = np.zeros_like(counts)
+        np.add.at(blinked, table.left, counts)
+        np.add.at(blinked, right, counts[split])
+        counts = blinked
+    return counts
+
+def count_stones(stones: List[int], n: int) -> int:
+    """
+    Counts the stones after blinking a number of times.
+
+    Args:
+        stones (List[int]): The initial stones.
+        n (int): The number of blinks.
+
+    Returns:
+        int: The number of stones.
+    """
+    table = build_stone_table(stones)
+    counts = np.zeros(len(table.values), dtype=np.int64)
+    np.add.at(counts, [table.ids[stone] for stone in stones], 1)
+    return int(blink_counts(table, counts, n).sum())
+
+class StoneMemo:
+    """
+    A persistent table of how many stones each stone value becomes after any number of blinks.
+
+    Row k holds, for every value in the stone table, the number of stones a single stone of
+    that value becomes after k blinks. Each row follows from the previous one through the
+    transition table, so answering a query for n blinks fills in rows up to n once, and every
+    later query up to that depth, for any stone already in the table, is a lookup.
+
+    Attributes:
+        table (StoneTable): The stone values known so far and their transitions.
+        rows (List[np.ndarray]): The stone counts after 0, 1, 2, ... blinks, indexed like table.values.
+    """
+
+    def __init__(self):
+        """
+        Creates an empty memo.
+        """
+        self.table = build_stone_table([])
+        self.rows = [np.ones(0, dtype=np.int64)]
+
+    def _learn(self, stones: Iterable[int]):
+        """
+        Adds new stone values to the table and computes their rows up to the current depth.
+
+        Args:
+            stones (Iterable[int]): The stones to make sure are in the table.
+        """
+        new_stones = [stone for stone in stones if stone not in self.table.ids]
+        if new_stones:
+            # Known values keep their numbers, since they come first and their children are known
+            self.table = build_stone_table(self.table.values + new_stones)
+            depth = len(self.rows) - 1
+            self.rows = [np.ones(len(self.table.values), dtype=np.int64)]
+            self._deepen(depth)
+
+    def _deepen(self, n: int):
+        """
+        Computes the rows up to `n` blinks.
+
+        Args:
+            n (int): The number of blinks.
+        """
+        left, right = self.table.left, self.table.right
+        split = right >= 0
+        while len(self.rows) <= n:
+            previous = self.rows[-1]
+            # A blink at most doubles the count of every stone
+            if previous.dtype != object and len(previous) and int(previous.max()) >= INT64_LIMIT:
+                previous = previous.astype(object)
+            row = previous[left]
+            row[split] += previous[right[split]]
+            self.rows.append(row)
+
+    def count(self, stone: int, n: int) -> int:
+        """
+        Counts the stones a single stone becomes after blinking a number of times.
+
+        Args:
+            stone (int): The stone.
+            n (int): The number of blinks.
+
+        Returns:
+            int: The number of stones.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        return self.counts(stone, [n])[0]
+
+    def counts(self, stone: int, ns: Iterable[int]) -> List[int]:
+        """
+        Counts the stones a single stone becomes after each of several numbers of blinks.
+
+        Args:
+            stone (int): The stone.
+            ns (Iterable[int]): The numbers of blinks.
+
+        Returns:
+            List[int]: The number of stones for every number of blinks, in the order given.
+
+        Raises:
+            ValueError: If any number of blinks is negative.
+        """
+        ns = list(ns)
+        if any(n < 0 for n in ns):
+            raise ValueError(f'Negative number of blinks: {min(ns)}')
+        self._learn([stone])
+        self._deepen(max(ns, default=0))
+        i = self.table.ids[stone]
+        return [int(self.rows[n][i]) for n in ns]
+
+    def count_all(self, stones: List[int], n: int) -> int:
+        """
+        Counts the stones a list of stones becomes after blinking a number of times.
+
+        Args:
+            stones (List[int]): The stones.
+            n (int): The number of blinks.
+
+        Returns:
+            int: The number of stones.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError(f'Negative number of blinks: {n}')
+        self._learn(stones)
+        self._deepen(n)
+        row = self.rows[n]
+        return sum(int(row[self.table.ids[stone]]) for stone in stones)
+
+    def save(self, path: str):
+        """
+        Writes the memo to a JSON file.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, 'w') as f:
+            json.dump({'version': MEMO_VERSION, 'values': self.table.values, 'rows': [row.tolist() for row in self.rows]}, f)
+            f.write('\n')
+
+    @classmethod
+    def load(cls, path: str) -> 'StoneMemo':
+        """
+        Reads a memo written by save.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            StoneMemo: The memo, with every row that was saved.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        if data.get('version') != MEMO_VERSION:
+            raise ValueError(f'Unsupported stone memo version in {path}: {data.get("version")}')
+        memo = cls()
+        memo.table = build_stone_table(data['values'])
+        if len(memo.table.values) != len(data['values']):
+            raise ValueError(f'Incomplete stone table in {path}')
+        memo.rows = [np.array(row, dtype=object if max(row, default=0) >= INT64_LIMIT else np.int64) for row in data['rows']]
+        return memo
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of stones after blinking 25 times.
+    """
+    return count_stones(read_input(file_path), 25)
 
 if __name__ == "__main__":
-    input_data = read_input('input.txt')
-    processed_stones = process_stones_n_times(input_data, 25)
-    print(sum(processed_stones.values()))
+    print(solution(INPUT_FILE))
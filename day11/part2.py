@@ -1,6 +1,17 @@
-from part1 import read_input, process_stones_n_times
+from .part1 import read_input, count_stones
+from . import INPUT_FILE
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of stones after blinking 75 times.
+    """
+    return count_stones(read_input(file_path), 75)
 
 if __name__ == "__main__":
-    input_data = read_input('input.txt')
-    processed_stones = process_stones_n_times(input_data, 75)
-    print(sum(processed_stones.values()))
+    print(solution(INPUT_FILE))
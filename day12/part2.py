@@ -1,12 +1,17 @@
-from typing import Tuple, Set, List
-from part1 import read_input, find_groups, find_perimeter_and_area
+from typing import List
+from aoc.grid import Grid
+from aoc.instrument import hot
+from .part1 import read_input, find_groups, find_perimeter_and_area
+from . import INPUT_FILE
 
-def count_sides(group: Set[Tuple[int, int]]) -> int:
+@hot
+def count_sides(grid: Grid, group: List[int]) -> int:
     """
-    Counts the number of sides (corners) in a given group of coordinates.
+    Counts the number of sides (corners) in a given group of cells.
 
     Args:
-        group (Set[Tuple[int, int]]): A set of tuples representing coordinates.
+        grid (Grid): The garden grid.
+        group (List[int]): The flat indices of the cells of a connected region.
 
     Returns:
         int: The total number of sides (corners) in the group.
@@ -14,22 +19,28 @@ def count_sides(group: Set[Tuple[int, int]]) -> int:
     The function considers both outer and inner corners:
     - Outer corners are counted when two adjacent cells are not in the group.
     - Inner corners are counted when two adjacent cells are in the group, but the diagonal cell is not.
+
+    Because the group is a connected region, a neighboring cell belongs to it exactly when it
+    has the same plant type, which lets the corners be counted from the cells alone.
     """
-    def count_corners_at(x, y):
-        s = 0
-        # Outer corners
-        s += ((x - 1, y) not in group and (x, y - 1) not in group)
-        s += ((x + 1, y) not in group and (x, y - 1) not in group)
-        s += ((x - 1, y) not in group and (x, y + 1) not in group)
-        s += ((x + 1, y) not in group and (x, y + 1) not in group)
-        # Inner corners
-        s += ((x - 1, y) in group and (x, y - 1) in group and (x - 1, y - 1) not in group)
-        s += ((x + 1, y) in group and (x, y - 1) in group and (x + 1, y - 1) not in group)
-        s += ((x - 1, y) in group and (x, y + 1) in group and (x - 1, y + 1) not in group)
-        s += ((x + 1, y) in group and (x, y + 1) in group and (x + 1, y + 1) not in group)
-        return s
-
-    return sum(count_corners_at(x, y) for x, y in group)
+    cells = grid.cells
+    plant_type = cells[group[0]]
+    north, east, south, west = grid.directions
+    # Each corner is a pair of orthogonal neighbors and the diagonal between them
+    corners = [(north, west, north + west), (south, west, south + west), (north, east, north + east), (south, east, south + east)]
+
+    sides = 0
+    for pos in group:
+        for a, b, diagonal in corners:
+            in_a = cells[pos + a] == plant_type
+            in_b = cells[pos + b] == plant_type
+            # Outer corner
+            if not in_a and not in_b:
+                sides += 1
+            # Inner corner
+            elif in_a and in_b and cells[pos + diagonal] != plant_type:
+                sides += 1
+    return sides
 
 def find_price_of_region(sides: int, area: int) -> int:
     """
@@ -44,12 +55,12 @@ def find_price_of_region(sides: int, area: int) -> int:
     """
     return sides * area
 
-def find_price_per_type(grid: List[str], plant_type: str) -> int:
+def find_price_per_type(grid: Grid, plant_type: str) -> int:
     """
     Calculate the total price for a specific plant type in a grid.
 
     Args:
-        grid (List[str]): A list of strings representing the grid.
+        grid (Grid): The garden grid.
         plant_type (str): The type of plant to calculate the price for.
 
     Returns:
@@ -58,24 +69,34 @@ def find_price_per_type(grid: List[str], plant_type: str) -> int:
     groups = find_groups(grid, plant_type)
     total = 0
     for group in groups:
-        _, area = find_perimeter_and_area(group)
-        sides = count_sides(group)
+        _, area = find_perimeter_and_area(grid, group)
+        sides = count_sides(grid, group)
         total += find_price_of_region(sides, area)
     return total
 
-def find_total_price(grid: List[str]) -> int:
+def find_total_price(grid: Grid) -> int:
     """
     Calculate the total price of all plant types in the given grid.
 
     Args:
-        grid (List[str]): A list of strings representing the grid, where each character
-                          corresponds to a plant type.
+        grid (Grid): The garden grid, where each cell holds a plant type.
 
     Returns:
         int: The total price of all plant types in the grid.
     """
     return sum(find_price_per_type(grid, plant_type) for plant_type in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The total fencing price using the number of sides.
+    """
+    return find_total_price(read_input(file_path))
+
 if __name__ == "__main__":
-    input_data = read_input('input.txt')
-    print(find_total_price(input_data))
+    print(solution(INPUT_FILE))
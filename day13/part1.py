@@ -1,7 +1,12 @@
 import re
 from typing import List, Tuple
 from collections import deque, namedtuple
+from aoc.parallel import parallel_starmap
+from aoc.cache import cached_parser, encode_int_records, decode_int_records
+from aoc.instrument import hot
+from . import INPUT_FILE
 
+@cached_parser(1, encode_int_records, decode_int_records)
 def parse_input(file_path: str) -> List[Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]]:
     """
     Parses the input file to extract coordinates for Button A, Button B, and the Prize.
@@ -34,6 +39,7 @@ def parse_input(file_path: str) -> List[Tuple[Tuple[int, int], Tuple[int, int],
 
 State = namedtuple('State', ['x', 'y', 'presses', 'a_presses', 'b_presses'])
 
+@hot
 def find_min_presses(button_a: Tuple[int, int], button_b: Tuple[int, int], prize: Tuple[int, int]) -> Tuple[int, int, int]:
     """
     Finds the minimum number of presses required to reach the prize coordinates using two buttons.
@@ -111,9 +117,19 @@ def find_total_cost(data: List[Tuple[Tuple[int, int], Tuple[int, int], Tuple[int
     Returns:
         int: The total cost calculated by summing the minimum costs of each tuple in the data list.
     """
-    return sum(find_min_cost(*d) for d in data)
+    return sum(parallel_starmap(find_min_cost, data))
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The fewest tokens needed to win every winnable prize.
+    """
+    return find_total_cost(parse_input(file_path))
 
 if __name__ == "__main__":
-    file_path = 'input.txt'
-    parsed_data = parse_input(file_path)
-    print(find_total_cost(parsed_data))
\ No newline at end of file
+    print(solution(INPUT_FILE))
@@ -1,6 +1,10 @@
 import re
 from typing import Tuple, List
+from aoc.cache import cached_parser, encode_int_records, decode_int_records
+from aoc.instrument import hot
+from . import INPUT_FILE
 
+@cached_parser(1, encode_int_records, decode_int_records)
 def parse_input(file_path: str) -> List[Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]]:
     """
     Parses the input file to extract button and prize coordinates.
@@ -31,6 +35,7 @@ def parse_input(file_path: str) -> List[Tuple[Tuple[int, int], Tuple[int, int],
 
     return results
 
+@hot
 def solve(scenario: Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]) -> int:
     """
     Solves the given scenario by finding integers a and b such that the linear combination
@@ -52,8 +57,17 @@ def solve(scenario: Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]) ->
     else:
         return 0
 
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The fewest tokens needed to win every winnable prize at the corrected positions.
+    """
+    return sum(solve(scenario) for scenario in parse_input(file_path))
+
 if __name__ == "__main__":
-    file_path = 'input.txt'
-    parsed_data = parse_input(file_path)
-    results = [solve(scenario) for scenario in parsed_data]
-    print(sum(results))
+    print(solution(INPUT_FILE))
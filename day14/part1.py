@@ -1,6 +1,10 @@
 import re
 from typing import List, Tuple
+from aoc.cache import cached_parser, encode_int_records, decode_int_records
+from aoc.instrument import hot
+from . import INPUT_FILE
 
+@cached_parser(1, encode_int_records, decode_int_records)
 def parse_input(file_path: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
     """
     Parses the input file to extract position and velocity coordinates.
@@ -20,6 +24,7 @@ def parse_input(file_path: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]
     with open(file_path, 'r') as file:
         return [((int(p_x), int(p_y)), (int(v_x), int(v_y))) for p_x, p_y, v_x, v_y in pattern.findall(file.read())]
 
+@hot
 def move_robot_n_times(position: Tuple[int, int], velocity: Tuple[int, int], width: int, length: int, n: int) -> Tuple[int, int]:
     """
     Moves the robot according to its velocity n number of times and wraps around the edges if it runs into the edge of the space.
@@ -105,12 +110,20 @@ def calculate_safety_factor(robots: List[Tuple[Tuple[int, int], Tuple[int, int]]
     q1, q2, q3, q4 = count_robots_in_quadrants(new_positions, width, length)
     return q1 * q2 * q3 * q4
 
+def solution(file_path: str, width: int = 101, length: int = 103, n: int = 100) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+        width (int, optional): The width of the space. Defaults to 101.
+        length (int, optional): The length of the space. Defaults to 103.
+        n (int, optional): The number of times to move the robots. Defaults to 100.
+
+    Returns:
+        int: The safety factor after moving the robots n times.
+    """
+    return calculate_safety_factor(parse_input(file_path), width, length, n)
+
 if __name__ == "__main__":
-    file_path = 'input.txt'
-    parsed_data = parse_input(file_path)
-    width = 101
-    length = 103
-    n = 100  # Number of times to move the robots
-
-    safety_factor = calculate_safety_factor(parsed_data, width, length, n)
-    print(f"Safety Factor: {safety_factor}")
+    print(f"Safety Factor: {solution(INPUT_FILE)}")
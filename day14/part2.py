@@ -1,6 +1,7 @@
 from typing import List, Tuple
-from part1 import parse_input, move_multiple_robots_n_times
+from .part1 import parse_input, move_multiple_robots_n_times
 from tqdm import tqdm
+from . import INPUT_FILE
 
 def find_easter_egg(robots: List[Tuple[Tuple[int, int], Tuple[int, int]]], width: int, length: int, max_steps: int) -> int:
     """
@@ -46,9 +47,23 @@ def display_positions(positions: List[Tuple[int, int]], width: int, length: int)
             grid[y][x] = '#'
     print('\n'.join(''.join(row) for row in grid))
 
+def solution(file_path: str, width: int = 101, length: int = 103, max_steps: int = 10000) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+        width (int, optional): The width of the grid. Defaults to 101.
+        length (int, optional): The length of the grid. Defaults to 103.
+        max_steps (int, optional): The maximum number of steps to simulate. Defaults to 10000.
+
+    Returns:
+        int: The step at which the robots display the Easter egg, or -1 if none is found.
+    """
+    return find_easter_egg(parse_input(file_path), width, length, max_steps)
+
 if __name__ == "__main__":
-    file_path = 'input.txt'
-    robots = parse_input(file_path)
+    robots = parse_input(INPUT_FILE)
     width = 101
     length = 103
     max_steps = 10000  # Maximum number of steps to simulate
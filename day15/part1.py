@@ -1,86 +1,81 @@
-import re
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+from aoc.grid import Grid, NORTH, EAST, SOUTH, WEST
+from aoc.instrument import hot
+from . import INPUT_FILE
 
-def parse_input(file_path: str) -> Tuple[List[List[str]], List[str]]:
+WALL, BOX, ROBOT, EMPTY = (ord(c) for c in '#O@.')
+DIRECTION_MAP = {'^': NORTH, '>': EAST, 'v': SOUTH, '<': WEST}
+
+def parse_input(file_path: str) -> Tuple[Grid, List[str]]:
     with open(file_path, 'r') as file:
         content = file.read().strip()
     
     grid_part, instructions_part = content.split('\n\n')
-    grid = [list(line) for line in grid_part.split('\n')]
+    grid = Grid(grid_part.split('\n'), border='#')
     instructions = list(''.join(instructions_part.split('\n')))
     
     return grid, instructions
 
-def find_robot_position(grid: List[List[str]]) -> Tuple[int, int]:
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell == '@':
-                return x, y
-    return -1, -1
+def find_robot_position(grid: Grid) -> int:
+    return grid.find('@')
 
-def move_robot(grid: List[List[str]], instructions: List[str]) -> List[List[str]]:
-    direction_map = {
-        '^': (0, -1),
-        'v': (0, 1),
-        '<': (-1, 0),
-        '>': (1, 0)
-    }
+@hot
+def move_robot(grid: Grid, instructions: List[str]) -> Grid:
+    cells = grid.cells
+    steps: Dict[str, int] = {instruction: grid.directions[d] for instruction, d in DIRECTION_MAP.items()}
     
-    x, y = find_robot_position(grid)
+    pos = find_robot_position(grid)
     
     for instruction in instructions:
-        dx, dy = direction_map[instruction]
-        new_x, new_y = x + dx, y + dy
+        step = steps[instruction]
+        new_pos = pos + step
         
-        if not (0 <= new_x < len(grid[0]) and 0 <= new_y < len(grid)):
-            continue
-        if grid[new_y][new_x] == '#':
+        # Find the end of the row of boxes in front of the robot
+        end = new_pos
+        while cells[end] == BOX:
+            end += step
+        if cells[end] == WALL:
             continue
-        elif grid[new_y][new_x] == 'O':
-            # Check if we can push the box
-            box_x, box_y = new_x, new_y
-            while 0 <= box_x + dx < len(grid[0]) and 0 <= box_y + dy < len(grid) and grid[box_y][box_x] == 'O':
-                box_x += dx
-                box_y += dy
-                if not (0 <= box_x + dx < len(grid[0]) and 0 <= box_y + dy < len(grid)) or grid[box_y][box_x] == '#':
-                    break
-            else:
-                # Move the robot and push the boxes
-                while (box_x, box_y) != (new_x, new_y):
-                    box_x -= dx
-                    box_y -= dy
-                    grid[box_y + dy][box_x + dx] = 'O'
-                grid[new_y][new_x] = '@'
-                grid[y][x] = '.'
-                x, y = new_x, new_y
-        else:
-            grid[new_y][new_x] = '@'
-            grid[y][x] = '.'
-            x, y = new_x, new_y
+        
+        # Shifting a row of boxes by one only moves its first box to the far end
+        if end != new_pos:
+            cells[end] = BOX
+        cells[new_pos] = ROBOT
+        cells[pos] = EMPTY
+        pos = new_pos
     
     return grid
 
-def calculate_gps_sum(grid: List[List[str]]) -> int:
+def calculate_gps_sum(grid: Grid) -> int:
     gps_sum = 0
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell == 'O':
-                gps_sum += 100 * y + x
+    for pos in grid.find_all('O'):
+        y, x = grid.coords(pos)
+        gps_sum += 100 * y + x
     return gps_sum
 
-if __name__ == "__main__":
-    file_path = 'input.txt'
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The sum of all boxes' GPS coordinates after the robot finishes moving.
+    """
     grid, instructions = parse_input(file_path)
+    return calculate_gps_sum(move_robot(grid, instructions))
+
+if __name__ == "__main__":
+    grid, instructions = parse_input(INPUT_FILE)
     
     print("Initial Grid:")
-    for row in grid:
-        print(''.join(row))
+    print('\n'.join(grid.lines()))
     
     grid = move_robot(grid, instructions)
     
     print("\nFinal Grid:")
-    for row in grid:
-        print(''.join(row))
+    print('\n'.join(grid.lines()))
     
     gps_sum = calculate_gps_sum(grid)
-    print(f"\nSum of all boxes' GPS coordinates: {gps_sum}")
\ No newline at end of file
+    print(f"\nSum of all boxes' GPS coordinates: {gps_sum}")
@@ -1,175 +1,112 @@
-import sys
-from collections import defaultdict
-from part1 import parse_input
-from typing import List, Tuple, Set
-
-# Constants for directions
-UP = (-1, 0)
-DOWN = (1, 0)
-LEFT = (0, -1)
-RIGHT = (0, 1)
-DIRS = [RIGHT, LEFT, DOWN, UP]
-DIR_MAP = {">": RIGHT, "<": LEFT, "v": DOWN, "^": UP}
-
-def add_tuples(x: Tuple[int, int], y: Tuple[int, int]) -> Tuple[int, int]:
-    """
-    Adds two tuples element-wise.
-
-    Args:
-        x (Tuple[int, int]): The first tuple.
-        y (Tuple[int, int]): The second tuple.
+from aoc.grid import Grid
+from aoc.instrument import hot
+from .part1 import parse_input, find_robot_position, DIRECTION_MAP, WALL, EMPTY
+from typing import List
+from . import INPUT_FILE
 
-    Returns:
-        Tuple[int, int]: A tuple containing the element-wise sum of the input tuples.
-    """
-    return tuple(map(sum, zip(x, y)))
+BOX_LEFT, BOX_RIGHT = ord('['), ord(']')
+WIDE_TILES = {'#': '##', 'O': '[]', '.': '..', '@': '@.'}
 
-def left(pos: Tuple[int, int]) -> Tuple[int, int]:
+def widen_grid(grid: Grid) -> Grid:
     """
-    Given a position as a tuple of (row, column), return the position to the left.
+    Builds the twice-as-wide warehouse, where every box spans two cells '[' and ']'.
 
     Args:
-        pos (Tuple[int, int]): The current position as a tuple (row, column).
+        grid (Grid): The original warehouse.
 
     Returns:
-        Tuple[int, int]: The new position to the left of the current position.
-    """
-    return (pos[0], pos[1] - 1)
-
-def right(pos: Tuple[int, int]) -> Tuple[int, int]:
+        Grid: The widened warehouse.
     """
-    Given a position as a tuple of (row, column), returns the position to the right.
-
-    Args:
-        pos (Tuple[int, int]): A tuple representing the current position (row, column).
+    return Grid([''.join(WIDE_TILES[ch] for ch in line) for line in grid.lines()], border='#')
 
-    Returns:
-        Tuple[int, int]: A tuple representing the new position to the right (row, column + 1).
+@hot
+def push(grid: Grid, pos: int, step: int) -> bool:
     """
-    return (pos[0], pos[1] + 1)
+    Attempts to move the object at a position one step, pushing every box in the way.
 
-def push(box: Tuple[int, int], direction: Tuple[int, int], boxes: Set[Tuple[int, int]], walls: Set[Tuple[int, int]]) -> bool:
-    """
-    Attempts to push a box in a specified direction within a grid containing boxes and walls.
+    All cells that would have to move are collected breadth-first; nothing is moved unless none
+    of them runs into a wall.
 
     Args:
-        box (Tuple[int, int]): The current position of the box to be pushed.
-        direction (Tuple[int, int]): The direction to push the box, represented as a tuple (dx, dy).
-        boxes (Set[Tuple[int, int]]): A set of tuples representing the positions of all boxes on the grid.
-        walls (Set[Tuple[int, int]]): A set of tuples representing the positions of all walls on the grid.
+        grid (Grid): The widened warehouse.
+        pos (int): The flat index of the object to move (normally the robot).
+        step (int): The flat index offset of the move.
 
     Returns:
-        bool: True if the box was successfully pushed, False otherwise.
+        bool: True if the object was moved, False if it was blocked.
     """
-    assert box in boxes
-    next_pos = add_tuples(box, direction)
-    if next_pos in walls or right(next_pos) in walls:
-        return False
-    if direction[0]:  # moving up/down
-        if next_pos in boxes and not push(next_pos, direction, boxes, walls):
-            return False
-        if left(next_pos) in boxes and not push(left(next_pos), direction, boxes, walls):
+    cells = grid.cells
+    vertical = step not in (1, -1)
+    to_move = [pos]
+    seen = {pos}
+    k = 0
+    while k < len(to_move):
+        target = to_move[k] + step
+        k += 1
+        cell = cells[target]
+        if cell == WALL:
             return False
-        if right(next_pos) in boxes and not push(right(next_pos), direction, boxes, walls):
-            return False
-    elif direction[1] == 1:  # pushing right
-        if right(next_pos) in boxes and not push(right(next_pos), direction, boxes, walls):
-            return False
-    elif direction[1] == -1:  # pushing left
-        if left(next_pos) in boxes and not push(left(next_pos), direction, boxes, walls):
-            return False
-    boxes.remove(box)
-    boxes.add(next_pos)
+        if cell == BOX_LEFT or cell == BOX_RIGHT:
+            # A box moving up or down drags its other half along
+            for part in (target, target + (1 if cell == BOX_LEFT else -1) if vertical else target):
+                if part not in seen:
+                    seen.add(part)
+                    to_move.append(part)
+
+    # Cells further along the move were collected later, so moving in reverse never overwrites
+    for p in reversed(to_move):
+        cells[p + step] = cells[p]
+        cells[p] = EMPTY
     return True
 
-def parse_grid(grid: List[str]) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]], Tuple[int, int]]:
+def execute_moves(grid: Grid, instructions: List[str]) -> Grid:
     """
-    Parses a grid represented as a list of strings and identifies the positions of walls, boxes, and the robot.
+    Executes a series of moves for a robot in the widened warehouse.
+
     Args:
-        grid (List[str]): A list of strings representing the grid. Each character in the string represents a different element:
-                          '#' for walls, 'O' for boxes, and '@' for the robot.
+        grid (Grid): The widened warehouse, which is updated in place.
+        instructions (List[str]): The moves, each one of '^', 'v', '<' or '>'.
+
     Returns:
-        Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]], Tuple[int, int]]:
-            - A set of tuples representing the positions of walls.
-            - A set of tuples representing the positions of boxes.
-            - A tuple representing the position of the robot.
+        Grid: The warehouse after all moves.
     """
-    walls = set()
-    boxes = set()
-    robot = None
-
-    for i, line in enumerate(grid):
-        for j, ch in enumerate(line):
-            j *= 2
-            if ch == "#":
-                walls.add((i, j))
-                walls.add((i, j + 1))
-            elif ch == "O":
-                boxes.add((i, j))
-            elif ch == "@":
-                robot = (i, j)
-    
-    return walls, boxes, robot
-
-def execute_moves(moves: List[Tuple[int, int]], robot: Tuple[int, int], boxes: Set[Tuple[int, int]], walls: Set[Tuple[int, int]]) -> Tuple[Tuple[int, int], Set[Tuple[int, int]]]:
+    robot = find_robot_position(grid)
+    for instruction in instructions:
+        step = grid.directions[DIRECTION_MAP[instruction]]
+        if push(grid, robot, step):
+            robot += step
+    return grid
+
+def calculate_score(grid: Grid) -> int:
     """
-    Executes a series of moves for a robot in a grid with boxes and walls.
+    Calculate the total score of the boxes in the warehouse.
+
+    The score for each box is 100 times its row plus the column of its left half.
 
     Args:
-        moves (List[Tuple[int, int]]): A list of moves where each move is represented as a tuple (dx, dy).
-        robot (Tuple[int, int]): The initial position of the robot as a tuple (x, y).
-        boxes (Set[Tuple[int, int]]): A set of positions of boxes in the grid.
-        walls (Set[Tuple[int, int]]): A set of positions of walls in the grid.
+        grid (Grid): The widened warehouse.
 
     Returns:
-        Tuple[Tuple[int, int], Set[Tuple[int, int]]]: The final position of the robot and the updated set of box positions.
+        int: The total score of all boxes.
     """
-    for move in moves:
-        for box in boxes:
-            assert right(box) not in boxes
-            assert right(box) not in walls
-        next_pos = add_tuples(robot, move)
-        if next_pos in walls:
-            continue
-        if next_pos in boxes:
-            copy = boxes.copy()
-            if not push(next_pos, move, boxes, walls):
-                boxes = copy
-                continue
-        elif left(next_pos) in boxes:
-            copy = boxes.copy()
-            if not push(left(next_pos), move, boxes, walls):
-                boxes = copy
-                continue
-        assert next_pos not in boxes
-        assert left(next_pos) not in boxes
-        robot = next_pos
-    return robot, boxes
-
-def calculate_score(boxes: Set[Tuple[int, int]]) -> int:
-    """
-    Calculate the total score based on a set of boxes.
+    score = 0
+    for pos in grid.find_all('['):
+        row, col = grid.coords(pos)
+        score += 100 * row + col
+    return score
 
-    Each box is represented as a tuple of two integers. The score for each box
-    is calculated as 100 times the first integer plus the second integer. The
-    total score is the sum of the scores for all boxes.
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
 
     Args:
-        boxes (Set[Tuple[int, int]]): A set of tuples, where each tuple contains
-                                      two integers representing a box.
+        file_path (str): The path to the input file.
 
     Returns:
-        int: The total score calculated from the set of boxes.
+        int: The sum of all wide boxes' GPS coordinates after the robot finishes moving.
     """
-    return sum(100 * box[0] + box[1] for box in boxes)
-
-if __name__ == "__main__":
-    file_path = 'input.txt'
     grid, instructions = parse_input(file_path)
+    return calculate_score(execute_moves(widen_grid(grid), instructions))
 
-    moves = [DIR_MAP[m] for m in instructions]
-
-    walls, boxes, robot = parse_grid(grid)
-    robot, boxes = execute_moves(moves, robot, boxes, walls)
-    score = calculate_score(boxes)
-    print(score)
+if __name__ == "__main__":
+    print(solution(INPUT_FILE))
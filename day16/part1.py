@@ -1,8 +1,24 @@
-import re
-from typing import List, Tuple
+from array import array
+from collections import namedtuple
+from typing import Iterable, List, Optional, Tuple
 import heapq
+from aoc.grid import Grid, NORTH, EAST, SOUTH, WEST
+from aoc.instrument import hot
+from . import INPUT_FILE
 
-def parse_input(file_path: str):
+WALL, END = ord('#'), ord('E')
+
+# Score of the graph states that cannot be reached, and cost of the moves that do not exist
+UNREACHED = 1 << 62
+
+# The maze collapsed to its junctions, dead ends, start and end. Graph states are 4 * node + direction;
+# targets, costs and reversals are indexed by state, the rest by node (node_ids by cell).
+MazeGraph = namedtuple('MazeGraph', ['nodes', 'node_ids', 'exits', 'targets', 'costs', 'reversals'])
+
+# The outcome of a search for the end: the lowest score and the number of states expanded to find it
+SearchResult = namedtuple('SearchResult', ['score', 'expanded'])
+
+def parse_input(file_path: str) -> Grid:
     """
     Parse the input file to extract the data.
 
@@ -10,100 +26,238 @@ def parse_input(file_path: str):
         file_path (str): The path to the input file.
 
     Returns:
-        List[str]: A list of strings representing the data from the file.
+        Grid: The maze, surrounded by a border of walls.
     """
-    with open(file_path, 'r') as file:
-        return [line.strip() for line in file]
+    return Grid.from_file(file_path, border='#')
     
-def find_starting_position(grid: List[str]) -> Tuple[int, int]:
+def find_starting_position(grid: Grid) -> int:
     """
     Find the starting position marked as 'S' in the grid.
 
     Args:
-        grid (List[str]): A list of strings representing the grid.
+        grid (Grid): The maze.
 
     Returns:
-        Tuple[int, int]: A tuple containing the row and column indices of the starting position.
+        int: The flat index of the starting position.
     """
-    for i, row in enumerate(grid):
-        for j, cell in enumerate(row):
-            if cell == 'S':
-                return i, j
-    return -1, -1
+    return grid.find('S')
 
-# given a grid and a current position as well as a direction,
-# return the list of next possible moves either moving forward in the current direction or turning left or right
-def get_possible_moves(grid: List[str], i: int, j: int, direction: str) -> List[Tuple[int, int, str]]:
+@hot
+def walk_corridor(grid: Grid, node_ids: array, pos: int, direction: int, tiles: Optional[List[int]] = None) -> Tuple[int, int, int, int]:
     """
-    Get the possible moves from the current position in the grid.
+    Follows a corridor from a node to the next node, turning wherever the corridor bends.
+
+    Every cell between two nodes has exactly two open neighbors, so the walk has no choices.
 
     Args:
-        grid (List[str]): A list of strings representing the grid.
-        i (int): The row index of the current position.
-        j (int): The column index of the current position.
-        direction (str): The current direction ('N', 'E', 'S', 'W').
+        grid (Grid): The maze.
+        node_ids (array): The node id of every cell, -1 for cells that are not nodes.
+        pos (int): The flat index of the node to leave.
+        direction (int): The direction to leave in; the neighbor in that direction must be open.
+        tiles (Optional[List[int]], optional): If given, the cells between the two nodes are appended to it in walking order.
 
     Returns:
-        List[Tuple[int, int, str]]: A list of tuples where each tuple contains the row index, column index, and the direction of the possible moves.
+        Tuple[int, int, int, int]: The flat index of the node reached, the direction it is reached in,
+            the score of the walk, and the number of steps to the first bend (0 if the corridor is straight).
     """
-    rows, cols = len(grid), len(grid[0])
-    moves = {'N': (-1, 0), 'E': (0, 1), 'S': (1, 0), 'W': (0, -1)}
-    left_turns = {'N': 'W', 'E': 'N', 'S': 'E', 'W': 'S'}
-    right_turns = {'N': 'E', 'E': 'S', 'S': 'W', 'W': 'N'}
-    possible_moves = []
+    cells, offsets = grid.cells, grid.directions
+    pos += offsets[direction]
+    steps, turns, bend = 1, 0, 0
+    while node_ids[pos] < 0:
+        if tiles is not None:
+            tiles.append(pos)
+        if cells[pos + offsets[direction]] == WALL:
+            direction = (direction + 1) % 4 if cells[pos + offsets[(direction + 1) % 4]] != WALL else (direction + 3) % 4
+            turns += 1
+            bend = bend or steps
+        pos += offsets[direction]
+        steps += 1
+    return pos, direction, steps + 1000 * turns, bend
+
+def build_maze_graph(grid: Grid, keep: Iterable[int]) -> MazeGraph:
+    """
+    Collapses the maze into a weighted graph of junctions, dead ends and the given cells.
+
+    The other open cells form corridors with no choice but to go on, so each one becomes an edge
+    whose weight includes its length and the turns at its bends. A reindeer can also turn around
+    at the first bend of a corridor, which becomes an edge back to the node it left.
+
+    Args:
+        grid (Grid): The maze.
+        keep (Iterable[int]): Flat indices that must be nodes, such as the start and end.
+
+    Returns:
+        MazeGraph: The graph.
+    """
+    cells, offsets = grid.cells, grid.directions
+    keep = set(keep)
+    node_ids = array('i', [-1]) * len(cells)
+    nodes, exits = array('i'), bytearray()
+    for pos, cell in enumerate(cells):
+        if cell != WALL:
+            mask = sum(1 << d for d in range(4) if cells[pos + offsets[d]] != WALL)
+            if mask not in (0b0011, 0b0110, 0b1100, 0b1001, 0b0101, 0b1010) or pos in keep:
+                node_ids[pos] = len(nodes)
+                nodes.append(pos)
+                exits.append(mask)
 
-    # Check forward move
-    dx, dy = moves[direction]
-    new_i, new_j = i + dx, j + dy
-    if 0 <= new_i < rows and 0 <= new_j < cols and grid[new_i][new_j] != '#':
-        possible_moves.append((new_i, new_j, direction))
-
-    # Check left turn
-    left_direction = left_turns[direction]
-    left_dx, left_dy = moves[left_direction]
-    left_i, left_j = i + left_dx, j + left_dy
-    if 0 <= left_i < rows and 0 <= left_j < cols and grid[left_i][left_j] != '#':
-        possible_moves.append((i, j, left_direction))
-
-    # Check right turn
-    right_direction = right_turns[direction]
-    right_dx, right_dy = moves[right_direction]
-    right_i, right_j = i + right_dx, j + right_dy
-    if 0 <= right_i < rows and 0 <= right_j < cols and grid[right_i][right_j] != '#':
-        possible_moves.append((i, j, right_direction))
+    targets = array('i', [-1]) * (4 * len(nodes))
+    costs = array('q', [UNREACHED]) * len(targets)
+    reversals = array('q', [UNREACHED]) * len(targets)
+    for node, pos in enumerate(nodes):
+        for direction in range(4):
+            if exits[node] >> direction & 1:
+                state = 4 * node + direction
+                end, end_direction, cost, bend = walk_corridor(grid, node_ids, pos, direction)
+                targets[state], costs[state] = 4 * node_ids[end] + end_direction, cost
+                if bend:
+                    reversals[state] = 2 * bend + 2000
+    return MazeGraph(nodes, node_ids, exits, targets, costs, reversals)
 
+@hot
+def get_possible_moves(graph: MazeGraph, state: int) -> List[Tuple[int, int]]:
+    """
+    Get the possible moves from a graph state: through the corridor ahead, turning left or
+    right towards an open neighbor, or turning around at the first bend of the corridor ahead.
+
+    Args:
+        graph (MazeGraph): The maze graph.
+        state (int): The current state, 4 * node + direction.
+
+    Returns:
+        List[Tuple[int, int]]: The state and the score of each possible move.
+    """
+    node, direction = divmod(state, 4)
+    possible_moves = []
+    if graph.targets[state] >= 0:
+        possible_moves.append((graph.targets[state], graph.costs[state]))
+    for turn in (1, 3):
+        if graph.exits[node] >> (direction + turn) % 4 & 1:
+            possible_moves.append((4 * node + (direction + turn) % 4, 1000))
+    if graph.reversals[state] != UNREACHED:
+        possible_moves.append((4 * node + (direction + 2) % 4, graph.reversals[state]))
     return possible_moves
 
-def find_lowest_score(grid: List[str], i: int, j: int, direction: str) -> int:
+@hot
+def score_states(graph: MazeGraph, state: int) -> array:
     """
-    Finds the shortest path in a grid from a starting position (i, j) in a given direction.
+    Finds the lowest score of every graph state reachable from a starting state.
 
     Args:
-        grid (List[str]): A 2D grid represented as a list of strings.
-        i (int): The starting row index.
-        j (int): The starting column index.
-        direction (str): The initial direction of movement.
+        graph (MazeGraph): The maze graph.
+        state (int): The starting state, 4 * node + direction.
 
     Returns:
-        int: The shortest path score to reach the target 'E' in the grid. If the target is not reachable, returns float('inf').
+        array: The lowest score of every state; UNREACHED for unreachable states.
+    """
+    scores = array('q', [UNREACHED]) * len(graph.targets)
+    scores[state] = 0
+    heap = [(0, state)]  # (score, state)
+    while heap:
+        score, state = heapq.heappop(heap)
+        if score > scores[state]:
+            continue
+        for new_state, cost in get_possible_moves(graph, state):
+            if score + cost < scores[new_state]:
+                scores[new_state] = score + cost
+                heapq.heappush(heap, (score + cost, new_state))
+    return scores
+
+def estimate_score(width: int, pos: int, direction: int, end: int) -> int:
+    """
+    Gives a lower bound on the score from a position and direction to the end.
+
+    The reindeer needs at least the Manhattan distance in steps, and one turn per direction it
+    has to move in other than the one it faces; two if it has to move backwards.
+
+    Args:
+        width (int): The width of a stored grid row.
+        pos (int): The flat index of the position.
+        direction (int): The direction the reindeer faces.
+        end (int): The flat index of the end.
+
+    Returns:
+        int: The lower bound.
+    """
+    (row, col), (end_row, end_col) = divmod(pos, width), divmod(end, width)
+    required = [d for d, needed in ((NORTH, end_row < row), (EAST, end_col > col), (SOUTH, end_row > row), (WEST, end_col < col)) if needed]
+    if not required:
+        turns = 0
+    elif direction in required:
+        turns = len(required) - 1
+    elif (direction + 2) % 4 in required:
+        turns = 2
+    else:
+        turns = 1
+    return abs(end_row - row) + abs(end_col - col) + 1000 * turns
+
+@hot
+def search_end(grid: Grid, graph: MazeGraph, state: int, end: int, astar: bool = False) -> SearchResult:
+    """
+    Searches the maze graph for the lowest score from a starting state to the end.
+
+    Dijkstra expands every state that scores lower than the end. A* orders states by their
+    score plus estimate_score, which never overestimates, so it finds the same score while
+    expanding fewer states.
+
+    Args:
+        grid (Grid): The maze.
+        graph (MazeGraph): The maze graph.
+        state (int): The starting state, 4 * node + direction.
+        end (int): The flat index of the end; must be a node of the graph.
+        astar (bool, optional): True to use A*, False for Dijkstra. Defaults to False.
+
+    Returns:
+        SearchResult: The lowest score, float('inf') if the end is not reachable, and the number of states expanded.
     """
-    visited = set()
-    heap = [(0, i, j, direction)]  # (score, row, col, direction)
+    nodes, width, end_node = graph.nodes, grid.width, graph.node_ids[end]
+    estimate = (lambda state: estimate_score(width, nodes[state // 4], state % 4, end)) if astar else (lambda state: 0)
+    scores = array('q', [UNREACHED]) * len(graph.targets)
+    scores[state] = 0
+    heap = [(estimate(state), 0, state)]  # (score plus estimate, score, state)
+    expanded = 0
     while heap:
-        score, i, j, direction = heapq.heappop(heap)
-        if (i, j, direction) in visited:
+        _, score, state = heapq.heappop(heap)
+        if score > scores[state]:
             continue
-        visited.add((i, j, direction))
-        if grid[i][j] == 'E':
-            return score
-        for new_i, new_j, new_direction in get_possible_moves(grid, i, j, direction):
-            new_score = score + 1 if new_direction == direction else score + 1000
-            heapq.heappush(heap, (new_score, new_i, new_j, new_direction))
-    return float('inf')
+        if state // 4 == end_node:
+            return SearchResult(score, expanded)
+        expanded += 1
+        for new_state, cost in get_possible_moves(graph, state):
+            if score + cost < scores[new_state]:
+                scores[new_state] = score + cost
+                heapq.heappush(heap, (score + cost + estimate(new_state), score + cost, new_state))
+    return SearchResult(float('inf'), expanded)
+
+def find_lowest_score(grid: Grid, pos: int, direction: int, astar: bool = False) -> int:
+    """
+    Finds the shortest path in a grid from a starting position in a given direction.
+
+    Args:
+        grid (Grid): The maze.
+        pos (int): The flat index of the starting position.
+        direction (int): The initial direction of movement.
+        astar (bool, optional): True to search with A* instead of Dijkstra. Defaults to False.
+
+    Returns:
+        int: The shortest path score to reach the target 'E' in the grid. If the target is not reachable, returns float('inf').
+    """
+    end = grid.find('E')
+    graph = build_maze_graph(grid, (pos, end))
+    return search_end(grid, graph, 4 * graph.node_ids[pos] + direction, end, astar).score
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The lowest score a reindeer could possibly get.
+    """
+    grid = parse_input(file_path)
+    return find_lowest_score(grid, find_starting_position(grid), EAST)
 
 if __name__ == "__main__":
-    file_path = 'input.txt'
-    parsed_data = parse_input(file_path)
-    i, j = find_starting_position(parsed_data)
-    score = find_lowest_score(parsed_data, i, j, 'E')
-    print(score)
\ No newline at end of file
+    print(solution(INPUT_FILE))
@@ -1,52 +1,91 @@
-import heapq
-from typing import List, Tuple
-from part1 import parse_input, get_possible_moves, find_starting_position
+from typing import List, Set, Tuple
+from aoc.grid import Grid, EAST
+from .part1 import parse_input, find_starting_position, build_maze_graph, score_states, walk_corridor, MazeGraph, UNREACHED
+from . import INPUT_FILE
 
-def find_scores_and_paths(grid: List[str], i: int, j: int, direction: str) -> List[Tuple[int, set]]:
+def trace_best_tiles(grid: Grid, graph: MazeGraph, scores: List[int], end: int) -> Set[int]:
     """
-    Finds all possible scores and best paths from a starting position in a grid.
+    Walks back from the end over the moves that are part of a best path and collects their tiles.
+
+    A move from state a to state b is on a best path when b is on one and the score of a plus
+    the cost of the move equals the score of b, so no path needs to be stored during the search.
+    The corridors of those moves are expanded back into tiles once all of them are known.
+
     Args:
-        grid (List[str]): The grid represented as a list of strings.
-        i (int): The starting row index.
-        j (int): The starting column index.
-        direction (str): The initial direction of movement.
+        grid (Grid): The maze.
+        graph (MazeGraph): The maze graph.
+        scores (List[int]): The state scores from score_states.
+        end (int): The flat index of the end tile.
+
     Returns:
-        List[Tuple[int, set]]: A list of tuples where each tuple contains a score and a set representing a path.
+        Set[int]: The flat indices of the tiles on at least one best path; empty if the end is unreachable.
     """
-    scores_and_paths = []
-    visited = {}
-    lowest_score = float('inf')
-    heap = [(0, i, j, direction, {(i, j)})]  # (score, row, col, direction, path)
-    
-    while heap:
-        score, i, j, direction, path = heapq.heappop(heap)
-        if ((i, j, direction) in visited and visited[(i, j, direction)] < score) or score > lowest_score:
-            continue
-        visited[(i, j, direction)] = score
-        if grid[i][j] == 'E':
-            lowest_score = score
-            scores_and_paths.append((score, path | {(i, j)}))
-        for new_i, new_j, new_direction in get_possible_moves(grid, i, j, direction):
-            new_score = score + 1 if new_direction == direction else score + 1000
-            new_path = path | {(new_i, new_j)}
-            heapq.heappush(heap, (new_score, new_i, new_j, new_direction, new_path))
-    return scores_and_paths
-
-def find_shortest_path_tiles(grid: List[str]) -> set:
+    nodes, exits, targets, costs, reversals = graph.nodes, graph.exits, graph.targets, graph.costs, graph.reversals
+    end_node = graph.node_ids[end]
+    best = min(scores[4 * end_node:4 * end_node + 4])
+    if best == UNREACHED:
+        return set()
+    incoming: List[List[int]] = [[] for _ in targets]
+    for state, target in enumerate(targets):
+        if target >= 0:
+            incoming[target].append(state)
+
+    stack = [state for state in range(4 * end_node, 4 * end_node + 4) if scores[state] == best]
+    on_path = bytearray(len(targets))
+    for state in stack:
+        on_path[state] = 1
+    corridors: List[Tuple[int, bool]] = []  # (state leaving into the corridor, whether it turns around)
+    while stack:
+        state = stack.pop()
+        node, direction = divmod(state, 4)
+        score = scores[state]
+        predecessors = [(previous, costs[previous], False) for previous in incoming[state]]
+        # Turning is only allowed towards an open tile
+        if exits[node] >> direction & 1:
+            predecessors += [(4 * node + (direction + 1) % 4, 1000, None), (4 * node + (direction + 3) % 4, 1000, None)]
+        behind = 4 * node + (direction + 2) % 4
+        predecessors.append((behind, reversals[behind], True))
+        for previous, cost, reverse in predecessors:
+            if scores[previous] + cost == score:
+                if reverse is not None:
+                    corridors.append((previous, reverse))
+                if not on_path[previous]:
+                    on_path[previous] = 1
+                    stack.append(previous)
+
+    tiles = {nodes[state // 4] for state in range(len(on_path)) if on_path[state]}
+    for state, reverse in corridors:
+        corridor: List[int] = []
+        _, _, _, bend = walk_corridor(grid, graph.node_ids, nodes[state // 4], state % 4, corridor)
+        tiles.update(corridor[:bend] if reverse else corridor)
+    return tiles
+
+def find_shortest_path_tiles(grid: Grid) -> Set[int]:
     """
     Finds the set of tiles that are part of the shortest path from the starting position to the target 'E' in the given grid.
 
     Args:
-        grid (List[str]): A list of strings representing the grid where each string is a row of the grid.
+        grid (Grid): The maze.
+
+    Returns:
+        Set[int]: The flat indices of the tiles that are part of a shortest path to the target 'E'.
+    """
+    start, end = find_starting_position(grid), grid.find('E')
+    graph = build_maze_graph(grid, (start, end))
+    scores = score_states(graph, 4 * graph.node_ids[start] + EAST)
+    return trace_best_tiles(grid, graph, scores, end)
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
 
     Returns:
-        set: A set of tiles (coordinates) that are part of the shortest path to the target 'E'.
+        int: The number of tiles that are part of at least one best path.
     """
-    i, j = find_starting_position(grid)
-    paths_and_scores = find_scores_and_paths(grid, i, j, 'E')
-    return {tile for _, path in paths_and_scores for tile in path}
+    return len(find_shortest_path_tiles(parse_input(file_path)))
 
 if __name__ == "__main__":
-    file_path = 'input.txt'
-    input = parse_input(file_path)
-    print(len(find_shortest_path_tiles(input)))
+    print(solution(INPUT_FILE))
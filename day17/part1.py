@@ -1,5 +1,6 @@
 import re
 from typing import List, Tuple, Dict
+from . import INPUT_FILE
 
 # Define opcodes as constants
 ADV, BXL, BST, JNZ, BXC, OUT, BDV, CDV = range(8)
@@ -105,8 +106,18 @@ def execute_program(registers: Dict[str, int], program: List[int]) -> str:
 
     return ','.join(map(str, output))
 
-if __name__ == "__main__":
-    file_path = 'input.txt'
+def solution(file_path: str) -> str:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        str: The comma-separated output of the program.
+    """
     registers, program = parse_input(file_path)
-    result = execute_program(registers, program)
-    print(result)
+    return execute_program(registers, program)
+
+if __name__ == "__main__":
+    print(solution(INPUT_FILE))
@@ -1,4 +1,6 @@
-from part1 import parse_input
+from aoc.instrument import hot
+from .part1 import parse_input
+from . import INPUT_FILE
 
 def run(program, regs):
     """
@@ -45,6 +47,7 @@ def run(program, regs):
             combo[reg_c] = combo[reg_a] // (2 ** combo[operand])
         ip += 2
 
+@hot
 def expect(program, target_output, prev_a=0):
     """
     Tries to find an integer 'a' such that when the 'program' is run with inputs derived from 'a',
@@ -71,14 +74,22 @@ def expect(program, target_output, prev_a=0):
 
     return helper(program, target_output, prev_a)
 
-if __name__ == "__main__":
-    file_path = 'input.txt'
+def solution(file_path: str):
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int or None: The lowest initial value for register A that makes the program output itself,
+                     or None if no such value can be found.
+    """
     registers, program = parse_input(file_path)
-    
-    # Example target output
-    target_output = program.copy()
-    
-    initial_value = expect(program, target_output)
+    return expect(program, program.copy())
+
+if __name__ == "__main__":
+    initial_value = solution(INPUT_FILE)
     if initial_value is not None:
         print(f"The initial value for register A that produces the target output is: {initial_value}")
     else:
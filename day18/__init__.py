@@ -0,0 +1,3 @@
+import os
+
+INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
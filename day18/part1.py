@@ -1,5 +1,13 @@
-from collections import deque
-from typing import List, Tuple
+from array import array
+from typing import Iterable, List, Optional, Tuple
+from aoc.grid import Grid
+from aoc.instrument import hot
+from . import INPUT_FILE
+
+OPEN, CORRUPTED = ord('.'), ord('#')
+
+# The puzzle lets 1024 bytes fall on its 71 x 71 memory space before part 1 asks for a path
+PUZZLE_GRID_SIZE, PUZZLE_NUM_BYTES = 71, 1024
 
 def parse_input(file_path: str) -> List[Tuple[int, int]]:
     """
@@ -16,68 +24,189 @@ def parse_input(file_path: str) -> List[Tuple[int, int]]:
     with open(file_path, 'r') as file:
         return [tuple(map(int, line.strip().split(','))) for line in file]
 
-def initialize_grid(size: int) -> List[List[str]]:
+def infer_grid_size(byte_positions: List[Tuple[int, int]]) -> int:
     """
-    Initializes a square grid of the given size with all cells set to '.'.
+    Infers the size of the memory space from the byte positions, which cover it up to its far corner.
 
     Args:
-        size (int): The size of the grid (number of rows and columns).
+        byte_positions (List[Tuple[int, int]]): A list of tuples representing the (x, y) positions of bytes.
 
     Returns:
-        List[List[str]]: A 2D list representing the initialized grid.
+        int: One more than the largest coordinate (71 for the puzzle input, 7 for the example).
     """
-    return [['.' for _ in range(size)] for _ in range(size)]
+    return max(max(x, y) for x, y in byte_positions) + 1
 
-def simulate_falling_bytes(grid: List[List[str]], byte_positions: List[Tuple[int, int]], num_bytes: int):
+def default_num_bytes(grid_size: int) -> int:
     """
-    Simulates the falling of bytes in a grid.
+    Scales the puzzle's part 1 byte count to a memory space of another size, covering the same share of it.
 
     Args:
-        grid (List[List[str]]): A 2D list representing the grid where bytes will fall.
-        byte_positions (List[Tuple[int, int]]): A list of tuples representing the (x, y) positions of bytes.
-        num_bytes (int): The number of bytes to simulate falling.
+        grid_size (int): The size of the grid.
+
+    Returns:
+        int: The number of fallen bytes; 1024 for the puzzle's 71 x 71 grid.
+    """
+    return PUZZLE_NUM_BYTES * grid_size * grid_size // (PUZZLE_GRID_SIZE * PUZZLE_GRID_SIZE)
+
+def initialize_grid(size: int) -> Grid:
+    """
+    Initializes a square grid of the given size with all cells set to '.'.
+
+    Args:
+        size (int): The size of the grid (number of rows and columns).
 
     Returns:
-        None
+        Grid: The initialized grid, surrounded by a border of walls.
     """
-    for x, y in byte_positions[:num_bytes]:
-        grid[y][x] = '#'
+    return Grid.filled(size, size, '.', border='#')
 
-def find_shortest_path(grid: List[List[str]]) -> int:
+@hot
+def find_shortest_path(grid: Grid, start: Optional[int] = None, end: Optional[int] = None,
+                       visited: Optional[array] = None, stamp: int = 1) -> int:
     """
-    Finds the shortest path in a grid from the top-left corner to the bottom-right corner.
-    The grid is represented as a list of lists of strings, where '.' represents an open cell
-    and any other character represents an obstacle.
+    Finds the shortest path in a grid, by default from the top-left corner to the bottom-right corner.
+    '.' represents an open cell and any other character represents an obstacle.
     Args:
-        grid (List[List[str]]): The grid to search, where each element is a string representing a cell.
+        grid (Grid): The grid to search.
+        start (Optional[int], optional): The flat index to start from. Defaults to the top-left corner.
+        end (Optional[int], optional): The flat index to reach. Defaults to the bottom-right corner.
+        visited (Optional[array], optional): One mark per cell, reused across calls. Defaults to a new buffer.
+        stamp (int, optional): A value not yet stored in `visited`, marking the cells visited by this call. Defaults to 1.
     Returns:
-        int: The number of steps in the shortest path from the top-left to the bottom-right corner.
+        int: The number of steps in the shortest path from the start to the end.
              Returns -1 if no such path exists.
     """
-    size = len(grid)
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    queue = deque([(0, 0, 0)])  # (x, y, steps)
-    visited = set([(0, 0)])
+    cells = grid.cells
+    start = grid.index(0, 0) if start is None else start
+    end = grid.index(grid.rows - 1, grid.cols - 1) if end is None else end
+    if visited is None:
+        visited = array('i', bytes(4 * len(cells)))
+    # Breadth-first search one distance layer at a time
+    visited[start] = stamp
+    frontier = [start]
+    steps = 0
     
-    while queue:
-        x, y, steps = queue.popleft()
-        
-        if (x, y) == (size - 1, size - 1):
-            return steps
-        
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < size and 0 <= ny < size and grid[ny][nx] == '.' and (nx, ny) not in visited:
-                visited.add((nx, ny))
-                queue.append((nx, ny, steps + 1))
+    while frontier:
+        next_frontier = []
+        for pos in frontier:
+            if pos == end:
+                return steps
+            for step in grid.directions:
+                new_pos = pos + step
+                if cells[new_pos] == OPEN and visited[new_pos] != stamp:
+                    visited[new_pos] = stamp
+                    next_frontier.append(new_pos)
+        frontier = next_frontier
+        steps += 1
     
     return -1  # No path found
 
+class MemorySpace:
+    """
+    A byte list loaded once, answering shortest-path queries for any number of fallen bytes.
+
+    The grid cells serve as the obstacle mask, and going from one number of fallen bytes to
+    another only drops or lifts the bytes in between, so queries sorted by byte count cost one
+    pass over the list in total. The search marks visited cells with a fresh stamp per query,
+    so its buffer is allocated once and never cleared.
+
+    Attributes:
+        byte_positions (List[Tuple[int, int]]): The (x, y) positions of the bytes, in falling order.
+        grid (Grid): The memory space with the currently fallen bytes.
+        fallen (int): The number of bytes currently fallen.
+    """
+
+    def __init__(self, byte_positions: List[Tuple[int, int]], grid_size: Optional[int] = None):
+        """
+        Builds an empty memory space for a byte list.
+
+        Args:
+            byte_positions (List[Tuple[int, int]]): The (x, y) positions of the bytes, in falling order.
+            grid_size (Optional[int], optional): The size of the grid. Defaults to the size inferred from the byte positions.
+        """
+        self.byte_positions = byte_positions
+        self.grid = initialize_grid(grid_size or infer_grid_size(byte_positions))
+        self.fallen = 0
+        self._byte_cells = array('i', (self.grid.index(y, x) for x, y in byte_positions))
+        # When the first byte lands on each cell, so lifting a byte keeps cells hit earlier corrupted
+        self._first_fall = array('i', [len(byte_positions)]) * len(self.grid.cells)
+        for i in range(len(byte_positions) - 1, -1, -1):
+            self._first_fall[self._byte_cells[i]] = i
+        self._visited = array('i', bytes(4 * len(self.grid.cells)))
+        self._stamp = 0
+
+    def drop(self, num_bytes: int):
+        """
+        Makes the first `num_bytes` bytes, and only those, fallen.
+
+        Args:
+            num_bytes (int): The number of fallen bytes.
+        """
+        cells, byte_cells, first_fall = self.grid.cells, self._byte_cells, self._first_fall
+        num_bytes = min(num_bytes, len(byte_cells))
+        for i in range(self.fallen, num_bytes):
+            cells[byte_cells[i]] = CORRUPTED
+        for i in range(num_bytes, self.fallen):
+            if first_fall[byte_cells[i]] >= num_bytes:
+                cells[byte_cells[i]] = OPEN
+        self.fallen = num_bytes
+
+    def shortest_path(self, num_bytes: int, start: Tuple[int, int] = (0, 0), end: Optional[Tuple[int, int]] = None) -> int:
+        """
+        Finds the shortest path after `num_bytes` bytes have fallen.
+
+        Args:
+            num_bytes (int): The number of fallen bytes.
+            start (Tuple[int, int], optional): The (x, y) position to start from. Defaults to (0, 0).
+            end (Optional[Tuple[int, int]], optional): The (x, y) position to reach. Defaults to the bottom-right corner.
+
+        Returns:
+            int: The number of steps in the shortest path, or -1 if the end is unreachable.
+
+        Raises:
+            ValueError: If the start or end lies outside the grid.
+        """
+        grid = self.grid
+        end = end or (grid.cols - 1, grid.rows - 1)
+        for x, y in (start, end):
+            if not grid.contains(y, x):
+                raise ValueError(f'Position {x},{y} is outside the {grid.cols}x{grid.rows} memory space')
+        self.drop(num_bytes)
+        self._stamp += 1
+        return find_shortest_path(grid, grid.index(start[1], start[0]), grid.index(end[1], end[0]), self._visited, self._stamp)
+
+    def shortest_paths(self, queries: Iterable[Tuple[int, Tuple[int, int], Tuple[int, int]]]) -> List[int]:
+        """
+        Answers a batch of shortest-path queries, in order of byte count to keep mask updates small.
+
+        Args:
+            queries (Iterable[Tuple[int, Tuple[int, int], Tuple[int, int]]]): The number of fallen bytes,
+                start and end of every query.
+
+        Returns:
+            List[int]: The length of the shortest path for every query, in the order given; -1 where the end is unreachable.
+        """
+        queries = list(queries)
+        results = [-1] * len(queries)
+        for i in sorted(range(len(queries)), key=lambda i: queries[i][0]):
+            results[i] = self.shortest_path(*queries[i])
+        return results
+
+def solution(file_path: str, grid_size: Optional[int] = None, num_bytes: Optional[int] = None) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+        grid_size (Optional[int], optional): The size of the grid. Defaults to the size inferred from the input.
+        num_bytes (Optional[int], optional): The number of bytes that have fallen. Defaults to 1024, scaled
+            by default_num_bytes for grids of another size.
+
+    Returns:
+        int: The minimum number of steps needed to reach the exit, or -1 if it is unreachable.
+    """
+    space = MemorySpace(parse_input(file_path), grid_size)
+    return space.shortest_path(default_num_bytes(space.grid.rows) if num_bytes is None else num_bytes)
+
 if __name__ == "__main__":
-    file_path = 'input.txt'
-    byte_positions = parse_input(file_path)
-    grid_size = 71  # For the actual problem, use 71; for the example, use 7
-    grid = initialize_grid(grid_size)
-    simulate_falling_bytes(grid, byte_positions, 1024)
-    steps = find_shortest_path(grid)
-    print(f"Minimum number of steps needed to reach the exit: {steps}")
+    print(f"Minimum number of steps needed to reach the exit: {solution(INPUT_FILE)}")
@@ -1,27 +1,111 @@
-from typing import List, Tuple
-from part1 import parse_input, initialize_grid, find_shortest_path
+from array import array
+from collections import namedtuple
+from typing import List, Optional, Tuple
+from aoc.instrument import hot
+from .part1 import parse_input, infer_grid_size, initialize_grid, OPEN, CORRUPTED
+from . import INPUT_FILE
 
-def find_blocking_byte(byte_positions: List[Tuple[int, int]], grid_size: int) -> Tuple[int, int]:
+# The first byte that cuts the exit off: its position in the input and its (x, y) coordinates
+BlockingByte = namedtuple('BlockingByte', ['index', 'position'])
+
+def find_root(parent: array, cell: int) -> int:
+    """
+    Finds the representative of a cell's region, halving the path to it on the way.
+
+    Args:
+        parent (array): The parent of every cell in the union-find forest.
+        cell (int): The flat index of the cell.
+
+    Returns:
+        int: The flat index of the region's representative.
+    """
+    while parent[cell] != cell:
+        parent[cell] = parent[parent[cell]]
+        cell = parent[cell]
+    return cell
+
+def join(parent: array, size: array, a: int, b: int):
+    """
+    Merges the regions of two cells, attaching the smaller region to the larger.
+
+    Args:
+        parent (array): The parent of every cell in the union-find forest; updated in place.
+        size (array): The number of cells under every representative; updated in place.
+        a (int): The flat index of one cell.
+        b (int): The flat index of the other cell.
+    """
+    a, b = find_root(parent, a), find_root(parent, b)
+    if a != b:
+        if size[a] < size[b]:
+            a, b = b, a
+        parent[b] = a
+        size[a] += size[b]
+
+@hot
+def find_blocking_byte(byte_positions: List[Tuple[int, int]], grid_size: int) -> BlockingByte:
     """
     Identifies the first byte position that blocks the shortest path in a grid.
+
+    Runs time backwards: with every byte fallen, the open cells are merged into regions, then
+    the bytes are lifted again from the last one on, merging each freed cell with its open
+    neighbors. The byte whose removal joins the start and the exit is the one that blocked them.
+
     Args:
         byte_positions (List[Tuple[int, int]]): A list of tuples representing the positions of bytes in the grid.
         grid_size (int): The size of the grid (assuming a square grid).
+
     Returns:
-        Tuple[int, int]: The coordinates of the first blocking byte. Returns (-1, -1) if no blocking byte is found.
+        BlockingByte: The index and coordinates of the first blocking byte; index -1 and coordinates (-1, -1)
+            if no blocking byte is found.
     """
     grid = initialize_grid(grid_size)
-    
-    for i, (x, y) in enumerate(byte_positions):
-        grid[y][x] = '#'
-        if find_shortest_path(grid) == -1:
-            return (x, y)
-    
-    return (-1, -1)  # If no blocking byte is found
+    cells, directions = grid.cells, grid.directions
+    start, end = grid.index(0, 0), grid.index(grid_size - 1, grid_size - 1)
+    # The search always leaves the start, so a byte there blocks nothing
+    fallen = [grid.index(y, x) for x, y in byte_positions]
+    first_fall = {}
+    for i, cell in enumerate(fallen):
+        if cell != start:
+            first_fall.setdefault(cell, i)
+    for cell in first_fall:
+        cells[cell] = CORRUPTED
 
-if __name__ == "__main__":
-    file_path = 'input.txt'
+    parent = array('i', range(len(cells)))
+    size = array('i', [1]) * len(cells)
+    for cell, value in enumerate(cells):
+        if value != CORRUPTED:
+            for step in directions[1:3]:
+                if cells[cell + step] != CORRUPTED:
+                    join(parent, size, cell, cell + step)
+    if find_root(parent, start) == find_root(parent, end):
+        return BlockingByte(-1, (-1, -1))
+
+    for i in range(len(fallen) - 1, -1, -1):
+        cell = fallen[i]
+        if first_fall.get(cell) != i:
+            continue
+        cells[cell] = OPEN
+        for step in directions:
+            if cells[cell + step] != CORRUPTED:
+                join(parent, size, cell, cell + step)
+        if find_root(parent, start) == find_root(parent, end):
+            return BlockingByte(i, byte_positions[i])
+    return BlockingByte(-1, (-1, -1))
+
+def solution(file_path: str, grid_size: Optional[int] = None) -> str:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+        grid_size (Optional[int], optional): The size of the grid. Defaults to the size inferred from the input.
+
+    Returns:
+        str: The coordinates of the first blocking byte formatted as "x,y".
+    """
     byte_positions = parse_input(file_path)
-    grid_size = 71  # For the actual problem, use 71; for the example, use 7
-    blocking_byte = find_blocking_byte(byte_positions, grid_size)
-    print(f"{blocking_byte[0]},{blocking_byte[1]}")
\ No newline at end of file
+    x, y = find_blocking_byte(byte_positions, grid_size or infer_grid_size(byte_positions)).position
+    return f"{x},{y}"
+
+if __name__ == "__main__":
+    print(solution(INPUT_FILE))
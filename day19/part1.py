@@ -1,4 +1,21 @@
-from typing import List, Tuple
+from collections import OrderedDict, namedtuple
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from aoc.instrument import hot
+from aoc.parallel import parallel_map
+from . import INPUT_FILE
+
+# A trie of the towel patterns: node 0 is the root, children[node] maps a color to the next node,
+# and terminal[node] is 1 where a pattern ends
+PatternIndex = namedtuple('PatternIndex', ['children', 'terminal'])
+
+# Default number of suffix counts kept across designs by count_arrangements
+SUFFIX_CACHE_SIZE = 1 << 16
+
+# Suffixes are cached by their polynomial hash modulo a Mersenne prime, together with their length;
+# two suffixes of the same length share an entry only if their hashes collide
+HASH_BASE, HASH_BITS = 131, 61
+HASH_MODULUS = (1 << HASH_BITS) - 1
 
 def parse_input(file_path: str) -> Tuple[List[str], List[str]]:
     """
@@ -19,41 +36,155 @@ def parse_input(file_path: str) -> Tuple[List[str], List[str]]:
     
     return towel_patterns, desired_designs
 
-def can_construct_design(design: str, towel_patterns: List[str]) -> bool:
+def build_pattern_index(towel_patterns: List[str]) -> PatternIndex:
+    """
+    Builds a trie of the towel patterns, so every pattern starting at a position is found in one walk.
+
+    Args:
+        towel_patterns (List[str]): The available towel patterns.
+
+    Returns:
+        PatternIndex: The trie.
+    """
+    children: List[Dict[str, int]] = [{}]
+    terminal = bytearray(1)
+    for pattern in towel_patterns:
+        node = 0
+        for color in pattern:
+            if color not in children[node]:
+                children[node][color] = len(children)
+                children.append({})
+                terminal.append(0)
+            node = children[node][color]
+        terminal[node] = 1
+    return PatternIndex(children, terminal)
+
+def suffix_hashes(design: str) -> List[int]:
+    """
+    Computes a polynomial hash of every suffix of a design, from the end backward in linear time.
+
+    Args:
+        design (str): The design.
+
+    Returns:
+        List[int]: The hash of design[len(design) - k:] at index k - 1, shortest suffix first.
+    """
+    hashes, h = [], 0
+    for color in reversed(design.encode()):
+        h = (h * HASH_BASE + color) % HASH_MODULUS
+        hashes.append(h)
+    return hashes
+
+@hot
+def count_arrangements(design: str, index: PatternIndex, cache: Optional[OrderedDict] = None,
+                       cache_size: int = SUFFIX_CACHE_SIZE) -> int:
     """
-    Determines if a given design can be constructed using a list of towel patterns.
+    Counts the ways to arrange towel patterns into a design; the design is possible if there is at least one.
+
+    ways[i] is the number of ways to build the colors from position i on. Walking the trie from
+    i finds all patterns that fit there. Without a cache, ways is filled in for every position.
+    With a cache, the count of every suffix is remembered across calls, keyed by its hash and
+    length, least recently used first out; whole designs are also kept under the design itself.
+    Only the positions reachable from the start whose suffix is not cached are walked, so a
+    repeated design costs one lookup and a design sharing a long suffix with an earlier one
+    stops where the shared part begins.
+
+    Under parallel_map every chunk of designs gets its own pickled copy of the cache, so suffixes
+    are only shared between designs in the same chunk.
+
     Args:
         design (str): The design string that needs to be constructed.
-        towel_patterns (List[str]): A list of towel patterns available for constructing the design.
+        index (PatternIndex): The towel patterns, from build_pattern_index.
+        cache (Optional[OrderedDict], optional): Suffix counts shared between calls with the same index;
+            updated in place. Defaults to no caching.
+        cache_size (int, optional): The number of suffixes the cache keeps. Defaults to SUFFIX_CACHE_SIZE.
+
     Returns:
-        bool: True if the design can be constructed using the towel patterns, False otherwise.
+        int: The number of ways to construct the design.
     """
+    children, terminal = index.children, index.terminal
     n = len(design)
-    dp = [False] * (n + 1)
-    dp[0] = True
-    
-    for i in range(1, n + 1):
-        for pattern in towel_patterns:
-            if i >= len(pattern) and design[i - len(pattern):i] == pattern:
-                dp[i] = dp[i] or dp[i - len(pattern)]
-    
-    return dp[n]
+    if cache is None:
+        ways = [0] * (n + 1)
+        ways[n] = 1
+        for i in range(n - 1, -1, -1):
+            count, node = 0, 0
+            for j in range(i, n):
+                node = children[node].get(design[j])
+                if node is None:
+                    break
+                if terminal[node]:
+                    count += ways[j + 1]
+            ways[i] = count
+        return ways[0]
+
+    count = cache.get(design)
+    if count is not None:
+        cache.move_to_end(design)
+        return count
+    hashes = suffix_hashes(design)
+    get, move_to_end = cache.get, cache.move_to_end
+    ways = [None] * (n + 1)
+    ways[n] = 1
+    # The positions a pattern ends after, for every reachable position whose suffix is not cached
+    ends: Dict[int, List[int]] = {}
+    reachable = bytearray(n + 1)
+    reachable[0] = 1
+    for i in range(n):
+        if not reachable[i]:
+            continue
+        # A suffix is keyed by its hash and, in the bits above it, its length
+        key = hashes[n - i - 1] | (n - i) << HASH_BITS
+        count = get(key)
+        if count is not None:
+            move_to_end(key)
+            ways[i] = count
+            continue
+        ends[i] = found = []
+        node = 0
+        for j in range(i, n):
+            node = children[node].get(design[j])
+            if node is None:
+                break
+            if terminal[node]:
+                found.append(j + 1)
+                reachable[j + 1] = 1
+    for i in reversed(ends):
+        ways[i] = cache[hashes[n - i - 1] | (n - i) << HASH_BITS] = sum(map(ways.__getitem__, ends[i]))
+    cache[design] = ways[0]
+    while len(cache) > cache_size:
+        cache.popitem(last=False)
+    return ways[0]
 
-def count_possible_designs(towel_patterns: List[str], desired_designs: List[str]) -> int:
+def count_possible_designs(towel_patterns: List[str], desired_designs: List[str], share_suffixes: bool = False) -> int:
     """
     Counts the number of desired designs that can be constructed using the given towel patterns.
 
     Args:
         towel_patterns (List[str]): A list of strings representing available towel patterns.
         desired_designs (List[str]): A list of strings representing the desired designs to be constructed.
+        share_suffixes (bool, optional): True to remember suffix counts across designs, which pays off
+            when designs are long and share suffixes. Defaults to False.
 
     Returns:
         int: The number of desired designs that can be constructed using the given towel patterns.
     """
-    return sum(can_construct_design(design, towel_patterns) for design in desired_designs)
+    cache = OrderedDict() if share_suffixes else None
+    counts = parallel_map(partial(count_arrangements, index=build_pattern_index(towel_patterns), cache=cache), desired_designs)
+    return sum(count > 0 for count in counts)
 
-if __name__ == "__main__":
-    file_path = 'input.txt'
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The number of designs that can be constructed.
+    """
     towel_patterns, desired_designs = parse_input(file_path)
-    result = count_possible_designs(towel_patterns, desired_designs)
-    print(result)
+    return count_possible_designs(towel_patterns, desired_designs)
+
+if __name__ == "__main__":
+    print(solution(INPUT_FILE))
@@ -1,107 +1,120 @@
-from typing import List, Tuple
-from collections import deque
-from tqdm import tqdm
+from array import array
+from typing import Tuple
+from aoc.grid import Grid
+from aoc.instrument import hot
+from . import INPUT_FILE
 
-def parse_input(file_path: str) -> List[List[str]]:
+WALL, TRACK = ord('#'), ord('.')
+
+def parse_input(file_path: str) -> Grid:
     """
-    Reads a file and parses its contents into a list of lists of strings.
+    Reads a file and parses its contents into a grid.
 
     Args:
         file_path (str): The path to the input file.
 
     Returns:
-        List[List[str]]: A list of lists, where each inner list represents a line from the file,
-                         with each character in the line as an element of the inner list.
+        Grid: The racetrack.
     """
-    with open(file_path, 'r') as file:
-        return [list(line.strip()) for line in file.readlines()]
+    return Grid.from_file(file_path)
 
-def find_positions(racetrack: List[List[str]]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+def find_positions(racetrack: Grid) -> Tuple[int, int]:
     """
     Finds the positions of the start ('S') and end ('E') points in a racetrack.
 
     Args:
-        racetrack (List[List[str]]): A 2D list representing the racetrack where each cell is a string.
+        racetrack (Grid): The racetrack.
 
     Returns:
-        Tuple[Tuple[int, int], Tuple[int, int]]: A tuple containing the coordinates of the start and end points.
-            The first element is the coordinates of the start point (i, j) and the second element is the coordinates
-            of the end point (i, j). If either the start or end point is not found, their respective value will be None.
+        Tuple[int, int]: The flat indices of the start and end points. If either point is not
+            found, its value will be -1.
     """
-    start = end = None
-    for i, row in enumerate(racetrack):
-        for j, cell in enumerate(row):
-            if cell == 'S':
-                start = (i, j)
-            elif cell == 'E':
-                end = (i, j)
-    return start, end
-
-def bfs(racetrack: List[List[str]], start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[int, int]]:
+    return racetrack.find('S'), racetrack.find('E')
+
+@hot
+def distance_field(racetrack: Grid, source: int) -> array:
     """
-    Perform a breadth-first search (BFS) on a racetrack to find the shortest path from start to end.
+    Computes the number of steps from a position to every reachable cell of the racetrack.
+
     Args:
-        racetrack (List[List[str]]): A 2D grid representing the racetrack where '#' represents obstacles and '.' represents open paths.
-        start (Tuple[int, int]): The starting coordinates (x, y) on the racetrack.
-        end (Tuple[int, int]): The ending coordinates (x, y) on the racetrack.
+        racetrack (Grid): The racetrack, where '#' represents walls.
+        source (int): The flat index to measure from.
+
     Returns:
-        List[Tuple[int, int]]: A list of coordinates representing the shortest path from start to end. 
-                               Returns an empty list if no path is found.
+        array: The distance of every cell, indexed by flat index; -1 for walls and unreachable cells.
     """
-    rows, cols = len(racetrack), len(racetrack[0])
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    queue = deque([(start, [])])
-    visited = set([start])
-    
-    while queue:
-        (x, y), path = queue.popleft()
-        if (x, y) == end:
-            return path + [(x, y)]
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < rows and 0 <= ny < cols and racetrack[nx][ny] != '#' and (nx, ny) not in visited:
-                visited.add((nx, ny))
-                queue.append(((nx, ny), path + [(x, y)]))
-    return []
-
-def count_cheats(racetrack: List[List[str]], start: Tuple[int, int], end: Tuple[int, int], min_save: int) -> int:
+    cells, border, directions = racetrack.cells, racetrack.border, racetrack.directions
+    dist = array('i', [-1]) * len(cells)
+    dist[source] = 0
+    frontier, steps = [source], 0
+    while frontier:
+        steps += 1
+        reached = []
+        for pos in frontier:
+            for step in directions:
+                new_pos = pos + step
+                cell = cells[new_pos]
+                if cell != WALL and cell != border and dist[new_pos] < 0:
+                    dist[new_pos] = steps
+                    reached.append(new_pos)
+        frontier = reached
+    return dist
+
+def count_cheats(racetrack: Grid, start: int, end: int, min_save: int) -> int:
     """
     Counts the number of positions on the racetrack where changing a wall ('#') to an open path ('.') 
     results in a time save of at least `min_save` steps from the start to the end position.
+
+    Opening a wall only adds routes that step through it, so the new race time is the fastest
+    way to one of its neighbors, two steps through the wall, and the fastest way from another
+    neighbor to the end. With the distances from the start and to the end computed once, each
+    wall next to a reachable cell is evaluated without searching again.
+
     Args:
-        racetrack (List[List[str]]): A 2D list representing the racetrack grid where '#' represents walls and '.' represents open paths.
-        start (Tuple[int, int]): The starting position on the racetrack as a tuple of (row, column).
-        end (Tuple[int, int]): The ending position on the racetrack as a tuple of (row, column).
+        racetrack (Grid): The racetrack grid where '#' represents walls and '.' represents open paths.
+        start (int): The flat index of the starting position.
+        end (int): The flat index of the ending position.
         min_save (int): The minimum number of steps that must be saved to consider a position as a cheat.
     Returns:
         int: The number of positions that can be considered cheats based on the given criteria.
     """
-    rows, cols = len(racetrack), len(racetrack[0])
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    cheats = set()
-    tried_positions = set()
-    
-    original_path = bfs(racetrack, start, end)
-    original_path_length = len(original_path)
-    
-    for (i, j) in tqdm(original_path, desc="Path"):
-        for dx, dy in directions:
-            nx, ny = i + dx, j + dy
-            if 0 <= nx < rows and 0 <= ny < cols and racetrack[nx][ny] == '#' and (nx, ny) not in tried_positions:
-                tried_positions.add((nx, ny))
-                racetrack[nx][ny] = '.'
-                new_path = bfs(racetrack, start, end)
-                racetrack[nx][ny] = '#'
-                new_path_length = len(new_path)
-                time_saved = original_path_length - new_path_length
+    cells, directions = racetrack.cells, racetrack.directions
+    from_start = distance_field(racetrack, start)
+    to_end = distance_field(racetrack, end)
+    best = from_start[end]
+    if best < 0:
+        return 0
+    cheats = 0
+    tried_positions = bytearray(len(cells))
+
+    for pos in range(len(cells)):
+        if from_start[pos] < 0:
+            continue
+        for step in directions:
+            wall = pos + step
+            if cells[wall] == WALL and not tried_positions[wall]:
+                tried_positions[wall] = 1
+                entries = [from_start[wall + s] for s in directions if from_start[wall + s] >= 0]
+                exits = [to_end[wall + s] for s in directions if to_end[wall + s] >= 0]
+                time_saved = max(best - min(entries) - 2 - min(exits), 0)
                 if time_saved >= min_save:
-                    cheats.add((nx, ny))
-    return len(cheats)
+                    cheats += 1
+    return cheats
 
-if __name__ == "__main__":
-    file_path = 'input.txt'
+def solution(file_path: str, min_save: int = 100) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+        min_save (int, optional): The minimum number of picoseconds a cheat must save. Defaults to 100.
+
+    Returns:
+        int: The number of cheats that save at least `min_save` picoseconds.
+    """
     racetrack = parse_input(file_path)
     start, end = find_positions(racetrack)
-    min_save = 100
-    cheats_count = count_cheats(racetrack, start, end, min_save)
-    print(f"Number of cheats that save at least {min_save} picoseconds: {cheats_count}")
+    return count_cheats(racetrack, start, end, min_save)
+
+if __name__ == "__main__":
+    print(f"Number of cheats that save at least 100 picoseconds: {solution(INPUT_FILE)}")
@@ -1,5 +1,15 @@
-import sys
-from typing import List, Tuple
+from collections import namedtuple
+from typing import Iterable, List, Sequence, Tuple
+import numpy as np
+from aoc.grid import Grid
+from aoc.instrument import hot
+from . import INPUT_FILE
+
+# Number of pair distances computed at once by pair_savings
+BLOCK_ELEMENTS = 1 << 22
+
+# at_least[i][s] is the number of cheats of at most max_dists[i] picoseconds that save at least s
+CheatHistogram = namedtuple('CheatHistogram', ['max_dists', 'at_least'])
 
 def parse_track(file_path: str) -> List[Tuple[int, int]]:
     """
@@ -7,44 +17,203 @@ def parse_track(file_path: str) -> List[Tuple[int, int]]:
     Args:
         file_path (str): The path to the file containing the track grid.
     Returns:
-        List[Tuple[int, int]]: A list of tuples representing the coordinates of the path from the start to the end.
+        List[Tuple[int, int]]: A list of tuples representing the (x, y) coordinates of the path from the start to the end.
+    """
+    grid = Grid.from_file(file_path, border='#')
+    cells = grid.cells
+    wall, end = ord('#'), grid.find('E')
+
+    previous, pos = -1, grid.find('S')
+    positions = [pos]
+    while pos != end:
+        previous, pos = pos, next(new_pos for new_pos in (pos + step for step in grid.directions)
+                                  if new_pos != previous and cells[new_pos] != wall)
+        positions.append(pos)
+
+    return [(x, y) for y, x in map(grid.coords, positions)]
+
+def track_arrays(track: List[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts a track into coordinate arrays, shifted so the smallest coordinates are 0.
+
+    Args:
+        track (List[Tuple[int, int]]): The (x, y) coordinates of the track, as returned by parse_track.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The x and y coordinates as int32 arrays, indexed by time.
+    """
+    xs, ys = (np.array(coords, dtype=np.int32) for coords in zip(*track))
+    return xs - xs.min(), ys - ys.min()
+
+def diamond_offsets(max_dist: int, rows: int, cols: int) -> List[Tuple[int, int, int]]:
+    """
+    Lists the nonzero offsets within a Manhattan distance that fit in a grid.
+
+    Args:
+        max_dist (int): The maximum Manhattan distance.
+        rows (int): The number of rows of the grid.
+        cols (int): The number of columns of the grid.
+
+    Returns:
+        List[Tuple[int, int, int]]: The row offset, column offset and distance of every offset.
+    """
+    offsets = []
+    for dy in range(-min(max_dist, rows - 1), min(max_dist, rows - 1) + 1):
+        reach = min(max_dist - abs(dy), cols - 1)
+        offsets += [(dy, dx, abs(dy) + abs(dx)) for dx in range(-reach, reach + 1) if dy or dx]
+    return offsets
+
+def offset_savings(xs: np.ndarray, ys: np.ndarray, offsets: List[Tuple[int, int, int]], max_dists: Sequence[int]) -> np.ndarray:
+    """
+    Counts cheats by shifting a grid of track times by every cheat offset.
+
+    Comparing the grid with a copy of itself shifted by (dy, dx) scores every cheat with that
+    offset at once, so the cost grows with the grid area times the number of offsets.
+
+    Args:
+        xs (np.ndarray): The x coordinates of the track, from track_arrays.
+        ys (np.ndarray): The y coordinates of the track, from track_arrays.
+        offsets (List[Tuple[int, int, int]]): The cheat offsets, from diamond_offsets.
+        max_dists (Sequence[int]): The cheat durations to group by, in increasing order.
+
+    Returns:
+        np.ndarray: Row i counts the cheats longer than max_dists[i - 1] and at most max_dists[i]
+            picoseconds by the time they save.
+    """
+    times = np.full((ys.max() + 1, xs.max() + 1), -1, dtype=np.int32)
+    times[ys, xs] = np.arange(len(xs), dtype=np.int32)
+    rows, cols = times.shape
+    histogram = np.zeros((len(max_dists), len(xs)), dtype=np.int64)
+    bands = np.searchsorted(max_dists, [dist for _, _, dist in offsets])
+    for (dy, dx, dist), band in zip(offsets, bands):
+        src = times[max(-dy, 0):rows - max(dy, 0), max(-dx, 0):cols - max(dx, 0)]
+        dst = times[max(dy, 0):rows - max(-dy, 0), max(dx, 0):cols - max(-dx, 0)]
+        saved = dst - src - dist
+        # Off-track cells hold -1, so the saving is only meaningful where both ends are on the track
+        saved = saved[(src >= 0) & (dst >= 0) & (saved > 0)]
+        histogram[band] += np.bincount(saved, minlength=len(xs))
+    return histogram
+
+def pair_savings(xs: np.ndarray, ys: np.ndarray, max_dists: Sequence[int]) -> np.ndarray:
+    """
+    Counts cheats by comparing every pair of track positions, a block of start times at a time.
+
+    The cost grows with the square of the track length, independent of the cheat durations.
+
+    Args:
+        xs (np.ndarray): The x coordinates of the track, from track_arrays.
+        ys (np.ndarray): The y coordinates of the track, from track_arrays.
+        max_dists (Sequence[int]): The cheat durations to group by, in increasing order.
+
+    Returns:
+        np.ndarray: Row i counts the cheats longer than max_dists[i - 1] and at most max_dists[i]
+            picoseconds by the time they save.
+    """
+    n = len(xs)
+    times = np.arange(n, dtype=np.int32)
+    histogram = np.zeros(len(max_dists) * n, dtype=np.int64)
+    block = max(BLOCK_ELEMENTS // n, 1)
+    for lo in range(0, n, block):
+        hi = min(lo + block, n)
+        # Only pairs ending later than they start can save time, so the ends start at lo
+        dist = np.abs(xs[lo:, None] - xs[None, lo:hi]) + np.abs(ys[lo:, None] - ys[None, lo:hi])
+        saved = times[lo:, None] - times[None, lo:hi] - dist
+        mask = (dist <= max_dists[-1]) & (saved > 0)
+        bands = np.searchsorted(max_dists, dist[mask])
+        histogram += np.bincount(bands * n + saved[mask], minlength=len(histogram))
+    return histogram.reshape(len(max_dists), n)
+
+@hot
+def band_savings(track: List[Tuple[int, int]], max_dists: Sequence[int]) -> np.ndarray:
+    """
+    Counts the cheats of every duration band by the time they save, in one sweep.
+
+    Short cheats are counted by shifting a grid of track times, long ones by comparing position
+    pairs, whichever touches fewer elements.
+
+    Args:
+        track (List[Tuple[int, int]]): The (x, y) coordinates of the track, as returned by parse_track.
+        max_dists (Sequence[int]): The cheat durations to group by, in increasing order.
+
+    Returns:
+        np.ndarray: Row i counts the cheats longer than max_dists[i - 1] and at most max_dists[i]
+            picoseconds by the time they save.
+    """
+    xs, ys = track_arrays(track)
+    offsets = diamond_offsets(max_dists[-1], ys.max() + 1, xs.max() + 1)
+    if len(offsets) * (ys.max() + 1) * (xs.max() + 1) <= len(xs) * (len(xs) + 1) // 2:
+        return offset_savings(xs, ys, offsets, max_dists)
+    return pair_savings(xs, ys, max_dists)
+
+def savings_histogram(track: List[Tuple[int, int]], max_dist: int) -> np.ndarray:
+    """
+    Counts the cheats of at most `max_dist` picoseconds by the time they save.
+
+    A cheat goes from one track position to a later one at most `max_dist` apart (Manhattan
+    distance) and saves the difference between their times minus that distance.
+
+    Args:
+        track (List[Tuple[int, int]]): The (x, y) coordinates of the track, as returned by parse_track.
+        max_dist (int): The maximum duration of a cheat.
+
+    Returns:
+        np.ndarray: The number of cheats saving each number of picoseconds, indexed by the saving.
+    """
+    return band_savings(track, [max_dist])[0]
+
+def cheat_histogram(track: List[Tuple[int, int]], max_dists: Iterable[int]) -> CheatHistogram:
+    """
+    Builds cumulative savings histograms for several cheat durations in one sweep.
+
+    Every cheat is counted once, in the band of the shortest requested duration that allows it;
+    summing the bands and then the savings from the top makes each (min_save, max_dist) query a lookup.
+
+    Args:
+        track (List[Tuple[int, int]]): The (x, y) coordinates of the track, as returned by parse_track.
+        max_dists (Iterable[int]): The maximum cheat durations to answer queries for.
+
+    Returns:
+        CheatHistogram: The durations, sorted, and the cumulative histogram of each.
+    """
+    max_dists = sorted(set(max_dists))
+    counts = np.cumsum(band_savings(track, max_dists), axis=0)
+    at_least = np.zeros((len(max_dists), counts.shape[1] + 1), dtype=np.int64)
+    at_least[:, :-1] = counts[:, ::-1].cumsum(axis=1)[:, ::-1]
+    return CheatHistogram(max_dists, at_least)
+
+def count_cheats(histogram: CheatHistogram, min_save: int, max_dist: int) -> int:
+    """
+    Looks up the number of cheats of at most `max_dist` picoseconds that save at least `min_save`.
+
+    Args:
+        histogram (CheatHistogram): The histograms from cheat_histogram.
+        min_save (int): The minimum number of picoseconds a cheat must save.
+        max_dist (int): The maximum duration of a cheat; one of the durations the histogram was built for.
+
+    Returns:
+        int: The number of cheats.
+
+    Raises:
+        ValueError: If the histogram was not built for `max_dist`.
     """
-    with open(file_path, 'r') as f:
-        grid = [line.rstrip() for line in f]
-    
-    start_pos = next((x, y) for y, row in enumerate(grid) for x, cell in enumerate(row) if cell == 'S')
-    track = [None, start_pos]
-    x, y = start_pos
-    
-    while grid[y][x] != 'E':
-        next_pos = next((nx, ny) for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
-                        if (nx, ny) != track[-2] and grid[ny][nx] != '#')
-        track.append(next_pos)
-        x, y = next_pos
-    
-    return track[1:]
+    if max_dist not in histogram.max_dists:
+        raise ValueError(f'No histogram for cheats of up to {max_dist} picoseconds')
+    at_least = histogram.at_least[histogram.max_dists.index(max_dist)]
+    return int(at_least[min(max(min_save, 0), len(at_least) - 1)])
 
-def cheats(track: List[Tuple[int, int]], max_dist: int) -> List[int]:
+def solution(file_path: str, min_save: int = 100, max_dist: int = 20) -> int:
     """
-    Identifies potential cheating instances in a race track based on the given maximum distance.
+    Solves part 2 for the given input file.
 
     Args:
-        track (List[Tuple[int, int]]): A list of tuples representing the coordinates (x, y) of each checkpoint on the track.
-        max_dist (int): The maximum allowable distance between two checkpoints to consider it as a valid move.
+        file_path (str): The path to the input file.
+        min_save (int, optional): The minimum number of picoseconds a cheat must save. Defaults to 100.
+        max_dist (int, optional): The maximum duration of a cheat. Defaults to 20.
 
     Returns:
-        List[int]: A list of integers representing the difference between the time indices of the checkpoints where cheating is detected.
+        int: The number of cheats that save at least `min_save` picoseconds.
     """
-    results = []
-    for t1, (x1, y1) in enumerate(track):
-        for t2 in range(t1 + 3, len(track)):
-            x2, y2 = track[t2]
-            dist = abs(x2 - x1) + abs(y2 - y1)
-            if dist <= max_dist and t2 - t1 > dist:
-                results.append(t2 - t1 - dist)
-    return results
+    return count_cheats(cheat_histogram(parse_track(file_path), [max_dist]), min_save, max_dist)
 
 if __name__ == "__main__":
-    track = parse_track('input.txt')
-    result = sum(saved >= 100 for saved in cheats(track, 20))
-    print(result)
\ No newline at end of file
+    print(solution(INPUT_FILE))
@@ -1,5 +1,6 @@
-import functools
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
+from aoc.instrument import hot
+from . import INPUT_FILE
 
 # Define the number pad and the direction pad
 number_pad = [
@@ -14,6 +15,8 @@ direction_pad = [
     "<v>"
 ]
 
+DIRECTION_KEYS = '^A<v>'
+
 def parse_input(file_path: str) -> List[Tuple[str, int]]:
     """
     Parses the input file and returns a list of tuples.
@@ -47,6 +50,7 @@ def find_position(pad: List[str], char: str) -> Optional[Tuple[int, int]]:
                 return x, y
     return None
 
+@hot
 def generate_path(pad: List[str], from_char: str, to_char: str) -> str:
     """
     Generate the shortest path from `from_char` to `to_char` in the given pad.
@@ -89,25 +93,80 @@ def generate_path(pad: List[str], from_char: str, to_char: str) -> str:
     # Return the shortest path based on the number of direction changes
     return min(move(from_x, from_y, ""), key=lambda p: sum(a != b for a, b in zip(p, p[1:])))
 
-@functools.lru_cache(None)
-def solve(sequence: str, level: int, max_level: int = 2) -> int:
+@hot
+def direction_costs(depth: int) -> Dict[Tuple[str, str], int]:
+    """
+    Computes how many presses it takes to make the robot on the top direction pad move from one key to another and press it.
+
+    With no robots in between, every key costs the person one press. Each robot added below
+    turns a move into its path on the direction pad, ending with 'A', and starting from 'A'
+    as every path ends there; so each level of the table is a sum over the previous level.
+
+    Args:
+        depth (int): The number of robot-operated direction pads between the person and the top pad.
+
+    Returns:
+        Dict[Tuple[str, str], int]: The cost of every (from_key, to_key) pair of direction pad keys.
+    """
+    steps = {}
+    for from_key in DIRECTION_KEYS:
+        for to_key in DIRECTION_KEYS:
+            path = generate_path(direction_pad, from_key, to_key)
+            steps[from_key, to_key] = list(zip('A' + path, path))
+    costs = dict.fromkeys(steps, 1)
+    for _ in range(depth):
+        costs = {pair: sum(costs[step] for step in pair_steps) for pair, pair_steps in steps.items()}
+    return costs
+
+def solve_many(codes: Iterable[str], depth: int) -> List[int]:
     """
-    Solve the problem recursively.
+    Counts the presses needed to type each of several codes through a chain of direction pads.
+
+    The direction pad cost table is built once for the whole batch.
 
     Args:
-        sequence (str): The input sequence to process.
-        level (int): The current recursion level.
-        max_level (int, optional): The maximum recursion depth. Defaults to 2.
+        codes (Iterable[str]): The codes to type on the number pad.
+        depth (int): The number of robot-operated direction pads between the person and the number pad robot.
+
+    Returns:
+        List[int]: The number of presses for every code, in the order given.
+    """
+    costs = direction_costs(depth)
+    presses = []
+    for code in codes:
+        total = 0
+        for from_char, to_char in zip('A' + code, code):
+            path = generate_path(number_pad, from_char, to_char)
+            total += sum(costs[step] for step in zip('A' + path, path))
+        presses.append(total)
+    return presses
+
+def solve(sequence: str, depth: int = 2) -> int:
+    """
+    Counts the presses needed to type a code through a chain of direction pads.
+
+    Args:
+        sequence (str): The code to type on the number pad.
+        depth (int, optional): The number of robot-operated direction pads. Defaults to 2.
+
+    Returns:
+        int: The number of presses.
+    """
+    return solve_many([sequence], depth)[0]
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 1 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
 
     Returns:
-        int: The result of the recursive computation.
+        int: The sum of the complexities of the codes with two robot keypads.
     """
-    if level > max_level:
-        return len(sequence)
-    pad = direction_pad if level else number_pad
-    return sum(solve(generate_path(pad, from_char, to_char), level + 1, max_level) for from_char, to_char in zip('A' + sequence, sequence))
+    input_data = parse_input(file_path)
+    presses = solve_many([sequence for sequence, _ in input_data], 2)
+    return sum(count * multiplier for count, (_, multiplier) in zip(presses, input_data))
 
 if __name__ == "__main__":
-    input_data = parse_input('input.txt')
-    result = sum(solve(sequence, 0) * multiplier for sequence, multiplier in input_data)
-    print(result)
\ No newline at end of file
+    print(solution(INPUT_FILE))
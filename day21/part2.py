@@ -1,6 +1,19 @@
-from part1 import parse_input, solve
+from .part1 import parse_input, solve_many
+from . import INPUT_FILE
+
+def solution(file_path: str) -> int:
+    """
+    Solves part 2 for the given input file.
+
+    Args:
+        file_path (str): The path to the input file.
+
+    Returns:
+        int: The sum of the complexities of the codes with 25 robot keypads.
+    """
+    input_data = parse_input(file_path)
+    presses = solve_many([sequence for sequence, _ in input_data], 25)
+    return sum(count * multiplier for count, (_, multiplier) in zip(presses, input_data))
 
 if __name__ == "__main__":
-    input_data = parse_input('input.txt')
-    result = sum(solve(sequence, 0, 25) * multiplier for sequence, multiplier in input_data)
-    print(result)
\ No newline at end of file
+    print(solution(INPUT_FILE))
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PART = '''
+from aoc.cache import cached_parser, encode_int_records, decode_int_records
+
+@cached_parser(1, encode_int_records, decode_int_records)
+def parse_input(file_path):
+    with open(file_path) as f:
+        return [(int(line) + {offset},) for line in f]
+
+if __name__ == "__main__":
+    import sys
+    print(sum(value for value, in parse_input(sys.argv[1])))
+'''
+
+class CachedParserTest(unittest.TestCase):
+    def test_parsers_run_as_main_do_not_share_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'day99'))
+            open(os.path.join(tmp, 'day99', '__init__.py'), 'w').close()
+            for part, offset in (('part1', 0), ('part2', 1000)):
+                with open(os.path.join(tmp, 'day99', f'{part}.py'), 'w') as f:
+                    f.write(textwrap.dedent(PART.format(offset=offset)))
+            input_file = os.path.join(tmp, 'input.txt')
+            with open(input_file, 'w') as f:
+                f.write('1\n2\n3')
+            env = dict(os.environ, AOC_CACHE='1', AOC_CACHE_DIR=os.path.join(tmp, 'cache'),
+                       PYTHONPATH=os.pathsep.join([tmp, ROOT]))
+
+            def run(part):
+                result = subprocess.run([sys.executable, '-m', f'day99.{part}', input_file], env=env, cwd=tmp,
+                                        capture_output=True, text=True, check=True)
+                return int(result.stdout)
+
+            # Each order, so that both parts start once from the other's cached entry
+            self.assertEqual((run('part1'), run('part2')), (6, 3006))
+            self.assertEqual((run('part2'), run('part1')), (3006, 6))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,13 @@
+import unittest
+
+from aoc.generators import generated_input
+from day17 import part2 as day17_part2
+
+class GeneratorTest(unittest.TestCase):
+    def test_day17_programs_can_print_themselves(self):
+        for seed in range(8):
+            with self.subTest(seed=seed):
+                self.assertIsNotNone(day17_part2.solution(generated_input(17, seed=seed)))
+
+if __name__ == '__main__':
+    unittest.main()